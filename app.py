@@ -14,7 +14,7 @@ import webbrowser
 import argparse
 import socket
 from datetime import datetime
-from scraper import extrair_todas_noticias
+from scraper import extrair_todas_noticias, adicionar_argumentos_configuracao, aplicar_argumentos_configuracao, fontes_vencidas, agendar_coletas
 
 # Variável global para armazenar o app Flask
 flask_app = None
@@ -86,17 +86,20 @@ def executar_servidor_web(porta=5000, auto_update=False, intervalo=60):
     if auto_update:
         # Iniciar a atualização automática em segundo plano
         threading.Thread(target=lambda: executar_automaticamente(intervalo, False), daemon=True).start()
-        print(f"[+] Atualização automática ativada (a cada {intervalo} segundos)")
+        print(f"[+] Atualização automática ativada (intervalo inicial de {intervalo} segundos, ajustado por fonte)")
     
     # Iniciar o servidor Flask
     flask_app.run(host='0.0.0.0', port=porta, debug=False)
 
 def executar_automaticamente(intervalo=60, abrir_navegador=True):
     """
-    Executa a extração de notícias automaticamente em intervalos regulares
+    Executa a extração de notícias automaticamente, cada fonte no seu próprio intervalo
+    
+    Cada ciclo coleta só as fontes cujo intervalo venceu; o intervalo de cada fonte acompanha
+    a frequência com que ela publica (ver coleta_config em scraper.py).
     
     Args:
-        intervalo: Tempo em segundos entre cada extração (padrão: 60 segundos)
+        intervalo: Intervalo inicial em segundos de cada fonte (padrão: 60 segundos)
         abrir_navegador: Se deve abrir o navegador na primeira execução
     """
     parar_execucao = threading.Event()
@@ -106,8 +109,9 @@ def executar_automaticamente(intervalo=60, abrir_navegador=True):
             hora_atual = datetime.now().strftime("%H:%M:%S")
             print(f"\n[*] Execução automática em {hora_atual}")
             
-            # Executar extração
-            extrair_todas_noticias()
+            # Executar extração das fontes cujo intervalo venceu
+            fontes = fontes_vencidas()
+            extrair_todas_noticias(fontes=fontes)
             
             # Atualizar a página no navegador (apenas na primeira execução)
             if abrir_navegador and not navegador_aberto[0]:
@@ -117,8 +121,8 @@ def executar_automaticamente(intervalo=60, abrir_navegador=True):
                     webbrowser.open('file://' + caminho_absoluto, new=2)
                     navegador_aberto[0] = True
             
-            # Aguardar pelo intervalo ou até que o evento de parada seja acionado
-            parar_execucao.wait(intervalo)
+            # Aguardar até a próxima fonte vencer ou até que o evento de parada seja acionado
+            parar_execucao.wait(agendar_coletas(fontes, intervalo))
     
     # Variável para controlar se o navegador já foi aberto
     navegador_aberto = [False]
@@ -132,7 +136,7 @@ def executar_automaticamente(intervalo=60, abrir_navegador=True):
         # Se estiver rodando como parte do servidor web, apenas retornar
         return
     
-    print(f"\n[+] Modo automático iniciado. Atualizando a cada {intervalo} segundos.")
+    print(f"\n[+] Modo automático iniciado. Intervalo inicial de {intervalo} segundos, ajustado para cada fonte.")
     print("[+] Pressione Ctrl+C para interromper.\n")
     
     try:
@@ -180,8 +184,10 @@ def main():
     parser.add_argument('-i', '--intervalo', type=int, default=60, help='Intervalo em segundos para o modo automático')
     parser.add_argument('-w', '--web', action='store_true', help='Iniciar servidor web para acesso remoto')
     parser.add_argument('-p', '--porta', type=int, default=5000, help='Porta para o servidor web')
+    adicionar_argumentos_configuracao(parser)
     
     args = parser.parse_args()
+    aplicar_argumentos_configuracao(args)
     
     if args.web:
         # Iniciar servidor web com atualização automática se solicitado
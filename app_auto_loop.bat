@@ -14,23 +14,33 @@ REM Copiar arquivos Python para diretorio temporario
 set TEMP_DIR=%TEMP%\MonitorNoticias
 if not exist "%TEMP_DIR%" mkdir "%TEMP_DIR%"
 
-copy /Y "scraper.py" "%TEMP_DIR%\" >nul
-copy /Y "app.py" "%TEMP_DIR%\" >nul
-copy /Y "main.py" "%TEMP_DIR%\" >nul
-
-REM Executar scraper no diretorio temporario (modo rapido otimizado)
+copy /Y "%~dp0scraper.py" "%TEMP_DIR%\" >nul
+copy /Y "%~dp0app.py" "%TEMP_DIR%\" >nul
+copy /Y "%~dp0main.py" "%TEMP_DIR%\" >nul
+copy /Y "%~dp0daemon.py" "%TEMP_DIR%\" >nul
+if exist "%~dp0fontes" xcopy /Y /I /Q "%~dp0fontes" "%TEMP_DIR%\fontes" >nul
+
+REM Monitor residente no diretorio temporario: um unico processo mantem navegadores e
+REM estado entre os ciclos e se reinicia sozinho quando os arquivos copiados mudam
 cd /d "%TEMP_DIR%"
-python scraper.py
+tasklist /FI "IMAGENAME eq python.exe" /FI "WINDOWTITLE eq Monitor Daemon*" 2>nul | find /I "python.exe" >nul
+if errorlevel 1 (
+    echo Iniciando monitor residente...
+    start "Monitor Daemon" python daemon.py --recarregar-ao-alterar
+) else (
+    echo Monitor residente ja esta rodando.
+)
 
-REM Copiar resultados de volta para o diretorio original
-copy /Y "*.json" "\\jgprjfileserver\Research\Economics\Ealmeida\Brasil\News\" >nul
+REM Copiar resultados de volta para o diretorio original (apenas as publicacoes: os arquivos de
+REM estado do monitor, como marcas_dagua.json e estado_*.json, ficam no diretorio temporario)
+copy /Y "noticias_*.json" "\\jgprjfileserver\Research\Economics\Ealmeida\Brasil\News\" >nul
 copy /Y "*.html" "\\jgprjfileserver\Research\Economics\Ealmeida\Brasil\News\" >nul
 
 REM Usar PowerShell para comandos Git (suporta UNC paths)
 powershell -Command "cd '\\jgprjfileserver\Research\Economics\Ealmeida\Brasil\News'; if (git status --porcelain) { $timestamp = Get-Date -Format 'ddd MM/dd/yyyy_HH:mm:ss.ff'; git add .; git commit -m \"Atualizacao automatica $timestamp\"; git push; Write-Host 'Commit realizado com sucesso!' } else { Write-Host 'Nenhuma alteracao detectada.' }"
 
 REM Iniciar servidor web em background se nao estiver rodando
-tasklist /FI "IMAGENAME eq python.exe" /FI "WINDOWTITLE eq Monitor*" 2>nul | find /I "python.exe" >nul
+tasklist /FI "IMAGENAME eq python.exe" /FI "WINDOWTITLE eq Monitor Web Server*" 2>nul | find /I "python.exe" >nul
 if errorlevel 1 (
     echo Iniciando servidor web...
     start "Monitor Web Server" python app.py
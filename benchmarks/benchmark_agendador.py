@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Mede o ciclo com dezenas de fontes sobre o agendador (trabalhadores limitados)
+
+Cada fonte sintética espera uma latência sorteada (como uma fonte real esperando a rede) e
+respeita o prazo da fonte. Para cada número de trabalhadores, mede o primeiro ciclo (fila na
+ordem do registro) e o segundo (fontes mais demoradas primeiro), além do máximo de fontes
+simultâneas observado.
+
+Uso:
+    python benchmarks/benchmark_agendador.py
+    python benchmarks/benchmark_agendador.py -f 50 -w 4 8 16
+"""
+
+import io
+import time
+import random
+import argparse
+import threading
+import contextlib
+
+import pandas as pd
+
+from paginas_gravadas import monitor
+
+def criar_fontes(quantidade, semente):
+    """
+    Fontes sintéticas: a maioria rápida (HTTP) e uma em cada cinco lenta (navegador)
+    """
+    sorteio = random.Random(semente)
+    simultaneas = {'atual': 0, 'maximo': 0}
+    lock = threading.Lock()
+
+    def criar(latencia):
+        def extrair(prazo_fonte):
+            with lock:
+                simultaneas['atual'] += 1
+                simultaneas['maximo'] = max(simultaneas['maximo'], simultaneas['atual'])
+            fim = time.monotonic() + latencia
+            while time.monotonic() < fim and not prazo_fonte.expirado():
+                time.sleep(0.01)
+            with lock:
+                simultaneas['atual'] -= 1
+            return pd.DataFrame([dict.fromkeys(monitor.COLUNAS_NOTICIA, '')])
+        return extrair
+
+    fontes = []
+    for i in range(quantidade):
+        latencia = sorteio.uniform(1.0, 2.0) if i % 5 == 4 else sorteio.uniform(0.1, 0.4)
+        fontes.append((f"fonte{i:02d}", criar(latencia)))
+    return fontes, simultaneas
+
+def medir_ciclo(fontes, prazo):
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        resultados = monitor.executar_fontes_com_prazo(fontes, monitor.Prazo(prazo))
+    return time.perf_counter() - inicio, len(resultados)
+
+def main():
+    parser = argparse.ArgumentParser(description='Ciclo com muitas fontes sobre o agendador')
+    parser.add_argument('-f', '--fontes', type=int, default=40, help='Número de fontes sintéticas')
+    parser.add_argument('-w', '--workers', type=int, nargs='+', default=[4, 8, 16], help='Trabalhadores a comparar')
+    parser.add_argument('--prazo', type=float, default=60, help='Prazo do ciclo (segundos)')
+    args = parser.parse_args()
+
+    print(f"{args.fontes} fontes sintéticas")
+    print(f"{'workers':>7} {'1º ciclo (s)':>13} {'2º ciclo (s)':>13} {'simultâneas':>12} {'fontes':>7}")
+    for workers in args.workers:
+        monitor.configurar_agendador(workers=workers)
+        monitor.duracoes_fontes.clear()
+        fontes, simultaneas = criar_fontes(args.fontes, semente=0)
+        primeiro, _ = medir_ciclo(fontes, args.prazo)
+        segundo, concluidas = medir_ciclo(fontes, args.prazo)
+        print(f"{workers:>7} {primeiro:>13.2f} {segundo:>13.2f} {simultaneas['maximo']:>12} {concluidas:>7}")
+
+if __name__ == "__main__":
+    main()
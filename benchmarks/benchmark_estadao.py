@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Mostra que a extração do Estadão escala linearmente com o número de itens carregados
+
+Gera páginas sintéticas da lista de últimas com N itens (como a página fica depois de vários
+'Carregar mais') e mede registros_soup/registros_selectolax. Para comparação, mede também a
+versão anterior, que fazia find_previous/find_parent a cada item, até --max-antiga.
+
+Dois leiautes: 'blocos' (cada item no seu div, com a data dentro) e 'conteiner' (itens em
+<article> direto no div da lista, sem span.date próprio). No segundo o div mais próximo de
+cada item é o contêiner inteiro, e a versão anterior o percorre a cada item atrás da data:
+o tempo por item (µs/item) cresce com N, enquanto o da passada única fica estável.
+
+Uso:
+    python benchmarks/benchmark_estadao.py
+    python benchmarks/benchmark_estadao.py -n 500 1000 2000 4000 8000
+    python benchmarks/benchmark_estadao.py -l conteiner
+"""
+
+import io
+import os
+import argparse
+import tempfile
+import contextlib
+
+from paginas_gravadas import monitor, medir
+
+CATEGORIAS = ('Economia', 'Política', 'Internacional', 'Esportes', 'Cultura')
+
+LEIAUTES = ('blocos', 'conteiner')
+
+def gerar_pagina(itens, leiaute='blocos'):
+    """
+    Página com 'itens' blocos de categoria + título + data dentro do contêiner da lista
+    
+    No leiaute 'conteiner' os itens não têm div nem span.date próprios: a única data do
+    contêiner é a de atualização da lista, depois de todos os itens.
+    """
+    if leiaute == 'conteiner':
+        itens_lista = []
+        for i in range(itens):
+            categoria = CATEGORIAS[i % len(CATEGORIAS)]
+            itens_lista.append(
+                f'<article>'
+                f'<a data-component-name="lista-ultimas" href="https://www.estadao.com.br/{categoria.lower()}/">{categoria}</a>'
+                f'<a data-component-name="lista-ultimas" href="https://www.estadao.com.br/{categoria.lower()}/noticia-{i}/" '
+                f'title="Notícia {i}"><h3>Notícia {i}</h3></a>'
+                f'<time>18/10/2026, {i % 24}h{i % 60:02d}</time></article>'
+            )
+        return ('<html><body><header><nav>menu</nav></header><main><div class="lista">'
+                + ''.join(itens_lista)
+                + '<span class="date">18/10/2026, 23h59</span></div></main></body></html>')
+    
+    blocos = []
+    for i in range(itens):
+        categoria = CATEGORIAS[i % len(CATEGORIAS)]
+        blocos.append(
+            f'<div class="noticia-single-block">'
+            f'<a data-component-name="lista-ultimas" href="https://www.estadao.com.br/{categoria.lower()}/">{categoria}</a>'
+            f'<a data-component-name="lista-ultimas" href="https://www.estadao.com.br/{categoria.lower()}/noticia-{i}/" '
+            f'title="Notícia {i}"><h3>Notícia {i}</h3></a>'
+            f'<span class="date">18/10/2026, {i % 24}h{i % 60:02d}</span></div>'
+        )
+    return ('<html><body><header><nav>menu</nav></header><main><div class="lista">'
+            + ''.join(blocos)
+            + '<button class="see-more" data-component-name="lista-ultimas">Carregar mais</button></div></main></body></html>')
+
+def registros_antigos(soup):
+    """
+    Versão anterior de registros_soup (find_previous e find_parent a cada item)
+    """
+    registros = []
+    for artigo in soup.find_all('a', attrs={'data-component-name': 'lista-ultimas'}):
+        titulo = artigo.get('title', '').strip()
+        if not titulo:
+            continue
+        categoria = artigo.text.strip()
+        anterior = artigo.find_previous('a', attrs={'data-component-name': 'lista-ultimas'})
+        if categoria and anterior and anterior.text.strip() == categoria:
+            continue
+        data_element = None
+        parent_div = artigo.find_parent('div')
+        if parent_div:
+            data_element = parent_div.find('span', class_='date')
+        if not data_element:
+            next_element = artigo.find_next_sibling()
+            if next_element and next_element.name == 'span' and 'date' in next_element.get('class', []):
+                data_element = next_element
+        registros.append({
+            'titulo': titulo,
+            'link': artigo.get('href', '#'),
+            'categoria': categoria,
+            'datetime': data_element.text.strip() if data_element else ''
+        })
+    return registros
+
+def main():
+    parser = argparse.ArgumentParser(description='Escalabilidade da extração do Estadão')
+    parser.add_argument('-n', '--itens', type=int, nargs='+', default=[250, 500, 1000, 2000, 4000, 8000],
+                        help='Quantidades de itens na página')
+    parser.add_argument('-r', '--repeticoes', type=int, default=3, help='Repetições de cada medição')
+    parser.add_argument('--max-antiga', type=int, default=1000, help='Maior página medida com a versão anterior (quadrática no leiaute conteiner)')
+    parser.add_argument('-l', '--leiautes', nargs='+', choices=LEIAUTES, default=list(LEIAUTES), help='Leiautes da página')
+    args = parser.parse_args()
+    
+    os.chdir(tempfile.mkdtemp(prefix='benchmark_estadao_'))
+    scraper = monitor.EstadaoScraper()
+    backends = [nome for nome in reversed(monitor.BACKENDS_PARSER) if monitor.parser_disponivel(nome)]
+    
+    print(f"{'leiaute':<10} {'itens':>6} {'extração':<16} {'tempo (ms)':>11} {'µs/item':>9} {'registros':>10}")
+    for leiaute, itens in [(leiaute, itens) for leiaute in args.leiautes for itens in args.itens]:
+        html = gerar_pagina(itens, leiaute)
+        # O parsing é medido à parte: aqui só interessa a montagem dos registros
+        soup = monitor.criar_soup(html)
+        medicoes = [('antiga', lambda: registros_antigos(soup))] if itens <= args.max_antiga else []
+        for backend in backends:
+            if backend == 'selectolax':
+                arvore = monitor.criar_arvore_selectolax(html)
+                medicoes.append((backend, lambda arvore=arvore: scraper.registros_selectolax(arvore)))
+            else:
+                arvore = soup if backend == 'html.parser' else monitor.criar_soup(html, backend)
+                medicoes.append((backend, lambda arvore=arvore: scraper.registros_soup(arvore)))
+        
+        referencia = None
+        for nome, funcao in medicoes:
+            with contextlib.redirect_stdout(io.StringIO()):
+                melhor, _, registros = medir(funcao, args.repeticoes)
+            referencia = referencia or registros
+            aviso = '' if registros == referencia else '  (resultado diferente!)'
+            print(f"{leiaute:<10} {itens:>6} {nome:<16} {melhor * 1000:>11.1f} {melhor * 1e6 / itens:>9.1f} {len(registros):>10}{aviso}")
+
+if __name__ == "__main__":
+    main()
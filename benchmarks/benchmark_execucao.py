@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compara os modos de execução 'threads' e 'processos' processando páginas gravadas
+
+Cada fonte analisa suas páginas gravadas com o BeautifulSoup e monta o DataFrame como em
+salvar_noticias (parte CPU do ciclo, sem rede nem navegador). No modo 'threads' as quatro
+fontes disputam o GIL; no modo 'processos' cada uma roda no seu processo e devolve
+registros compactos.
+
+Uso:
+    python benchmarks/benchmark_execucao.py --gravar      # grava as páginas (requer rede/Edge)
+    python benchmarks/benchmark_execucao.py -r 5          # executa o benchmark
+"""
+
+import os
+import argparse
+import tempfile
+import concurrent.futures
+import pandas as pd
+
+from paginas_gravadas import monitor, gravar_paginas, carregar_gravacao, ler_pagina, criar_scraper_isolado, medir
+
+def processar_fonte(chave, data, caminhos):
+    """
+    Analisa as páginas gravadas de uma fonte e devolve registros compactos
+    """
+    scraper = criar_scraper_isolado(chave, data)
+    for caminho in caminhos:
+        scraper.extrair_noticias(ler_pagina(caminho))
+    
+    df = pd.DataFrame(scraper.noticias, columns=monitor.COLUNAS_NOTICIA)
+    df = df.drop_duplicates(subset=['titulo'])
+    df['data_hora'] = pd.to_datetime(df['data'] + ' ' + df['hora'], format='%d/%m/%Y %H:%M', errors='coerce')
+    df = df.sort_values(by='data_hora', ascending=False).drop('data_hora', axis=1)
+    return list(df.itertuples(index=False, name=None))
+
+def executar_com(executor, data, paginas):
+    futuros = [executor.submit(processar_fonte, chave, data, caminhos) for chave, caminhos in paginas.items()]
+    return sum(len(futuro.result()) for futuro in futuros)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dos modos de execução (threads x processos)')
+    parser.add_argument('--gravar', action='store_true', help='Gravar páginas reais antes de medir')
+    parser.add_argument('-r', '--repeticoes', type=int, default=5, help='Repetições de cada modo')
+    args = parser.parse_args()
+    
+    if args.gravar:
+        gravar_paginas()
+    
+    data, paginas = carregar_gravacao()
+    # Arquivos auxiliares dos scrapers (registro de vistos, marcas) ficam fora do projeto
+    os.chdir(tempfile.mkdtemp(prefix='benchmark_execucao_'))
+    print(f"Páginas gravadas em {data}: " + ", ".join(f"{chave}={len(c)}" for chave, c in paginas.items()))
+    
+    resultados = []
+    
+    # Uma execução sequencial como referência
+    melhor, media, itens = medir(lambda: sum(len(processar_fonte(chave, data, c)) for chave, c in paginas.items()), args.repeticoes)
+    resultados.append(('sequencial', melhor, media, itens))
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(paginas)) as executor:
+        melhor, media, itens = medir(lambda: executar_com(executor, data, paginas), args.repeticoes)
+    resultados.append(('threads', melhor, media, itens))
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(paginas)) as executor:
+        # Primeira rodada só para iniciar os processos (custo pago uma vez no modo residente)
+        executar_com(executor, data, paginas)
+        melhor, media, itens = medir(lambda: executar_com(executor, data, paginas), args.repeticoes)
+    resultados.append(('processos', melhor, media, itens))
+    
+    print(f"\n{'modo':<12} {'melhor (s)':>10} {'média (s)':>10} {'notícias':>9}")
+    for modo, melhor, media, itens in resultados:
+        print(f"{modo:<12} {melhor:>10.3f} {media:>10.3f} {itens:>9}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Mede a vazão de parsing de cada backend (html.parser, lxml, selectolax) por fonte
+
+Para cada página gravada mede o tempo de extrair_registros_html (parsing do HTML e montagem
+dos registros), que é a parte do ciclo que depende do backend, analisando a página inteira e
+apenas o escopo do feed. Backends não instalados são ignorados.
+
+Uso:
+    python benchmarks/benchmark_parsers.py --gravar      # grava as páginas (requer rede/Edge)
+    python benchmarks/benchmark_parsers.py -r 5          # executa o benchmark
+"""
+
+import io
+import os
+import argparse
+import tempfile
+import contextlib
+
+from paginas_gravadas import monitor, gravar_paginas, carregar_gravacao, ler_pagina, criar_scraper_isolado, medir
+
+def medir_fonte(chave, data, htmls, backend, escopo, repeticoes):
+    """
+    Retorna o melhor tempo para extrair os registros de todas as páginas da fonte
+    """
+    scraper = criar_scraper_isolado(chave, data)
+    
+    def extrair():
+        total = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            for html in htmls:
+                total += len(scraper.extrair_registros_html(html, backend, escopo))
+        return total
+    
+    melhor, _, registros = medir(extrair, repeticoes)
+    return melhor, registros
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dos backends de parsing')
+    parser.add_argument('--gravar', action='store_true', help='Gravar páginas reais antes de medir')
+    parser.add_argument('-r', '--repeticoes', type=int, default=5, help='Repetições de cada medição')
+    args = parser.parse_args()
+    
+    if args.gravar:
+        gravar_paginas()
+    
+    data, paginas = carregar_gravacao()
+    os.chdir(tempfile.mkdtemp(prefix='benchmark_parsers_'))
+    backends = [nome for nome in reversed(monitor.BACKENDS_PARSER) if monitor.parser_disponivel(nome)]
+    print(f"Backends instalados: {', '.join(backends)}")
+    
+    print(f"\n{'fonte':<9} {'backend':<12} {'escopo':<8} {'páginas/s':>10} {'MB/s':>8} {'registros':>10} {'ganho':>7}")
+    for chave, caminhos in paginas.items():
+        htmls = [ler_pagina(caminho) for caminho in caminhos]
+        megabytes = sum(len(html.encode('utf-8')) for html in htmls) / (1024 * 1024)
+        referencia = None
+        for backend in backends:
+            for escopo in (False, True):
+                melhor, registros = medir_fonte(chave, data, htmls, backend, escopo, args.repeticoes)
+                referencia = referencia or melhor
+                print(f"{chave:<9} {backend:<12} {'feed' if escopo else 'página':<8} {len(htmls) / melhor:>10.1f} "
+                      f"{megabytes / melhor:>8.2f} {registros:>10} {referencia / melhor:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
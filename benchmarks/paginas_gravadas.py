@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Gravação e leitura das páginas usadas nos benchmarks
+
+As páginas ficam em benchmarks/paginas/ junto com gravacao.json, que guarda a data da
+gravação (os scrapers de Valor e Estadão param em notícias de outro dia) e os arquivos
+de cada fonte na ordem em que foram carregados. Sem gravação, os benchmarks usam as páginas
+sintéticas de benchmarks/paginas_sinteticas/, que reproduzem a estrutura de cada fonte.
+"""
+
+import os
+import sys
+import json
+import time
+from datetime import datetime
+
+DIRETORIO_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+DIRETORIO_PAGINAS = os.path.join(DIRETORIO_BENCHMARKS, 'paginas')
+ARQUIVO_GRAVACAO = os.path.join(DIRETORIO_PAGINAS, 'gravacao.json')
+DIRETORIO_SINTETICAS = os.path.join(DIRETORIO_BENCHMARKS, 'paginas_sinteticas')
+
+# Permitir importar o scraper a partir da raiz do projeto
+sys.path.insert(0, os.path.dirname(DIRETORIO_BENCHMARKS))
+
+import scraper as monitor
+
+def gravar_paginas(paginas_por_fonte=3):
+    """
+    Baixa e grava páginas reais de cada fonte (HTML completo, como o BeautifulSoup recebe)
+    
+    Valor e O Globo são gravados página a página; Estadão e Folha gravam o page_source
+    inteiro depois de cada clique em 'Carregar mais'/'Ver mais', como ele cresce no navegador.
+    """
+    os.makedirs(DIRETORIO_PAGINAS, exist_ok=True)
+    gravacao = {'data': datetime.now().strftime("%d/%m/%Y"), 'paginas': {}}
+    
+    def salvar(chave, numero, html):
+        nome = f"{chave}_{numero}.html"
+        with open(os.path.join(DIRETORIO_PAGINAS, nome), 'w', encoding='utf-8') as f:
+            f.write(html)
+        gravacao['paginas'].setdefault(chave, []).append(nome)
+        print(f"Gravada {nome} ({len(html) / 1024:.0f} KB)")
+    
+    for chave in ('valor', 'oglobo'):
+        scraper = monitor.CLASSES_SCRAPERS[chave][0]()
+        # Sem extrator JS: o fallback do Edge também devolve o HTML
+        scraper.motor = monitor.MotorBusca([monitor.BackendHTTP(), monitor.BackendSelenium(scraper)])
+        try:
+            for numero in range(1, paginas_por_fonte + 1):
+                html = scraper.obter_pagina(scraper.url) if numero == 1 else scraper.navegar_para_proxima_pagina(numero - 1)
+                if not html:
+                    break
+                salvar(chave, numero, html)
+        finally:
+            scraper.fechar_driver()
+    
+    for chave in ('estadao', 'folha'):
+        scraper = monitor.CLASSES_SCRAPERS[chave][0]()
+        scraper.extracao_no_navegador = False
+        scraper.modo_xhr = False
+        try:
+            scraper.configurar_driver()
+            html = scraper.obter_pagina(scraper.url)
+            for numero in range(1, paginas_por_fonte + 1):
+                if not html:
+                    break
+                salvar(chave, numero, html)
+                clicou = scraper.clicar_carregar_mais() if chave == 'estadao' else scraper.clicar_ver_mais()
+                html = scraper.driver.page_source if clicou else None
+        finally:
+            scraper.fechar_driver()
+    
+    with open(ARQUIVO_GRAVACAO, 'w', encoding='utf-8') as f:
+        json.dump(gravacao, f, ensure_ascii=False, indent=2)
+    print(f"Gravação salva em {ARQUIVO_GRAVACAO}")
+
+def carregar_gravacao():
+    """
+    Retorna (data da gravação, {fonte: [caminhos das páginas]})
+    
+    Sem páginas gravadas (--gravar requer rede e Edge), usa as páginas sintéticas.
+    """
+    diretorio = DIRETORIO_PAGINAS
+    if not os.path.exists(ARQUIVO_GRAVACAO):
+        print(f"Nenhuma página gravada em {DIRETORIO_PAGINAS} (use --gravar). Usando as páginas sintéticas.")
+        diretorio = DIRETORIO_SINTETICAS
+    with open(os.path.join(diretorio, 'gravacao.json'), 'r', encoding='utf-8') as f:
+        gravacao = json.load(f)
+    caminhos = {
+        chave: [os.path.join(diretorio, nome) for nome in nomes]
+        for chave, nomes in gravacao['paginas'].items()
+    }
+    return gravacao['data'], caminhos
+
+def ler_pagina(caminho):
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def criar_scraper_isolado(chave, data):
+    """
+    Cria o scraper da fonte sem estado entre execuções: sem marca d'água, com registro de
+    vistos em memória e com 'hoje' fixado na data da gravação
+    """
+    scraper = monitor.CLASSES_SCRAPERS[chave][0]()
+    scraper.hoje = data
+    scraper.marca_dagua = set()
+    scraper.vistos = monitor.RegistroVistos(':memory:')
+    return scraper
+
+def medir(funcao, repeticoes):
+    """
+    Executa a função várias vezes e retorna (melhor tempo, tempo médio, último resultado)
+    """
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos), sum(tempos) / len(tempos), resultado
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Verifica que todos os backends de parsing produzem as mesmas notícias
+
+Compara com o html.parser analisando a página inteira, para cada backend instalado (com e
+sem o escopo de parsing), os registros brutos de cada página gravada (extrair_registros_html)
+e as notícias resultantes de processar as páginas como o ciclo faz (extrair_noticias página a
+página). Sem páginas gravadas, usa as páginas sintéticas de benchmarks/paginas_sinteticas/, sem
+rede nem Edge. Sai com código 1 se houver qualquer diferença ou se uma fonte não produzir nada.
+
+Uso:
+    python benchmarks/paridade_parsers.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+import contextlib
+
+from paginas_gravadas import monitor, carregar_gravacao, ler_pagina, criar_scraper_isolado
+
+def registros_com(chave, data, caminhos, backend, escopo):
+    """
+    Registros brutos de cada página, extraídos com o backend informado
+    """
+    scraper = criar_scraper_isolado(chave, data)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [registro for caminho in caminhos
+                for registro in scraper.extrair_registros_html(ler_pagina(caminho), backend, escopo)]
+
+def noticias_com(chave, data, caminhos, backend, escopo):
+    """
+    Lista de notícias da fonte extraídas com o backend informado
+    """
+    monitor.configurar_parser(backend)
+    monitor.parser_config['escopo'] = escopo
+    scraper = criar_scraper_isolado(chave, data)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for caminho in caminhos:
+            scraper.extrair_noticias(ler_pagina(caminho))
+    return scraper.noticias
+
+def main():
+    data, paginas = carregar_gravacao()
+    os.chdir(tempfile.mkdtemp(prefix='paridade_parsers_'))
+    backends = [nome for nome in monitor.BACKENDS_PARSER if monitor.parser_disponivel(nome)]
+    variantes = [(backend, escopo) for backend in backends for escopo in (True, False)
+                 if (backend, escopo) != ('html.parser', False)]
+    
+    divergencias = 0
+    for chave, caminhos in paginas.items():
+        for etapa, extrair in (('registros', registros_com), ('notícias', noticias_com)):
+            referencia = extrair(chave, data, caminhos, 'html.parser', False)
+            if not referencia:
+                # Listas vazias seriam iguais em todos os backends: a página não exercita nada
+                divergencias += 1
+                print(f"[ERRO] {chave:<8} html.parser          nenhum(a) {etapa} nas páginas")
+                continue
+            for backend, escopo in variantes:
+                resultado = extrair(chave, data, caminhos, backend, escopo)
+                nome = f"{backend}{' (escopo)' if escopo else ''}"
+                if resultado == referencia:
+                    print(f"[OK] {chave:<8} {nome:<20} {len(resultado)} {etapa}")
+                    continue
+                
+                divergencias += 1
+                print(f"[ERRO] {chave:<8} {nome:<20} {len(resultado)} {etapa} (html.parser: {len(referencia)})")
+                for esperado, obtido in zip(referencia, resultado):
+                    if esperado != obtido:
+                        print(f"    html.parser: {esperado}\n    {backend}: {obtido}")
+                        break
+    
+    monitor.configurar_parser(None)
+    monitor.parser_config['escopo'] = True
+    if divergencias:
+        print(f"\nParidade FALHOU: {divergencias} divergência(s) entre {', '.join(backends)}.")
+        return 1
+    print(f"\nParidade OK: {', '.join(backends)} extraem as mesmas notícias.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
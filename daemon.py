@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Monitor de Notícias
+Modo residente: um único processo de longa duração que mantém importações, navegadores,
+notícias vistas e publicações das fontes em memória entre os ciclos
+"""
+
+import os
+import sys
+import time
+import signal
+import argparse
+import threading
+from datetime import datetime
+import scraper
+
+class MonitorResidente:
+    """
+    Executa os ciclos de extração em um único processo, cada fonte no seu próprio intervalo
+    
+    SIGINT e SIGTERM encerram com elegância: o ciclo em andamento termina e os navegadores são
+    fechados (um segundo sinal encerra na hora). SIGHUP (SIGBREAK no Windows) recarrega: o
+    processo termina o ciclo, fecha os navegadores e reinicia com o código e a configuração atuais.
+    """
+    def __init__(self, intervalo=60, modo_rapido=True, recarregar_ao_alterar=False, arquivo_pid=None):
+        self.intervalo = intervalo
+        self.modo_rapido = modo_rapido
+        self.recarregar_ao_alterar = recarregar_ao_alterar
+        self.arquivo_pid = arquivo_pid
+        self.parar = threading.Event()
+        self.recarregar = False
+        self.ciclos = 0
+        self.assinatura = self.assinatura_codigo()
+    
+    def instalar_sinais(self):
+        """
+        Associa os sinais de encerramento e de recarga (apenas na thread principal)
+        """
+        signal.signal(signal.SIGINT, self.ao_encerrar)
+        signal.signal(signal.SIGTERM, self.ao_encerrar)
+        sinal_recarga = getattr(signal, 'SIGHUP', None) or getattr(signal, 'SIGBREAK', None)
+        if sinal_recarga is not None:
+            signal.signal(sinal_recarga, self.ao_recarregar)
+    
+    def ao_encerrar(self, sinal, quadro):
+        if self.parar.is_set():
+            print("\n[!] Segundo pedido de encerramento: saindo imediatamente.")
+            os._exit(1)
+        print(f"\n[+] {signal.Signals(sinal).name} recebido: encerrando após o ciclo atual...")
+        self.parar.set()
+    
+    def ao_recarregar(self, sinal, quadro):
+        print(f"\n[+] {signal.Signals(sinal).name} recebido: recarregando após o ciclo atual...")
+        self.recarregar = True
+        self.parar.set()
+    
+    @staticmethod
+    def assinatura_codigo():
+        """
+        Datas de modificação dos arquivos .py do monitor e dos plugins de fontes
+        """
+        diretorio = os.path.dirname(os.path.abspath(__file__))
+        plugins = os.path.join(diretorio, scraper.fontes_config['diretorio_plugins'])
+        assinatura = {}
+        for pasta in (diretorio, plugins):
+            if not os.path.isdir(pasta):
+                continue
+            for nome in os.listdir(pasta):
+                if nome.endswith('.py'):
+                    caminho = os.path.join(pasta, nome)
+                    assinatura[caminho] = os.path.getmtime(caminho)
+        return assinatura
+    
+    def codigo_alterado(self):
+        """
+        Indica se algum arquivo .py mudou desde o início do processo (ex.: cópia feita pelo .bat)
+        """
+        return self.recarregar_ao_alterar and self.assinatura_codigo() != self.assinatura
+    
+    def executar_ciclo(self):
+        """
+        Coleta as fontes cujo intervalo venceu e retorna os segundos até a próxima coleta
+        """
+        fontes = scraper.fontes_vencidas()
+        self.ciclos += 1
+        inicio = time.perf_counter()
+        print(f"\n[*] Ciclo {self.ciclos} em {datetime.now().strftime('%H:%M:%S')}: {', '.join(fontes)}")
+        try:
+            scraper.extrair_todas_noticias(modo_rapido=self.modo_rapido, fontes=fontes)
+        except Exception as e:
+            print(f"[!] Erro no ciclo {self.ciclos}: {e}")
+        print(f"[+] Ciclo {self.ciclos} concluído em {time.perf_counter() - inicio:.2f} segundos")
+        return scraper.agendar_coletas(fontes, self.intervalo)
+    
+    def aguardar(self, segundos):
+        """
+        Espera até a próxima coleta em fatias curtas (no Windows os sinais só são tratados entre elas)
+        """
+        fim = time.monotonic() + segundos
+        while not self.parar.is_set() and time.monotonic() < fim:
+            self.parar.wait(min(1.0, fim - time.monotonic()))
+            if self.codigo_alterado():
+                print("\n[+] Código alterado: recarregando...")
+                self.recarregar = True
+                self.parar.set()
+    
+    def executar(self):
+        """
+        Laço principal: ciclos até um sinal de encerramento ou de recarga
+        """
+        self.instalar_sinais()
+        if self.arquivo_pid:
+            with open(self.arquivo_pid, 'w') as f:
+                f.write(str(os.getpid()))
+        print(f"[+] Monitor residente iniciado (PID {os.getpid()}). Intervalo inicial de {self.intervalo} segundos, ajustado para cada fonte.")
+        
+        try:
+            while not self.parar.is_set():
+                self.aguardar(self.executar_ciclo())
+        finally:
+            if self.arquivo_pid and os.path.exists(self.arquivo_pid):
+                os.remove(self.arquivo_pid)
+        
+        if self.recarregar:
+            # O execv não executa o atexit: fechar navegadores e processos antes de reiniciar
+            scraper.encerrar_processos_fontes()
+            scraper.limpar_pool_drivers()
+            print("[+] Reiniciando com o código e a configuração atuais...")
+            sys.stdout.flush()
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        print(f"[+] Monitor residente encerrado após {self.ciclos} ciclos.")
+
+def main():
+    """
+    Função principal que processa argumentos e inicia o monitor residente
+    """
+    parser = argparse.ArgumentParser(description='Monitor de Notícias - Modo residente')
+    parser.add_argument('-i', '--intervalo', type=int, default=60, help='Intervalo inicial em segundos de cada fonte')
+    parser.add_argument('--completo', action='store_true', help='Verificar mais páginas por fonte em cada ciclo (padrão: modo rápido)')
+    parser.add_argument('--recarregar-ao-alterar', action='store_true', help='Reiniciar quando os arquivos .py forem alterados')
+    parser.add_argument('--arquivo-pid', default=None, help='Arquivo onde gravar o PID (para enviar sinais)')
+    scraper.adicionar_argumentos_configuracao(parser)
+    
+    args = parser.parse_args()
+    scraper.aplicar_argumentos_configuracao(args)
+    
+    MonitorResidente(intervalo=args.intervalo, modo_rapido=not args.completo,
+                     recarregar_ao_alterar=args.recarregar_ao_alterar, arquivo_pid=args.arquivo_pid).executar()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Exemplo de plugin de fonte: G1 (feed no mesmo formato do Valor e d'O Globo)
+
+Arquivos iniciados por '_' são ignorados. Para ativar, copie para fontes/g1.py.
+Cada plugin define registrar_fontes(monitor), que recebe o módulo scraper.
+"""
+
+def registrar_fontes(monitor):
+    monitor.registrar_fonte('g1', {
+        'nome': "G1",
+        'url': "https://g1.globo.com/",
+        'feed': "https://g1.globo.com/rss/g1/",
+        'paginacao': 'url',
+        'url_pagina': "https://g1.globo.com/index/feed/pagina-{numero}.ghtml",
+        'simultaneas': 3,
+        'busca': {'http': {'timeout': 15}, 'navegador': {'espera': 15}},
+        'extrator_js': monitor.EXTRATOR_JS_FEED_GLOBO,
+        'estrategia_carregamento': 'none',
+        'parar_carregamento': True,
+        'seletor_pronto': (monitor.By.CLASS_NAME, "feed-post-body"),
+        'item': 'div.feed-post-body',
+        'link': 'a.feed-post-link',
+        'categoria': ['span.feed-post-metadata-section'],
+        'datetime': 'span.feed-post-datetime',
+        'escopo': True,
+        'formato_data': 'relativo',
+        'data_antiga': 'ignorar',
+    })
@@ -12,7 +12,7 @@ import webbrowser
 import time
 import threading
 from datetime import datetime
-from scraper import extrair_todas_noticias
+from scraper import extrair_todas_noticias, adicionar_argumentos_configuracao, aplicar_argumentos_configuracao, fontes_vencidas, agendar_coletas
 
 def imprimir_cabecalho():
     """
@@ -34,12 +34,15 @@ def abrir_no_navegador(arquivo):
         return True
     return False
 
-def extrair():
+def extrair(fontes=None):
     """
     Executa a extração de notícias
+    
+    Args:
+        fontes: Fontes a coletar (padrão: todas as ativas)
     """
     print("\n[*] Iniciando extração de notícias...\n")
-    df = extrair_todas_noticias()
+    df = extrair_todas_noticias(fontes=fontes)
     
     if df is not None and not df.empty:
         print(f"\n[+] Extração concluída com sucesso! Foram encontradas {len(df)} notícias.")
@@ -50,10 +53,13 @@ def extrair():
 
 def executar_automaticamente(intervalo=60):
     """
-    Executa a extração de notícias automaticamente em intervalos regulares
+    Executa a extração de notícias automaticamente, cada fonte no seu próprio intervalo
+    
+    Cada ciclo coleta só as fontes cujo intervalo venceu; o intervalo de cada fonte acompanha
+    a frequência com que ela publica (ver coleta_config em scraper.py).
     
     Args:
-        intervalo: Tempo em segundos entre cada extração (padrão: 60 segundos)
+        intervalo: Intervalo inicial em segundos de cada fonte (padrão: 60 segundos)
     """
     parar_execucao = threading.Event()
     
@@ -62,8 +68,9 @@ def executar_automaticamente(intervalo=60):
             hora_atual = datetime.now().strftime("%H:%M:%S")
             print(f"\n[*] Execução automática em {hora_atual}")
             
-            # Executar extração
-            sucesso = extrair()
+            # Executar extração das fontes cujo intervalo venceu
+            fontes = fontes_vencidas()
+            sucesso = extrair(fontes)
             
             # Abrir no navegador apenas na primeira execução bem-sucedida
             if sucesso and not navegador_aberto[0]:
@@ -71,8 +78,8 @@ def executar_automaticamente(intervalo=60):
                     print("[+] Abrindo monitor_noticias.html no navegador...")
                     navegador_aberto[0] = True
             
-            # Aguardar pelo intervalo ou até que o evento de parada seja acionado
-            parar_execucao.wait(intervalo)
+            # Aguardar até a próxima fonte vencer ou até que o evento de parada seja acionado
+            parar_execucao.wait(agendar_coletas(fontes, intervalo))
     
     # Variável para controlar se o navegador já foi aberto
     navegador_aberto = [False]
@@ -82,7 +89,7 @@ def executar_automaticamente(intervalo=60):
     thread.daemon = True  # Thread será encerrada quando o programa principal terminar
     thread.start()
     
-    print(f"\n[+] Modo automático iniciado. Atualizando a cada {intervalo} segundos.")
+    print(f"\n[+] Modo automático iniciado. Intervalo inicial de {intervalo} segundos, ajustado para cada fonte.")
     print("[+] Pressione Ctrl+C para interromper.\n")
     
     try:
@@ -152,9 +159,11 @@ def processar_argumentos():
     parser.add_argument('-m', '--monitor', action='store_true', help='Abrir monitor no navegador')
     parser.add_argument('-a', '--auto', action='store_true', help='Iniciar modo automático (atualização a cada 1 minuto)')
     parser.add_argument('-i', '--intervalo', type=int, default=60, help='Intervalo em segundos entre atualizações no modo automático')
+    adicionar_argumentos_configuracao(parser)
     
     # Processar argumentos
     args = parser.parse_args()
+    aplicar_argumentos_configuracao(args)
     
     # Verificar se algum argumento foi fornecido
     if not any(vars(args).values()):
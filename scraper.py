@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import time
+import atexit
 import pandas as pd
 import re
 import os
@@ -13,97 +14,2208 @@ from selenium.webdriver.edge.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import requests
+from requests.adapters import HTTPAdapter
 from io import StringIO
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse, urljoin
 import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
 import threading
 import random
+import sqlite3
+import sys
+import argparse
+import importlib.util
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
+from collections import deque
+from contextlib import contextmanager
 
-# Pool global de drivers para reutilização
+try:
+    import fcntl
+except ImportError:
+    # Windows: trava de arquivos pelo msvcrt
+    fcntl = None
+    import msvcrt
+
+try:
+    from zoneinfo import ZoneInfo
+    FUSO_BRASILIA = ZoneInfo("America/Sao_Paulo")
+except Exception:
+    # Sem base de fusos (ex: Windows sem tzdata): Brasília não tem horário de verão desde 2019
+    from datetime import timezone
+    FUSO_BRASILIA = timezone(timedelta(hours=-3))
+
+# Pool global de drivers para reutilização (persiste entre ciclos)
 driver_pool = []
 driver_lock = threading.Lock()
+driver_cond = threading.Condition(driver_lock)  # Sinaliza drivers aquecidos que chegam ao pool
+driver_usos = {}  # Número de usos de cada driver desde sua criação
+drivers_aquecendo = 0  # Drivers sendo criados em segundo plano
+drivers_em_uso = 0  # Drivers entregues às fontes e ainda não devolvidos
+
+# Configuração do pool persistente de drivers
+pool_config = {
+    'tamanho': 4,           # Máximo de drivers mantidos aquecidos no pool
+    'max_usos': 50,         # Reciclar o driver após este número de usos
+    'max_memoria_mb': 1024, # Reciclar o driver se o navegador passar deste consumo
+    # Orçamento de navegadores abertos ao mesmo tempo: as demais fontes aguardam um livre
+    'max_ativos': int(os.environ.get('MONITOR_NAVEGADORES', '4'))
+}
+
+# Resolução do executável msedgedriver (uma única vez por processo)
+driver_binario = {
+    'caminho_fixo': os.environ.get('MONITOR_EDGEDRIVER'),     # Caminho fixado manualmente
+    'offline': os.environ.get('MONITOR_OFFLINE', '') == '1',  # Nunca consultar a internet
+    'resolvido': False,
+    'caminho': None
+}
+driver_binario_lock = threading.Lock()
+
+# Sessão HTTP compartilhada (pool de conexões keep-alive) para páginas renderizadas no servidor
+http_session = None
+http_lock = threading.Lock()
+
+# Latências reais das esperas por condição (nome da espera -> últimas medições em segundos)
+latencias_espera = {}
+latencias_lock = threading.Lock()
+
+# Bloqueio de recursos no nível da rede (DevTools Network.setBlockedURLs)
+bloqueio_config = {
+    'ativo': os.environ.get('MONITOR_SEM_BLOQUEIO', '') != '1',
+    # Tipos pesados que nunca são usados na extração (imagens, fontes, vídeo)
+    'padroes': [
+        '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*',
+        '*.woff*', '*.ttf*', '*.otf*', '*.eot*',
+        '*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*',
+    ],
+    # Anúncios, analytics e rastreadores de terceiros
+    'terceiros': [
+        '*doubleclick.net*', '*googlesyndication.com*', '*googleadservices.com*',
+        '*google-analytics.com*', '*googletagmanager.com*', '*googletagservices.com*',
+        '*adservice.google.*', '*amazon-adsystem.com*', '*criteo.com*', '*criteo.net*',
+        '*taboola.com*', '*outbrain.com*', '*scorecardresearch.com*', '*chartbeat.com*',
+        '*chartbeat.net*', '*hotjar.com*', '*facebook.net*', '*facebook.com/tr*',
+        '*connect.facebook.*', '*twitter.com/widgets*', '*platform.twitter.com*',
+        '*tiktok.com*', '*navdmp.com*', '*navegg.com*', '*clarity.ms*', '*newrelic.com*',
+        '*nr-data.net*', '*onesignal.com*', '*pubmatic.com*', '*rubiconproject.com*',
+        '*adnxs.com*', '*teads.tv*', '*smartadserver.com*', '*cxense.com*',
+        '*youtube.com/embed*', '*player.vimeo.com*', '*jwplayer.com*', '*jwpcdn.com*',
+    ],
+}
+
+# Regras por fonte: 'bloquear' acrescenta padrões, 'permitir' retira padrões da lista padrão
+regras_bloqueio_fontes = {
+    'valor': {
+        'bloquear': ['*horizon.globo.com*', '*ads.globo.com*', '*securepubads*'],
+        'permitir': [],
+    },
+    'oglobo': {
+        'bloquear': ['*horizon.globo.com*', '*ads.globo.com*', '*securepubads*'],
+        'permitir': [],
+    },
+    'estadao': {
+        'bloquear': ['*piano.io*', '*tinypass.com*', '*securepubads*'],
+        'permitir': [],
+    },
+    'folha': {
+        'bloquear': ['*tm.jsuol.com.br*', '*tm.uol.com.br*', '*securepubads*'],
+        'permitir': [],
+    },
+}
+
+# Economia obtida com o bloqueio (fonte -> contadores)
+bloqueio_estatisticas = {}
+bloqueio_lock = threading.Lock()
+driver_fonte = {}  # Fonte para a qual cada driver está configurado
+
+# Disjuntores (circuit breakers) por fonte, persistidos entre ciclos
+disjuntor_config = {
+    'falhas_para_abrir': 3,   # Falhas consecutivas que abrem o circuito
+    'espera_inicial': 30,     # Segundos com o circuito aberto na primeira abertura
+    'espera_maxima': 600,     # Limite da espera exponencial entre sondas
+    'atraso_base': 1.0,       # Atraso inicial entre tentativas de carregamento (segundos)
+    'atraso_maximo': 8.0,     # Limite do atraso exponencial entre tentativas
+    'prazo_sonda': 300,       # Sonda sem resultado após isso libera uma nova sonda (segundos)
+    'arquivo': 'estado_disjuntores.json'
+}
+disjuntores = {}
+disjuntores_lock = threading.Lock()
+
+# Prazos do ciclo de extração (relógio de parede)
+prazo_config = {
+    'ciclo': 150,          # Prazo total de um ciclo completo (segundos)
+    'ciclo_rapido': 50,    # Prazo total no modo rápido, dentro do SLA de 60s
+    # Orçamento de cada fonte como fração do prazo do ciclo (padrão: 1.0)
+    'fontes': {'valor': 0.9, 'estadao': 1.0, 'folha': 1.0, 'oglobo': 0.8}
+}
+
+# Fontes que não terminaram dentro do prazo: resultado entra na publicação do próximo ciclo
+fontes_em_execucao = {}   # Fonte -> future ainda em andamento
+resultados_atrasados = {}  # Fonte -> DataFrame concluído após o prazo
+atrasados_lock = threading.Lock()
+
+# Registro persistente de notícias já vistas (SQLite), chaveado pela URL canônica normalizada
+vistos_config = {
+    'arquivo': 'noticias_vistas.db',
+    'retencao_dias': 7,     # Notícias vistas pela primeira vez antes disso são esquecidas
+    'max_itens': 20000,     # Limite de itens guardados (os mais antigos saem primeiro)
+    'intervalo_limpeza': 3600  # Segundos entre limpezas da retenção
+}
+registro_vistos = None
+registro_vistos_lock = threading.Lock()
+
+# Parâmetros de rastreamento ignorados ao normalizar URLs
+PARAMETROS_RASTREAMENTO = {'fbclid', 'gclid', 'cmpid', 'mc_cid', 'mc_eid', 'ref', 'origin', 'from'}
+
+# Marca d'água por fonte: links mais recentes do último ciclo concluído
+marca_config = {
+    'arquivo': 'marcas_dagua.json',
+    'links': 10,            # Links do topo guardados como marca (tolera itens removidos do feed)
+    'max_acumuladas': 300   # Limite de notícias publicadas por fonte ao completar com o ciclo anterior
+}
+marcas_lock = threading.Lock()
+
+# Feeds RSS/Atom: caminho principal das fontes que têm 'feed' na especificação
+feed_config = {
+    'ativo': not os.environ.get('MONITOR_SEM_FEED'),
+    'arquivo': 'estado_feeds.json',  # ETag/Last-Modified de cada feed, para o GET condicional
+    'timeout': 10,
+    'bloco': 16384  # Bytes do XML entregues ao parser de cada vez
+}
+feeds_lock = threading.Lock()
+
+# Sitemaps de notícias (news-sitemap.xml): todas as URLs do dia em uma ou duas requisições
+sitemap_config = {
+    'ativo': not os.environ.get('MONITOR_SEM_SITEMAP'),
+    'arquivo': 'estado_sitemaps.json',  # URLs da leitura anterior de cada fonte (diff)
+    'max_arquivos': 2  # Sitemaps lidos de um índice (os primeiros listados são os mais recentes)
+}
+sitemaps_lock = threading.Lock()
+
+# Modo de execução das fontes: 'threads' (padrão) ou 'processos' (um processo por fonte)
+execucao_config = {
+    'modo': os.environ.get('MONITOR_MODO_EXECUCAO', 'threads')
+}
+executores_processos = {}  # Fonte -> ProcessPoolExecutor de um único processo (afinidade fonte/processo)
+executores_lock = threading.Lock()
+
+# Fontes do ciclo: plugins descobertos em 'diretorio_plugins' e seleção opcional das ativas
+fontes_config = {
+    'diretorio_plugins': os.environ.get('MONITOR_PLUGINS', 'fontes'),  # Relativo ao scraper.py
+    'ativas': [chave for chave in os.environ.get('MONITOR_FONTES', '').split(',') if chave] or None,
+    'plugins_carregados': False
+}
+fontes_lock = threading.Lock()
+
+# Agendador das fontes: trabalhadores persistentes compartilhados por todas as fontes do ciclo
+agendador_config = {
+    'workers': int(os.environ.get('MONITOR_WORKERS', '6'))  # Fontes extraídas ao mesmo tempo
+}
+agendador_fontes = None
+duracoes_fontes = {}  # Fonte -> duração da última extração (segundos), para ordenar a fila
+
+# Coleta adaptativa do modo automático: cada fonte tem seu intervalo, estimado pela taxa de
+# notícias novas nas coletas recentes (limites por fonte em 'coleta' na especificação)
+coleta_config = {
+    'adaptativa': not os.environ.get('MONITOR_INTERVALO_FIXO'),
+    'piso': 30,              # Menor intervalo entre coletas de uma fonte (segundos)
+    'teto': 900,             # Maior intervalo entre coletas de uma fonte (segundos)
+    'novas_por_coleta': 1,   # Notícias novas esperadas a cada coleta (intervalo = alvo / taxa)
+    'janela': 3 * 3600,      # Histórico considerado na taxa (segundos)
+    'pregao': (10, 18),      # Horário do pregão (Brasília, dias úteis): coletas mais frequentes
+    'fator_pregao': 0.5,
+    'madrugada': (0, 6),     # Madrugada: coletas mais espaçadas
+    'fator_madrugada': 2.0
+}
+historico_coletas = {}  # Fonte -> deque de (instante, notícias novas, segundos desde a coleta anterior)
+links_publicados = {}   # Fonte -> (instante, links) da última coleta
+publicacoes_fontes = {}  # Fonte -> DataFrame da última publicação (página combinada sem reler o JSON)
+proximas_coletas = {}   # Fonte -> instante (time.time) da próxima coleta
+coletas_lock = threading.Lock()
+
+# Backend de parsing do HTML: 'html.parser', 'lxml' ou 'selectolax' (None = o mais rápido instalado)
+parser_config = {
+    'backend': os.environ.get('MONITOR_PARSER') or None,
+    'escopo': not os.environ.get('MONITOR_PARSER_COMPLETO')  # Analisar só o trecho do feed
+}
+BACKENDS_PARSER = ('selectolax', 'lxml', 'html.parser')  # Do mais rápido para o mais lento
+parsers_instalados = {'html.parser': True}  # Cache das verificações de importação
+
+# Conteúdo que nunca contém notícias: scripts (incluindo o estado JSON embutido), estilos e comentários
+CONTEUDO_INERTE = re.compile(r'<script\b[^>]*>.*?</script\s*>|<style\b[^>]*>.*?</style\s*>|<!--.*?-->', re.S | re.I)
+
+# Colunas dos registros compactos trocados entre processos
+COLUNAS_NOTICIA = ['titulo', 'categoria', 'fonte', 'data', 'hora', 'link']
+
+# Tamanho típico (bytes) de cada tipo de recurso, para estimar a economia dos bloqueados
+TAMANHO_TIPICO_RECURSO = {
+    'Image': 45000, 'Font': 35000, 'Media': 400000, 'Script': 60000,
+    'Stylesheet': 25000, 'XHR': 5000, 'Fetch': 5000, 'Other': 10000,
+}
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+def criar_driver_otimizado():
+    """
+    Cria um driver Edge otimizado para performance
+    """
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-logging")
+    options.add_argument("--log-level=3")
+    options.add_argument("--disable-web-security")
+    options.add_argument("--disable-features=IsolateOrigins,site-per-process")
+    if bloqueio_config['ativo']:
+        # O Edge (Chromium) ignora --disable-images; a preferência de conteúdo é respeitada
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    options.add_argument("--disable-plugins")
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-features=VizDisplayCompositor")
+    options.add_argument("--disable-ipc-flooding-protection")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-translate")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--disable-component-extensions-with-background-pages")
+    options.add_argument("--disable-client-side-phishing-detection")
+    options.add_argument("--disable-hang-monitor")
+    options.add_argument("--disable-prompt-on-repost")
+    options.add_argument("--disable-domain-reliability")
+    options.add_argument("--disable-features=TranslateUI")
+    options.add_argument("--disable-features=BlinkGenPropertyTrees")
+    # Configurações adicionais para melhor conectividade
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-features=VizDisplayCompositor")
+    options.add_argument("--max_old_space_size=4096")
+    # driver.get retorna logo após iniciar a navegação; a prontidão de cada fonte
+    # ('normal', 'eager' ou 'none') é decidida em carregar_pagina_com_retry
+    options.page_load_strategy = 'none'
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    # Log de desempenho (eventos de rede) para medir as requisições bloqueadas
+    options.set_capability("ms:loggingPrefs", {"performance": "ALL"})
+    
+    caminho_driver = resolver_binario_driver()
+    service = Service(caminho_driver) if caminho_driver else Service()
+    driver = webdriver.Edge(service=service, options=options)
+    driver.set_page_load_timeout(25)  # Aumentado para 25 segundos para O Globo
+    driver.implicitly_wait(5)  # Aumentado para 5 segundos
+    aplicar_bloqueio_rede(driver)
+    return driver
+
+def configurar_bloqueio_rede(ativo=None, fonte=None, bloquear=None, permitir=None):
+    """
+    Ativa/desativa o bloqueio de recursos ou ajusta as regras de uma fonte
+    
+    Args:
+        ativo: Se False, nenhum recurso é bloqueado
+        fonte: Fonte cujas regras serão ajustadas (ex: 'estadao')
+        bloquear: Padrões de URL adicionais a bloquear nessa fonte
+        permitir: Padrões da lista padrão que não devem ser bloqueados nessa fonte
+    """
+    with bloqueio_lock:
+        if ativo is not None:
+            bloqueio_config['ativo'] = ativo
+        if fonte:
+            regras = regras_bloqueio_fontes.setdefault(fonte, {'bloquear': [], 'permitir': []})
+            if bloquear is not None:
+                regras['bloquear'] = list(bloquear)
+            if permitir is not None:
+                regras['permitir'] = list(permitir)
+        # Forçar a reaplicação das regras na próxima entrega de cada driver
+        driver_fonte.clear()
+
+def padroes_bloqueio(fonte=None):
+    """
+    Monta a lista de padrões de URL bloqueados para uma fonte
+    """
+    if not bloqueio_config['ativo']:
+        return []
+    regras = regras_bloqueio_fontes.get(fonte, {})
+    permitidos = set(regras.get('permitir', []))
+    padroes = bloqueio_config['padroes'] + bloqueio_config['terceiros'] + regras.get('bloquear', [])
+    return [padrao for padrao in dict.fromkeys(padroes) if padrao not in permitidos]
+
+def aplicar_bloqueio_rede(driver, fonte=None):
+    """
+    Instala no navegador a lista de URLs bloqueadas da fonte via DevTools
+    """
+    if driver_fonte.get(driver, False) == fonte:
+        return
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': padroes_bloqueio(fonte)})
+        driver_fonte[driver] = fonte
+    except Exception as e:
+        print(f"Não foi possível configurar o bloqueio de recursos: {e}")
+
+def coletar_estatisticas_bloqueio(driver):
+    """
+    Lê os eventos de rede acumulados no log do navegador e contabiliza o que foi bloqueado
+    """
+    try:
+        entradas = driver.get_log('performance')
+    except Exception:
+        return
+    
+    tipos = {}
+    bloqueadas = 0
+    estimado = 0
+    baixadas = 0
+    bytes_baixados = 0
+    for entrada in entradas:
+        try:
+            mensagem = json.loads(entrada['message'])['message']
+        except Exception:
+            continue
+        metodo = mensagem.get('method')
+        parametros = mensagem.get('params', {})
+        if metodo == 'Network.requestWillBeSent':
+            tipos[parametros.get('requestId')] = parametros.get('type', 'Other')
+        elif metodo == 'Network.loadingFailed' and parametros.get('blockedReason'):
+            tipo = parametros.get('type') or tipos.get(parametros.get('requestId'), 'Other')
+            bloqueadas += 1
+            estimado += TAMANHO_TIPICO_RECURSO.get(tipo, TAMANHO_TIPICO_RECURSO['Other'])
+        elif metodo == 'Network.loadingFinished':
+            baixadas += 1
+            bytes_baixados += parametros.get('encodedDataLength', 0)
+    
+    if not (bloqueadas or baixadas):
+        return
+    fonte = driver_fonte.get(driver) or 'geral'
+    with bloqueio_lock:
+        dados = bloqueio_estatisticas.setdefault(fonte, {
+            'bloqueadas': 0, 'bytes_economizados': 0, 'baixadas': 0, 'bytes_baixados': 0
+        })
+        dados['bloqueadas'] += bloqueadas
+        dados['bytes_economizados'] += estimado
+        dados['baixadas'] += baixadas
+        dados['bytes_baixados'] += bytes_baixados
+
+def imprimir_resumo_bloqueio():
+    """
+    Exibe quantas requisições e bytes o bloqueio de recursos economizou por fonte
+    """
+    with bloqueio_lock:
+        resumo = {fonte: dict(dados) for fonte, dados in bloqueio_estatisticas.items()}
+    if not resumo:
+        return
+    print("Bloqueio de recursos (requisições bloqueadas / ~MB economizados / requisições feitas / MB baixados):")
+    for fonte, dados in sorted(resumo.items()):
+        print(f"  {fonte}: {dados['bloqueadas']} / {dados['bytes_economizados'] / 1048576:.1f} / "
+              f"{dados['baixadas']} / {dados['bytes_baixados'] / 1048576:.1f}")
+
+def configurar_binario_driver(caminho=None, offline=None):
+    """
+    Fixa o caminho do msedgedriver e/ou ativa o modo offline
+    
+    Args:
+        caminho: Caminho do executável msedgedriver a ser usado sempre
+        offline: Se True, nunca consulta a internet para resolver o driver
+    """
+    with driver_binario_lock:
+        if caminho is not None:
+            driver_binario['caminho_fixo'] = caminho
+        if offline is not None:
+            driver_binario['offline'] = offline
+        driver_binario['resolvido'] = False
+        driver_binario['caminho'] = None
+
+def buscar_driver_em_cache():
+    """
+    Procura um msedgedriver já baixado nos caches locais do webdriver-manager (.wdm/drivers.json)
+    """
+    arquivos_cache = [
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '.wdm', 'drivers.json'),
+        os.path.join(os.getcwd(), '.wdm', 'drivers.json'),
+        os.path.join(os.path.expanduser('~'), '.wdm', 'drivers.json')
+    ]
+    
+    candidatos = []
+    for arquivo in dict.fromkeys(arquivos_cache):
+        try:
+            with open(arquivo, 'r', encoding='utf-8') as f:
+                entradas = json.load(f)
+        except (OSError, ValueError):
+            continue
+        
+        for chave, entrada in entradas.items():
+            caminho = entrada.get('binary_path') if isinstance(entrada, dict) else None
+            if not caminho or not os.path.exists(caminho):
+                continue
+            # Preferir a versão mais nova disponível
+            versao_match = re.search(r'edgedriver_([\d.]+)', chave)
+            versao = tuple(int(p) for p in versao_match.group(1).split('.') if p) if versao_match else ()
+            candidatos.append((versao, caminho))
+    
+    if not candidatos:
+        return None
+    return max(candidatos)[1]
+
+def resolver_binario_driver():
+    """
+    Resolve o caminho do msedgedriver uma única vez por processo
+    
+    Ordem: caminho fixo, cache local do webdriver-manager e, se não estiver offline,
+    download/consulta via webdriver-manager. Retorna None para deixar o Selenium decidir.
+    """
+    with driver_binario_lock:
+        if driver_binario['resolvido']:
+            return driver_binario['caminho']
+        
+        caminho = None
+        if driver_binario['caminho_fixo'] and os.path.exists(driver_binario['caminho_fixo']):
+            caminho = driver_binario['caminho_fixo']
+        
+        if not caminho:
+            caminho = buscar_driver_em_cache()
+        
+        if not caminho and not driver_binario['offline']:
+            try:
+                caminho = EdgeChromiumDriverManager().install()
+            except Exception as e:
+                print(f"Erro ao resolver o msedgedriver via webdriver-manager: {e}")
+        
+        if caminho:
+            print(f"Usando msedgedriver em: {caminho}")
+        else:
+            print("msedgedriver não encontrado localmente. Usando o PATH do sistema.")
+        
+        driver_binario['caminho'] = caminho
+        driver_binario['resolvido'] = True
+        return caminho
+
+def configurar_pool_drivers(tamanho=None, max_usos=None, max_memoria_mb=None, max_ativos=None):
+    """
+    Ajusta os parâmetros do pool persistente de drivers
+    
+    Args:
+        tamanho: Máximo de drivers mantidos no pool
+        max_usos: Número de usos após o qual o driver é reciclado
+        max_memoria_mb: Consumo de memória (MB) acima do qual o driver é reciclado
+        max_ativos: Máximo de navegadores abertos ao mesmo tempo (orçamento de navegadores)
+    """
+    with driver_cond:
+        if tamanho is not None:
+            pool_config['tamanho'] = max(0, tamanho)
+        if max_usos is not None:
+            pool_config['max_usos'] = max_usos
+        if max_memoria_mb is not None:
+            pool_config['max_memoria_mb'] = max_memoria_mb
+        if max_ativos is not None:
+            pool_config['max_ativos'] = max(1, max_ativos)
+            driver_cond.notify_all()
+
+def encerrar_driver(driver):
+    """
+    Fecha um driver ignorando erros (ex: navegador já encerrado)
+    """
+    driver_usos.pop(driver, None)
+    driver_fonte.pop(driver, None)
+    try:
+        driver.quit()
+    except:
+        pass
+
+def driver_saudavel(driver):
+    """
+    Verifica se o driver ainda responde antes de entregá-lo
+    """
+    try:
+        driver.execute_script("return 1;")
+        return True
+    except Exception:
+        return False
+
+def memoria_driver_mb(driver):
+    """
+    Estima a memória usada pelo navegador do driver em MB (0 se não for possível medir)
+    """
+    try:
+        import psutil
+        processo = psutil.Process(driver.service.process.pid)
+        processos = [processo] + processo.children(recursive=True)
+        return sum(p.memory_info().rss for p in processos) / (1024 * 1024)
+    except ImportError:
+        pass
+    except Exception:
+        return 0
+    
+    # Sem psutil: usar o heap JavaScript da página como aproximação
+    try:
+        heap = driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : 0;")
+        return (heap or 0) / (1024 * 1024)
+    except Exception:
+        return 0
+
+def obter_driver(fonte=None, prazo=None):
+    """
+    Obtém um driver saudável do pool ou cria um novo
+    
+    Com pool_config['max_ativos'] navegadores já entregues, aguarda que uma fonte devolva o seu.
+    
+    Args:
+        fonte: Fonte que usará o driver, para aplicar suas regras de bloqueio de recursos
+        prazo: Prazo da fonte; se esgotar (ou for cancelado) durante a espera, levanta TimeoutException
+    """
+    global drivers_em_uso
+    
+    def aguardar():
+        # Em fatias de até 1s, para perceber também o cancelamento do prazo (chamada com driver_cond)
+        if prazo is None:
+            driver_cond.wait()
+        elif prazo.expirado():
+            raise TimeoutException(f"prazo esgotado aguardando um navegador para {fonte}")
+        else:
+            driver_cond.wait(min(1.0, prazo.restante()))
+    
+    with driver_cond:
+        while drivers_em_uso >= max(1, pool_config['max_ativos']):
+            aguardar()
+        drivers_em_uso += 1
+        
+        while True:
+            while driver_pool:
+                driver = driver_pool.pop()
+                if driver_saudavel(driver):
+                    aplicar_bloqueio_rede(driver, fonte)
+                    return driver
+                print("Driver do pool não responde. Descartando.")
+                encerrar_driver(driver)
+            
+            # Se há drivers aquecendo, aguardar um deles em vez de criar outro
+            if drivers_aquecendo == 0:
+                break
+            try:
+                aguardar()
+            except TimeoutException:
+                drivers_em_uso -= 1
+                driver_cond.notify_all()
+                raise
+    
+    # Criação fora do lock para não serializar as inicializações do navegador
+    try:
+        driver = criar_driver_otimizado()
+    except Exception:
+        liberar_vaga_navegador()
+        raise
+    driver_usos[driver] = 0
+    aplicar_bloqueio_rede(driver, fonte)
+    return driver
+
+def liberar_vaga_navegador():
+    """
+    Devolve ao orçamento de navegadores a vaga de um driver entregue por obter_driver
+    """
+    global drivers_em_uso
+    with driver_cond:
+        drivers_em_uso = max(0, drivers_em_uso - 1)
+        driver_cond.notify_all()
+
+def aquecer_pool_drivers(quantidade=None, em_segundo_plano=False):
+    """
+    Cria drivers em paralelo e os deixa prontos no pool
+    
+    Args:
+        quantidade: Número de drivers desejados no pool (padrão: tamanho do pool)
+        em_segundo_plano: Se True, retorna imediatamente sem aguardar a criação
+    
+    Returns:
+        Número de drivers que começaram a ser criados
+    """
+    global drivers_aquecendo
+    
+    with driver_cond:
+        if quantidade is None:
+            quantidade = pool_config['tamanho']
+        faltando = min(quantidade, pool_config['tamanho']) - len(driver_pool) - drivers_aquecendo
+        if faltando <= 0:
+            return 0
+        drivers_aquecendo += faltando
+    
+    # Resolver o executável antes de disparar as criações em paralelo
+    resolver_binario_driver()
+    
+    def criar_para_o_pool():
+        global drivers_aquecendo
+        driver = None
+        try:
+            driver = criar_driver_otimizado()
+            driver_usos[driver] = 0
+        except Exception as e:
+            print(f"Erro ao aquecer driver do Edge: {e}")
+        
+        with driver_cond:
+            drivers_aquecendo -= 1
+            if driver:
+                driver_pool.append(driver)
+            driver_cond.notify_all()
+    
+    print(f"Aquecendo {faltando} driver(s) do Edge em paralelo...")
+    threads = [threading.Thread(target=criar_para_o_pool, daemon=True) for _ in range(faltando)]
+    for thread in threads:
+        thread.start()
+    
+    if not em_segundo_plano:
+        for thread in threads:
+            thread.join()
+    
+    return faltando
+
+def retornar_driver(driver):
+    """
+    Retorna um driver para o pool, reciclando-o se atingiu o limite de usos ou de memória
+    """
+    try:
+        guardar_ou_reciclar_driver(driver)
+    finally:
+        # A vaga só é liberada depois: quem aguarda já encontra o driver no pool
+        liberar_vaga_navegador()
+
+def guardar_ou_reciclar_driver(driver):
+    """
+    Devolve o driver ao pool ou o encerra se passou do limite de usos ou de memória
+    """
+    usos = driver_usos.get(driver, 0) + 1
+    driver_usos[driver] = usos
+    coletar_estatisticas_bloqueio(driver)
+    
+    if usos >= pool_config['max_usos']:
+        print(f"Driver atingiu {usos} usos. Reciclando.")
+        encerrar_driver(driver)
+        return
+    
+    memoria = memoria_driver_mb(driver)
+    if memoria > pool_config['max_memoria_mb']:
+        print(f"Driver usando {memoria:.0f} MB. Reciclando.")
+        encerrar_driver(driver)
+        return
+    
+    # Liberar a página atual para o driver ficar leve enquanto aguarda no pool
+    try:
+        driver.get("about:blank")
+    except Exception:
+        encerrar_driver(driver)
+        return
+    
+    with driver_cond:
+        if len(driver_pool) < pool_config['tamanho']:
+            driver_pool.append(driver)
+            driver_cond.notify()
+            return
+    
+    encerrar_driver(driver)
+
+def obter_sessao_http():
+    """
+    Obtém a sessão HTTP compartilhada, criando-a na primeira chamada
+    """
+    global http_session
+    with http_lock:
+        if http_session is None:
+            sessao = requests.Session()
+            adaptador = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            sessao.mount("https://", adaptador)
+            sessao.mount("http://", adaptador)
+            sessao.headers.update({
+                "User-Agent": USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8"
+            })
+            http_session = sessao
+        return http_session
+
+def texto_resposta(resposta):
+    """
+    Decodifica o corpo da resposta HTTP respeitando o charset do servidor
+    
+    Sem charset no Content-Type, o requests assume ISO-8859-1 para text/*, o que
+    corrompe os acentos das páginas UTF-8; nesse caso usa a codificação detectada no conteúdo.
+    """
+    if 'charset' not in resposta.headers.get('Content-Type', '').lower():
+        resposta.encoding = resposta.apparent_encoding or 'utf-8'
+    return resposta.text
+
+def fechar_sessao_http():
+    """
+    Fecha a sessão HTTP compartilhada e suas conexões
+    """
+    global http_session
+    with http_lock:
+        if http_session is not None:
+            http_session.close()
+            http_session = None
+
+class PaginaNaoEncontrada(Exception):
+    """
+    Sinaliza que a página não existe (ex: fim da paginação), sem necessidade de fallback
+    """
+    pass
+
+class Prazo:
+    """
+    Prazo de relógio com cancelamento cooperativo; prazos de fontes derivam do prazo do ciclo
+    """
+    def __init__(self, segundos, pai=None):
+        self.fim = time.monotonic() + segundos
+        if pai is not None:
+            self.fim = min(self.fim, pai.fim)
+        self.pai = pai
+        self.cancelado = threading.Event()
+
+    def subprazo(self, segundos):
+        """
+        Cria um prazo que termina no que vier primeiro: o orçamento informado ou este prazo
+        """
+        return Prazo(segundos, pai=self)
+
+    def cancelar(self):
+        self.cancelado.set()
+
+    def expirado(self):
+        if self.cancelado.is_set() or time.monotonic() >= self.fim:
+            return True
+        return self.pai is not None and self.pai.expirado()
+
+    def restante(self):
+        """
+        Segundos restantes (0 se o prazo expirou ou foi cancelado)
+        """
+        if self.expirado():
+            return 0
+        return self.fim - time.monotonic()
+
+    def limitar(self, timeout):
+        """
+        Reduz um timeout para caber no tempo restante
+        """
+        return max(0.1, min(timeout, self.restante()))
+
+@contextmanager
+def trava_arquivo(caminho):
+    """
+    Trava exclusiva entre processos ('<caminho>.lock') para ler e regravar um arquivo de estado
+    
+    No modo 'processos' cada fonte roda no seu processo e os locks de threading não bastam.
+    """
+    with open(caminho + '.lock', 'a+b') as trava:
+        if fcntl is not None:
+            fcntl.flock(trava.fileno(), fcntl.LOCK_EX)
+        else:
+            trava.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(trava.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK desiste após 10 segundos: continuar esperando
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(trava.fileno(), fcntl.LOCK_UN)
+            else:
+                trava.seek(0)
+                msvcrt.locking(trava.fileno(), msvcrt.LK_UNLCK, 1)
+
+class Disjuntor:
+    """
+    Disjuntor (circuit breaker) de uma fonte: fechado, aberto ou meio-aberto com uma única sonda
+    """
+    FECHADO = 'fechado'
+    ABERTO = 'aberto'
+    MEIO_ABERTO = 'meio_aberto'
+
+    def __init__(self, fonte, estado=FECHADO, falhas=0, aberturas=0, proxima_sonda=0):
+        self.fonte = fonte
+        self.estado = estado
+        self.falhas = falhas          # Falhas consecutivas
+        self.aberturas = aberturas    # Aberturas consecutivas (define a espera exponencial)
+        self.proxima_sonda = proxima_sonda  # Instante (time.time) em que uma sonda é permitida
+        self.inicio_sonda = 0  # Instante em que a sonda atual foi liberada
+        self.lock = threading.Lock()
+
+    def permitir(self):
+        """
+        Indica se a fonte pode ser consultada agora
+        
+        Com o circuito aberto e a espera vencida, passa a meio-aberto e libera uma única sonda.
+        Uma sonda que não registrou resultado dentro de 'prazo_sonda' libera uma nova.
+        """
+        with self.lock:
+            if self.estado == self.FECHADO:
+                return True
+            agora = time.time()
+            sonda_vencida = self.estado == self.MEIO_ABERTO and agora - self.inicio_sonda >= disjuntor_config['prazo_sonda']
+            if (self.estado == self.ABERTO and agora >= self.proxima_sonda) or sonda_vencida:
+                self.estado = self.MEIO_ABERTO
+                self.inicio_sonda = agora
+                print(f"Circuito de {self.fonte} meio-aberto: enviando uma requisição de sonda.")
+                return True
+            return False
+
+    def aberto(self):
+        """
+        Indica se as requisições devem falhar imediatamente
+        """
+        return self.estado == self.ABERTO
+
+    def em_sonda(self):
+        """
+        Indica se a próxima requisição é a sonda do estado meio-aberto
+        """
+        return self.estado == self.MEIO_ABERTO
+
+    def registrar_sucesso(self):
+        """
+        Fecha o circuito após uma requisição bem-sucedida
+        """
+        with self.lock:
+            mudou = self.estado != self.FECHADO
+            self.estado = self.FECHADO
+            self.falhas = 0
+            self.aberturas = 0
+        if mudou:
+            print(f"Circuito de {self.fonte} fechado: fonte respondendo novamente.")
+            salvar_disjuntores(self.fonte)
+
+    def encerrar_sonda(self):
+        """
+        Volta a aberto se a sonda terminou sem registrar sucesso nem falha, pronto para nova sonda
+        """
+        with self.lock:
+            if self.estado != self.MEIO_ABERTO:
+                return
+            self.estado = self.ABERTO
+            self.proxima_sonda = time.time()
+        print(f"Sonda de {self.fonte} terminou sem resultado: circuito volta a aberto.")
+        salvar_disjuntores(self.fonte)
+    
+    def registrar_falha(self):
+        """
+        Conta uma falha; abre o circuito no limite de falhas ou se a sonda falhar
+        """
+        with self.lock:
+            self.falhas += 1
+            if self.estado != self.MEIO_ABERTO and self.falhas < disjuntor_config['falhas_para_abrir']:
+                return
+            self.aberturas += 1
+            espera = min(disjuntor_config['espera_maxima'],
+                         disjuntor_config['espera_inicial'] * 2 ** (self.aberturas - 1))
+            # Jitter para as sondas das fontes não coincidirem
+            espera *= random.uniform(0.5, 1.0)
+            self.estado = self.ABERTO
+            self.proxima_sonda = time.time() + espera
+        print(f"Circuito de {self.fonte} aberto por {espera:.0f}s após {self.falhas} falha(s).")
+        salvar_disjuntores(self.fonte)
+
+    def para_dict(self):
+        return {
+            'estado': self.estado,
+            'falhas': self.falhas,
+            'aberturas': self.aberturas,
+            'proxima_sonda': self.proxima_sonda
+        }
+
+def obter_disjuntor(fonte):
+    """
+    Retorna o disjuntor da fonte, carregando o estado salvo no primeiro acesso
+    """
+    with disjuntores_lock:
+        if not disjuntores:
+            carregar_disjuntores()
+        if fonte not in disjuntores:
+            disjuntores[fonte] = Disjuntor(fonte)
+        return disjuntores[fonte]
+
+def carregar_disjuntores():
+    """
+    Lê o estado dos disjuntores salvo pelo processo anterior (chamada com disjuntores_lock)
+    """
+    try:
+        with trava_arquivo(disjuntor_config['arquivo']), open(disjuntor_config['arquivo'], 'r', encoding='utf-8') as f:
+            estados = json.load(f)
+    except (OSError, ValueError):
+        return
+    for fonte, dados in estados.items():
+        estado = dados.get('estado', Disjuntor.FECHADO)
+        if estado == Disjuntor.MEIO_ABERTO:
+            # A sonda do processo anterior não terminou: voltar a aberto, pronto para nova sonda
+            estado = Disjuntor.ABERTO
+        disjuntores[fonte] = Disjuntor(fonte, estado, dados.get('falhas', 0),
+                                       dados.get('aberturas', 0), dados.get('proxima_sonda', 0))
+
+def salvar_disjuntores(fonte=None):
+    """
+    Salva o estado dos disjuntores para que sobreviva entre ciclos e processos
+    
+    Com 'fonte', só o disjuntor dela é regravado sobre o arquivo: no modo 'processos' os
+    demais pertencem a outros processos e a cópia deste pode estar desatualizada.
+    """
+    with disjuntores_lock:
+        alterados = {chave: disjuntor.para_dict() for chave, disjuntor in disjuntores.items()
+                     if fonte is None or chave == fonte}
+    try:
+        with trava_arquivo(disjuntor_config['arquivo']):
+            try:
+                with open(disjuntor_config['arquivo'], 'r', encoding='utf-8') as f:
+                    estados = json.load(f)
+            except (OSError, ValueError):
+                estados = {}
+            estados.update(alterados)
+            with open(disjuntor_config['arquivo'], 'w', encoding='utf-8') as f:
+                json.dump(estados, f)
+    except OSError as e:
+        print(f"Erro ao salvar estado dos disjuntores: {e}")
+
+def fonte_disponivel(fonte, nome):
+    """
+    Verifica o disjuntor antes de iniciar a extração de uma fonte
+    """
+    if obter_disjuntor(fonte).permitir():
+        return True
+    print(f"{nome} indisponível (circuito aberto). Pulando neste ciclo.")
+    return False
+
+def atraso_com_jitter(tentativa):
+    """
+    Atraso exponencial com jitter antes da próxima tentativa de carregamento
+    """
+    atraso = min(disjuntor_config['atraso_maximo'], disjuntor_config['atraso_base'] * 2 ** tentativa)
+    return random.uniform(atraso / 2, atraso)
+
+class BackendHTTP:
+    """
+    Backend de busca via HTTP simples, sem navegador
+    """
+    nome = "http"
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+
+    def html_contem_seletor(self, html, seletor):
+        """
+        Verifica se o HTML contém o seletor esperado (mesmo formato usado pelo Selenium)
+        """
+        tipo, valor = seletor
+        if tipo == By.CLASS_NAME:
+            padrao = r'class=["\'](?:[^"\']*\s)?' + re.escape(valor) + r'[\s"\']'
+            return re.search(padrao, html) is not None
+        return BeautifulSoup(html, 'html.parser').select_one(valor) is not None
+
+    def obter_html(self, url, seletor):
+        """
+        Baixa a página e retorna o HTML apenas se o seletor esperado estiver presente
+        """
+        resposta = obter_sessao_http().get(url, timeout=self.timeout)
+        if resposta.status_code == 404:
+            raise PaginaNaoEncontrada(url)
+        resposta.raise_for_status()
+        html = texto_resposta(resposta)
+        if not self.html_contem_seletor(html, seletor):
+            print(f"Resposta HTTP sem o seletor esperado ({seletor[1]}): {url}")
+            return None
+        return html
+
+class BackendSelenium:
+    """
+    Backend de busca via Microsoft Edge (Selenium), usando o driver do scraper
+    """
+    nome = "selenium"
+
+    def __init__(self, scraper, max_tentativas=3, timeout=25, espera=8, espera_pronta=0,
+                 extrator_js=None, argumentos_extrator=()):
+        self.scraper = scraper
+        self.max_tentativas = max_tentativas
+        self.timeout = timeout
+        self.espera = espera
+        self.espera_pronta = espera_pronta  # Espera máxima adicional pelo readyState 'complete'
+        # Com um extrator JS, retorna a lista de registros em vez do page_source
+        self.extrator_js = extrator_js
+        self.argumentos_extrator = argumentos_extrator
+        # Um único driver por scraper: chamadas concorrentes são serializadas
+        self.lock = threading.Lock()
+
+    def obter_html(self, url, seletor):
+        """
+        Carrega a página no Edge e aguarda o seletor esperado
+        
+        Returns:
+            O page_source, ou a lista de registros se houver um extrator JS configurado
+        """
+        with self.lock:
+            # O navegador só é iniciado quando realmente necessário
+            if not self.scraper.driver:
+                self.scraper.configurar_driver()
+            driver = self.scraper.driver
+
+            if not carregar_pagina_com_retry(driver, url, max_tentativas=self.max_tentativas, timeout=self.timeout,
+                                             seletor=seletor, espera_seletor=self.espera,
+                                             estrategia=self.scraper.estrategia_carregamento,
+                                             parar_carregamento=self.scraper.parar_carregamento,
+                                             fonte=self.scraper.chave_fonte, prazo=self.scraper.prazo):
+                return None
+
+            if self.espera_pronta:
+                aguardar_pagina_pronta(driver, timeout=self.espera_pronta, nome="selenium_pagina_pronta")
+            
+            if self.extrator_js:
+                return driver.execute_script(self.extrator_js, 0, *self.argumentos_extrator)['registros']
+            return driver.page_source
+
+class MotorBusca:
+    """
+    Camada de busca plugável: tenta cada backend em ordem até obter o HTML esperado
+    """
+    def __init__(self, backends, fonte=None):
+        self.backends = backends
+        self.fonte = fonte  # Chave do disjuntor da fonte (None = sem disjuntor)
+        self.ultimo_backend = None
+
+    def obter_html(self, url, seletor):
+        """
+        Retorna o HTML do primeiro backend que conseguir carregar a página com o seletor
+        """
+        disjuntor = obter_disjuntor(self.fonte) if self.fonte else None
+        if disjuntor and disjuntor.aberto():
+            # Falhar rápido enquanto a fonte está fora do ar
+            print(f"Circuito de {self.fonte} aberto. Ignorando {url}")
+            return None
+        
+        for backend in self.backends:
+            try:
+                html = backend.obter_html(url, seletor)
+            except PaginaNaoEncontrada:
+                print(f"Página não encontrada: {url}")
+                return None
+            except Exception as e:
+                print(f"Erro no backend {backend.nome} ao carregar {url}: {e}")
+                html = None
+
+            if html:
+                self.ultimo_backend = backend.nome
+                if disjuntor:
+                    disjuntor.registrar_sucesso()
+                return html
+
+        return None
+
+def paginar_em_paralelo(carregar_pagina, paginas, processar_pagina, max_simultaneas=4, prazo=None):
+    """
+    Carrega várias páginas ao mesmo tempo e processa os resultados na ordem original
+    
+    Args:
+        carregar_pagina: Função que recebe o número da página e retorna o HTML (ou None)
+        paginas: Sequência de números de página a carregar
+        processar_pagina: Função (numero, html) que retorna False para interromper a paginação
+                          (uma exceção também interrompe, mantendo as páginas já processadas)
+        max_simultaneas: Limite de páginas carregando ao mesmo tempo para a fonte
+        prazo: Prazo da fonte; ao expirar, a paginação para com o que já foi processado
+    
+    Returns:
+        Número de páginas processadas. Páginas além do ponto de parada são canceladas e as que
+        já estavam carregando terminam antes do retorno.
+    """
+    paginas = list(paginas)
+    if not paginas:
+        return 0
+    
+    max_simultaneas = max(1, max_simultaneas)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_simultaneas)
+    pendentes = deque()
+    proxima = 0
+    processadas = 0
+    
+    try:
+        # Janela inicial de páginas em carregamento
+        while proxima < len(paginas) and len(pendentes) < max_simultaneas:
+            pendentes.append((paginas[proxima], executor.submit(carregar_pagina, paginas[proxima])))
+            proxima += 1
+        
+        while pendentes:
+            if prazo is not None and prazo.expirado():
+                print(f"Prazo esgotado: paginação interrompida após {processadas} página(s)")
+                break
+            
+            numero, futuro = pendentes.popleft()
+            try:
+                html = futuro.result(timeout=prazo.restante() if prazo is not None else None)
+            except concurrent.futures.TimeoutError:
+                print(f"Prazo esgotado aguardando a página {numero}")
+                break
+            except Exception as e:
+                print(f"Erro ao carregar a página {numero}: {e}")
+                html = None
+            
+            processadas += 1
+            try:
+                continuar = processar_pagina(numero, html)
+            except Exception as e:
+                print(f"Erro ao processar a página {numero}: {e}")
+                continuar = False
+            if not continuar:
+                break
+            
+            # Manter a janela cheia enquanto houver páginas a carregar
+            if proxima < len(paginas):
+                pendentes.append((paginas[proxima], executor.submit(carregar_pagina, paginas[proxima])))
+                proxima += 1
+    finally:
+        # Cancelar as páginas além do ponto de parada e aguardar as que já estão carregando: o
+        # chamador fecha o driver em seguida e um carregamento solto pegaria outro navegador do pool
+        for _, futuro in pendentes:
+            futuro.cancel()
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    return processadas
+
+def registrar_latencia(nome, segundos, sucesso=True):
+    """
+    Registra a duração real de uma espera para acompanhamento
+    """
+    with latencias_lock:
+        medicoes = latencias_espera.setdefault(nome, deque(maxlen=200))
+        medicoes.append((segundos, sucesso))
+
+def resumo_latencias():
+    """
+    Retorna um resumo das esperas registradas: {nome: {'quantidade', 'media', 'maximo', 'expiradas'}}
+    """
+    with latencias_lock:
+        resumo = {}
+        for nome, medicoes in latencias_espera.items():
+            if not medicoes:
+                continue
+            duracoes = [segundos for segundos, _ in medicoes]
+            resumo[nome] = {
+                'quantidade': len(duracoes),
+                'media': sum(duracoes) / len(duracoes),
+                'maximo': max(duracoes),
+                'expiradas': sum(1 for _, sucesso in medicoes if not sucesso)
+            }
+        return resumo
+
+def aguardar_condicao(driver, condicao, timeout=10, intervalo=0.1, nome="espera"):
+    """
+    Aguarda até a condição ser satisfeita, retornando assim que isso acontecer
+    
+    Args:
+        driver: Driver do Selenium passado para a condição
+        condicao: Função (driver) que retorna um valor verdadeiro quando a espera termina
+        timeout: Tempo máximo de espera em segundos
+        intervalo: Intervalo entre verificações em segundos
+        nome: Identificação da espera para o registro de latências
+    
+    Returns:
+        O valor retornado pela condição, ou None se o tempo expirou
+    """
+    inicio = time.perf_counter()
+    try:
+        resultado = WebDriverWait(driver, timeout, poll_frequency=intervalo).until(condicao)
+    except TimeoutException:
+        resultado = None
+    registrar_latencia(nome, time.perf_counter() - inicio, resultado is not None)
+    return resultado
+
+def contar_elementos(driver, seletor_css):
+    """
+    Conta os elementos que correspondem ao seletor CSS diretamente no navegador
+    """
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length;", seletor_css)
+
+def aguardar_mais_elementos(driver, seletor_css, quantidade_anterior, timeout=10, nome="novos_elementos"):
+    """
+    Aguarda até o número de elementos do seletor ultrapassar a quantidade anterior
+    
+    Returns:
+        Nova quantidade de elementos, ou None se o tempo expirou
+    """
+    def mais_elementos(d):
+        quantidade = contar_elementos(d, seletor_css)
+        return quantidade if quantidade > quantidade_anterior else False
+    return aguardar_condicao(driver, mais_elementos, timeout=timeout, nome=nome)
+
+def aguardar_botao_habilitado(driver, seletor_css, timeout=5, nome="botao_habilitado"):
+    """
+    Aguarda até o botão estar presente, visível e habilitado (ex: após terminar de carregar)
+    """
+    def botao_habilitado(d):
+        return d.execute_script("""
+            var botao = document.querySelector(arguments[0]);
+            if (!botao || botao.disabled || botao.getAttribute('aria-busy') === 'true') return false;
+            return botao.offsetParent !== null;
+        """, seletor_css)
+    return aguardar_condicao(driver, botao_habilitado, timeout=timeout, nome=nome)
+
+def aguardar_pagina_pronta(driver, timeout=5, nome="pagina_pronta"):
+    """
+    Aguarda até o documento terminar de carregar (document.readyState == 'complete')
+    """
+    return aguardar_condicao(
+        driver,
+        lambda d: d.execute_script("return document.readyState;") == "complete",
+        timeout=timeout,
+        nome=nome
+    )
+
+# Extratores executados dentro da página. Cada um devolve apenas registros compactos
+# {titulo, link, categoria, datetime} a partir do item 'inicio', em vez do page_source inteiro.
+EXTRATOR_JS_FEED_GLOBO = """
+    var inicio = arguments[0] || 0;
+    var seletoresCategoria = arguments[1] || [];
+    var artigos = document.querySelectorAll('div.feed-post-body');
+    var registros = [];
+    for (var i = inicio; i < artigos.length; i++) {
+        var artigo = artigos[i];
+        var link = artigo.querySelector('a.feed-post-link');
+        if (!link) continue;
+        var categoria = null;
+        for (var j = 0; j < seletoresCategoria.length && !categoria; j++) {
+            categoria = artigo.querySelector(seletoresCategoria[j]);
+        }
+        var data = artigo.querySelector('span.feed-post-datetime');
+        registros.push({
+            titulo: link.textContent.trim(),
+            link: link.getAttribute('href'),
+            categoria: categoria ? categoria.textContent.trim() : '',
+            datetime: data ? data.textContent.trim() : ''
+        });
+    }
+    return {registros: registros, total: artigos.length};
+"""
+
+EXTRATOR_JS_ESTADAO = """
+    var inicio = arguments[0] || 0;
+    var itens = document.querySelectorAll("a[data-component-name='lista-ultimas']");
+    var registros = [];
+    for (var i = inicio; i < itens.length; i++) {
+        var item = itens[i];
+        var titulo = (item.getAttribute('title') || '').trim();
+        if (!titulo) continue;
+        var categoria = item.textContent.trim();
+        // Remover duplicatas de categorias (mesmo texto do item anterior)
+        if (categoria && i > 0 && itens[i - 1].textContent.trim() === categoria) continue;
+        var bloco = item.closest('div');
+        var data = bloco ? bloco.querySelector('span.date') : null;
+        if (!data && item.nextElementSibling && item.nextElementSibling.matches('span.date')) {
+            data = item.nextElementSibling;
+        }
+        registros.push({
+            titulo: titulo,
+            link: item.getAttribute('href') || '#',
+            categoria: categoria,
+            datetime: data ? data.textContent.trim() : ''
+        });
+    }
+    return {registros: registros, total: itens.length};
+"""
+
+EXTRATOR_JS_FOLHA = """
+    var inicio = arguments[0] || 0;
+    var registros = [];
+    var principal = document.querySelector('a.c-main-headline__url');
+    if (principal && inicio === 0) {
+        var tituloPrincipal = principal.querySelector('h2.c-main-headline__title');
+        if (tituloPrincipal) {
+            var categoriaPrincipal = '';
+            var secao = principal.closest('section');
+            if (secao) {
+                var links = secao.querySelectorAll('a[href]');
+                for (var k = 0; k < links.length; k++) {
+                    if (/folha\\.uol\\.com\\.br\\/[^\\/]+\\/$/.test(links[k].getAttribute('href'))) {
+                        categoriaPrincipal = links[k].textContent.trim();
+                        break;
+                    }
+                }
+            }
+            var dataPrincipal = principal.querySelector('time.c-headline__dateline');
+            registros.push({
+                titulo: tituloPrincipal.textContent.trim(),
+                link: principal.getAttribute('href'),
+                categoria: categoriaPrincipal,
+                datetime: dataPrincipal ? dataPrincipal.textContent.trim() : '',
+                principal: true
+            });
+        }
+    }
+    // Uma única passagem em ordem de documento, com a mesma regra de indexar_categorias: o chapéu
+    // mais recente ou, sem chapéu, o último tópico fora do bloco do próprio item
+    var nos = document.querySelectorAll('h3.c-headline__kicker, a[href*="folha.uol.com.br/"]');
+    var chapeu = '', topicos = [], indice = 0;
+    for (var i = 0; i < nos.length; i++) {
+        var no = nos[i];
+        if (no.tagName === 'H3') {
+            chapeu = no.textContent.trim();
+            continue;
+        }
+        var href = no.getAttribute('href') || '';
+        if (href.indexOf('folha.uol.com.br/folha-topicos/') !== -1) {
+            topicos.push(no);
+        }
+        if (!/folha\\.uol\\.com\\.br\\/.*\\.shtml/.test(href)) continue;
+        var titulo = no.querySelector('h2.c-headline__title');
+        if (!titulo) continue;
+        if (indice++ < inicio) continue;
+        var categoria = chapeu;
+        var pai = no.parentElement;
+        if (!categoria && pai && pai !== document.body) {
+            for (var t = topicos.length - 1; t >= 0; t--) {
+                if (!pai.contains(topicos[t])) {
+                    categoria = topicos[t].textContent.trim();
+                    break;
+                }
+            }
+        }
+        var data = no.querySelector('time.c-headline__dateline');
+        registros.push({
+            titulo: titulo.textContent.trim(),
+            link: href,
+            categoria: categoria,
+            datetime: data ? data.textContent.trim() : ''
+        });
+    }
+    return {registros: registros, total: indice};
+"""
+
+def parser_disponivel(nome):
+    """
+    Verifica se o backend de parsing está instalado (lxml e selectolax são opcionais)
+    """
+    if nome not in parsers_instalados:
+        try:
+            if nome == 'lxml':
+                import lxml  # noqa: F401
+            elif nome == 'selectolax':
+                import selectolax.lexbor  # noqa: F401
+            else:
+                raise ImportError(nome)
+            parsers_instalados[nome] = True
+        except ImportError:
+            parsers_instalados[nome] = False
+    return parsers_instalados[nome]
+
+def configurar_parser(backend=None):
+    """
+    Define o backend de parsing ('html.parser', 'lxml', 'selectolax' ou None para o mais rápido)
+    """
+    if backend is not None:
+        if backend not in BACKENDS_PARSER:
+            raise ValueError(f"Backend de parsing inválido: {backend}")
+        if not parser_disponivel(backend):
+            raise ValueError(f"Backend de parsing não instalado: {backend}")
+    parser_config['backend'] = backend
+
+def backend_parser_atual():
+    """
+    Retorna o backend configurado ou, sem configuração, o mais rápido instalado
+    """
+    backend = parser_config['backend']
+    if backend and parser_disponivel(backend):
+        return backend
+    for nome in BACKENDS_PARSER:
+        if parser_disponivel(nome):
+            return nome
+    return 'html.parser'
+
+def criar_soup(html, backend='html.parser', filtro=None):
+    """
+    Cria o BeautifulSoup com o construtor de árvore do backend ('lxml' ou 'html.parser')
+    
+    Args:
+        filtro: SoupStrainer opcional; só os elementos que casam com ele (e seus filhos) entram na árvore
+    """
+    return BeautifulSoup(html, 'lxml' if backend == 'lxml' else 'html.parser', parse_only=filtro)
+
+def remover_conteudo_inerte(html):
+    """
+    Remove scripts, estilos e comentários do HTML antes do parsing
+    """
+    return CONTEUDO_INERTE.sub('', html)
+
+def criar_arvore_selectolax(html):
+    """
+    Cria a árvore do selectolax (motor lexbor)
+    """
+    from selectolax.lexbor import LexborHTMLParser
+    return LexborHTMLParser(html)
+
+def texto_no(no):
+    """
+    Texto de um nó do selectolax sem espaços nas pontas ('' se o nó não existe)
+    """
+    return no.text(deep=True).strip() if no is not None else ''
+
+def converter_data_iso(texto):
+    """
+    Converte uma data ISO 8601 (ex: '2025-05-26T14:03:00.000Z') para (data, hora) no horário de Brasília
+    
+    Returns:
+        Tupla ('dd/mm/aaaa', 'HH:MM') ou (None, None) se não for possível converter
+    """
+    if not texto:
+        return None, None
+    try:
+        momento = datetime.fromisoformat(texto.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None, None
+    if momento.tzinfo is not None:
+        momento = momento.astimezone(FUSO_BRASILIA)
+    return momento.strftime("%d/%m/%Y"), momento.strftime("%H:%M")
+
+def normalizar_url(link):
+    """
+    Normaliza a URL canônica de uma notícia: https, host minúsculo sem 'www.', sem fragmento,
+    sem parâmetros de rastreamento e sem barra final
+    """
+    partes = urlparse((link or '').strip())
+    host = partes.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    consulta = [
+        (chave, valor) for chave, valor in parse_qsl(partes.query, keep_blank_values=True)
+        if not chave.lower().startswith('utm_') and chave.lower() not in PARAMETROS_RASTREAMENTO
+    ]
+    caminho = partes.path.rstrip('/') or '/'
+    return urlunparse(('https', host, caminho, '', urlencode(sorted(consulta)), ''))
+
+class RegistroVistos:
+    """
+    Notícias já vistas, persistidas em SQLite com a data da primeira aparição
+    
+    A chave primária (URL normalizada) dá consultas de pertinência O(1); o índice pela
+    primeira aparição mantém a limpeza da retenção barata.
+    """
+    def __init__(self, arquivo, retencao_dias=7, max_itens=20000):
+        self.retencao_dias = retencao_dias
+        self.max_itens = max_itens
+        self.ultima_limpeza = 0
+        self.lock = threading.Lock()
+        self.conexao = sqlite3.connect(arquivo, check_same_thread=False, timeout=10)
+        with self.lock, self.conexao:
+            self.conexao.execute("PRAGMA journal_mode=WAL")
+            self.conexao.execute(
+                "CREATE TABLE IF NOT EXISTS vistos ("
+                " url TEXT PRIMARY KEY,"
+                " fonte TEXT NOT NULL,"
+                " primeira_vez REAL NOT NULL,"
+                " noticia TEXT NOT NULL)"
+            )
+            self.conexao.execute("CREATE INDEX IF NOT EXISTS idx_vistos_primeira_vez ON vistos (primeira_vez)")
+        self.limpar()
+
+    def obter(self, link):
+        """
+        Retorna a notícia registrada na primeira vez que a URL foi vista (ou None)
+        """
+        with self.lock:
+            linha = self.conexao.execute(
+                "SELECT noticia FROM vistos WHERE url = ?", (normalizar_url(link),)
+            ).fetchone()
+        return json.loads(linha[0]) if linha else None
+
+    def registrar_varios(self, fonte, noticias):
+        """
+        Registra as notícias ainda desconhecidas numa única transação
+        
+        Returns:
+            Número de notícias que ainda não tinham sido vistas
+        """
+        if not noticias:
+            return 0
+        agora = time.time()
+        linhas = [
+            (normalizar_url(noticia['link']), fonte, agora, json.dumps(noticia, ensure_ascii=False))
+            for noticia in noticias
+        ]
+        with self.lock, self.conexao:
+            antes = self.conexao.total_changes
+            self.conexao.executemany(
+                "INSERT OR IGNORE INTO vistos (url, fonte, primeira_vez, noticia) VALUES (?, ?, ?, ?)",
+                linhas
+            )
+            novas = self.conexao.total_changes - antes
+        if agora - self.ultima_limpeza > vistos_config['intervalo_limpeza']:
+            self.limpar()
+        return novas
+
+    def limpar(self):
+        """
+        Aplica a retenção: remove itens antigos e mantém no máximo max_itens
+        """
+        limite = time.time() - self.retencao_dias * 86400
+        with self.lock, self.conexao:
+            self.conexao.execute("DELETE FROM vistos WHERE primeira_vez < ?", (limite,))
+            self.conexao.execute(
+                "DELETE FROM vistos WHERE url IN ("
+                " SELECT url FROM vistos ORDER BY primeira_vez DESC LIMIT -1 OFFSET ?)",
+                (self.max_itens,)
+            )
+            self.ultima_limpeza = time.time()
+
+    def fechar(self):
+        with self.lock:
+            self.conexao.close()
+
+def obter_registro_vistos():
+    """
+    Retorna o registro de notícias vistas do processo, abrindo o banco no primeiro uso
+    """
+    global registro_vistos
+    with registro_vistos_lock:
+        if registro_vistos is None:
+            registro_vistos = RegistroVistos(
+                vistos_config['arquivo'],
+                retencao_dias=vistos_config['retencao_dias'],
+                max_itens=vistos_config['max_itens']
+            )
+        return registro_vistos
+
+def fechar_registro_vistos():
+    """
+    Fecha o banco de notícias vistas
+    """
+    global registro_vistos
+    with registro_vistos_lock:
+        if registro_vistos is not None:
+            registro_vistos.fechar()
+            registro_vistos = None
+
+def carregar_marcas_dagua():
+    """
+    Lê as marcas d'água de todas as fontes
+    """
+    try:
+        with open(marca_config['arquivo'], 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def iniciar_marca_dagua(scraper):
+    """
+    Prepara o scraper para parar a paginação ao alcançar os links do ciclo anterior
+    
+    A marca só vale se a publicação anterior da fonte existir, pois ela completa o ciclo.
+    """
+    scraper.links_topo = []
+    scraper.alcancou_marca = False
+    scraper.encontrou_antiga = False  # A extração parou numa notícia de outro dia
+    scraper.marca_dagua = set()
+    if os.path.exists(scraper.arquivo_json):
+        with marcas_lock, trava_arquivo(marca_config['arquivo']):
+            scraper.marca_dagua = set(carregar_marcas_dagua().get(scraper.chave_fonte, []))
+
+def verificar_marca_dagua(scraper, link):
+    """
+    Registra o link entre os mais recentes do ciclo e indica se ele já foi visto no ciclo anterior
+    """
+    link = normalizar_url(link)
+    if len(scraper.links_topo) < marca_config['links'] and link not in scraper.links_topo:
+        scraper.links_topo.append(link)
+    if link in scraper.marca_dagua:
+        if not scraper.alcancou_marca:
+            print(f"Alcançada a marca d'água de {scraper.chave_fonte}: o restante já foi visto no ciclo anterior.")
+        scraper.alcancou_marca = True
+        return True
+    return False
+
+def finalizar_marca_dagua(scraper, apenas_data=None):
+    """
+    Atualiza a marca d'água da fonte e, se a paginação parou nela, completa as notícias
+    com as publicadas no ciclo anterior
+    
+    A marca só avança se a extração chegou ao ciclo anterior (marca d'água ou notícia de
+    outro dia). Uma extração interrompida antes (prazo, página com falha) mantém a marca e
+    também é completada, para que o intervalo não coberto seja buscado no próximo ciclo.
+    
+    Args:
+        scraper: Scraper com links_topo, marca_dagua e arquivo_json
+        apenas_data: Se informada, só aproveita notícias anteriores desta data (dd/mm/aaaa)
+    
+    Returns:
+        Lista de notícias a publicar
+    """
+    noticias = scraper.noticias
+    completa = scraper.alcancou_marca or scraper.encontrou_antiga or not scraper.marca_dagua
+    if not completa:
+        print(f"Extração de {scraper.chave_fonte} não alcançou o ciclo anterior: marca d'água mantida.")
+    if scraper.alcancou_marca or not completa:
+        try:
+            with open(scraper.arquivo_json, 'r', encoding='utf-8') as f:
+                anteriores = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao ler a publicação anterior de {scraper.chave_fonte}: {e}")
+            anteriores = []
+        titulos = {noticia['titulo'] for noticia in noticias}
+        for noticia in anteriores:
+            if noticia.get('titulo') in titulos:
+                continue
+            if apenas_data and noticia.get('data') != apenas_data:
+                continue
+            noticias.append(noticia)
+        noticias = noticias[:marca_config['max_acumuladas']]
+    
+    if scraper.links_topo and completa:
+        with marcas_lock, trava_arquivo(marca_config['arquivo']):
+            marcas = carregar_marcas_dagua()
+            links = scraper.links_topo + [l for l in marcas.get(scraper.chave_fonte, []) if l not in scraper.links_topo]
+            marcas[scraper.chave_fonte] = links[:marca_config['links']]
+            try:
+                with open(marca_config['arquivo'], 'w', encoding='utf-8') as f:
+                    json.dump(marcas, f, ensure_ascii=False)
+            except OSError as e:
+                print(f"Erro ao salvar marcas d'água: {e}")
+    
+    return noticias
+
+def configurar_feeds(ativo=None):
+    """
+    Ativa ou desativa os feeds RSS/Atom (desativados, todas as fontes usam a página)
+    """
+    if ativo is not None:
+        feed_config['ativo'] = ativo
+
+def carregar_validadores_feeds():
+    """
+    Lê os validadores (ETag/Last-Modified) guardados de cada feed
+    """
+    try:
+        with open(feed_config['arquivo'], 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def cabecalhos_condicionais(url):
+    """
+    Monta os cabeçalhos do GET condicional com os validadores da última resposta do feed
+    """
+    with feeds_lock, trava_arquivo(feed_config['arquivo']):
+        validadores = carregar_validadores_feeds().get(url, {})
+    cabecalhos = {}
+    if validadores.get('ETag'):
+        cabecalhos['If-None-Match'] = validadores['ETag']
+    if validadores.get('Last-Modified'):
+        cabecalhos['If-Modified-Since'] = validadores['Last-Modified']
+    return cabecalhos
+
+def salvar_validadores_feed(url, resposta):
+    """
+    Guarda o ETag e o Last-Modified da resposta para o próximo GET condicional do feed
+    """
+    validadores = {cabecalho: resposta.headers[cabecalho] for cabecalho in ('ETag', 'Last-Modified')
+                   if resposta.headers.get(cabecalho)}
+    with feeds_lock, trava_arquivo(feed_config['arquivo']):
+        estados = carregar_validadores_feeds()
+        if validadores:
+            estados[url] = validadores
+        else:
+            estados.pop(url, None)
+        try:
+            with open(feed_config['arquivo'], 'w', encoding='utf-8') as f:
+                json.dump(estados, f)
+        except OSError as e:
+            print(f"Erro ao salvar o estado dos feeds: {e}")
+
+def converter_data_feed(texto):
+    """
+    Converte a data de um item de feed para (data, hora) no horário de Brasília
+    
+    Aceita o formato RFC 822 do RSS ('Mon, 26 May 2025 14:03:00 -0300') e o ISO 8601 do Atom.
+    """
+    if not texto:
+        return None, None
+    try:
+        momento = parsedate_to_datetime(texto.strip())
+    except (TypeError, ValueError, IndexError):
+        momento = None
+    if momento is None:
+        return converter_data_iso(texto)
+    if momento.tzinfo is not None:
+        momento = momento.astimezone(FUSO_BRASILIA)
+    return momento.strftime("%d/%m/%Y"), momento.strftime("%H:%M")
+
+def nome_local(tag):
+    """
+    Nome da tag XML sem o namespace ('{http://www.w3.org/2005/Atom}entry' -> 'entry')
+    """
+    return tag.rsplit('}', 1)[-1]
+
+class LeitorFeed:
+    """
+    Lê um feed RSS 2.0 ou Atom em blocos, produzindo cada item assim que ele termina de chegar
+    
+    O documento nunca é montado inteiro: cada item é descartado depois de convertido, e quem
+    consome os registros pode interromper a leitura (e o download) a qualquer momento.
+    """
+    def __init__(self, resposta, tamanho_bloco=None):
+        self.resposta = resposta
+        self.tamanho_bloco = tamanho_bloco or feed_config['bloco']
+        self.itens = 0  # Itens lidos até agora
+    
+    def __iter__(self):
+        parser = ET.XMLPullParser(events=('end',))
+        for bloco in self.resposta.iter_content(self.tamanho_bloco):
+            parser.feed(bloco)
+            yield from self.itens_prontos(parser)
+        parser.close()
+        yield from self.itens_prontos(parser)
+    
+    def itens_prontos(self, parser):
+        for _, elemento in parser.read_events():
+            if nome_local(elemento.tag) in ('item', 'entry'):
+                self.itens += 1
+                yield self.registro_do_item(elemento)
+                elemento.clear()
+    
+    @staticmethod
+    def registro_do_item(elemento):
+        """
+        Converte um <item> (RSS) ou <entry> (Atom) em registro {titulo, link, categoria, data, hora}
+        """
+        campos = {}
+        link = ''
+        categorias = []
+        for filho in elemento:
+            nome = nome_local(filho.tag)
+            texto = (filho.text or '').strip()
+            if nome == 'link':
+                # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+                if not link and filho.get('rel', 'alternate') == 'alternate':
+                    link = filho.get('href') or texto
+            elif nome == 'category':
+                categoria = filho.get('term') or texto
+                if categoria:
+                    categorias.append(categoria)
+            elif nome not in campos:
+                campos[nome] = texto
+        
+        if not link and campos.get('guid', '').startswith('http'):
+            link = campos['guid']
+        if '*http' in link:
+            # Redirecionador de cliques (ex.: redir.folha.com.br/redir/online/.../*https://...)
+            link = link[link.index('*http') + 1:]
+        
+        data, hora = converter_data_feed(campos.get('pubDate') or campos.get('published')
+                                         or campos.get('updated') or campos.get('date'))
+        return {
+            'titulo': campos.get('title', ''),
+            'link': link,
+            'categoria': categorias[0] if categorias else '',
+            'data': data,
+            'hora': hora
+        }
 
-def criar_driver_otimizado():
+class LeitorSitemap(LeitorFeed):
     """
-    Cria um driver Edge otimizado para performance
+    Lê um sitemap de notícias do Google News em blocos, produzindo um registro por <url>
+    
+    Se o documento for um índice de sitemaps, os endereços dos <sitemap> ficam em 'sitemaps'.
     """
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-logging")
-    options.add_argument("--log-level=3")
-    options.add_argument("--disable-web-security")
-    options.add_argument("--disable-features=IsolateOrigins,site-per-process")
-    options.add_argument("--disable-images")  # Não carregar imagens para ser mais rápido
-    options.add_argument("--disable-plugins")
-    options.add_argument("--disable-background-timer-throttling")
-    options.add_argument("--disable-backgrounding-occluded-windows")
-    options.add_argument("--disable-renderer-backgrounding")
-    options.add_argument("--disable-features=VizDisplayCompositor")
-    options.add_argument("--disable-ipc-flooding-protection")
-    options.add_argument("--disable-background-networking")
-    options.add_argument("--disable-sync")
-    options.add_argument("--disable-translate")
-    options.add_argument("--disable-default-apps")
-    options.add_argument("--disable-component-extensions-with-background-pages")
-    options.add_argument("--disable-client-side-phishing-detection")
-    options.add_argument("--disable-hang-monitor")
-    options.add_argument("--disable-prompt-on-repost")
-    options.add_argument("--disable-domain-reliability")
-    options.add_argument("--disable-features=TranslateUI")
-    options.add_argument("--disable-features=BlinkGenPropertyTrees")
-    # Configurações adicionais para melhor conectividade
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-features=VizDisplayCompositor")
-    options.add_argument("--max_old_space_size=4096")
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    def __init__(self, resposta, tamanho_bloco=None):
+        super().__init__(resposta, tamanho_bloco)
+        self.sitemaps = []
     
-    service = Service(EdgeChromiumDriverManager().install())
-    driver = webdriver.Edge(service=service, options=options)
-    driver.set_page_load_timeout(25)  # Aumentado para 25 segundos para O Globo
-    driver.implicitly_wait(5)  # Aumentado para 5 segundos
-    return driver
+    def itens_prontos(self, parser):
+        for _, elemento in parser.read_events():
+            nome = nome_local(elemento.tag)
+            if nome == 'url':
+                self.itens += 1
+                yield self.registro_do_item(elemento)
+                elemento.clear()
+            elif nome == 'sitemap':
+                for filho in elemento:
+                    if nome_local(filho.tag) == 'loc' and filho.text:
+                        self.sitemaps.append(filho.text.strip())
+                elemento.clear()
+    
+    @staticmethod
+    def registro_do_item(elemento):
+        """
+        Converte um <url> com <news:news> em registro {titulo, link, categoria, data, hora, palavras_chave}
+        """
+        link = ''
+        noticia = {}
+        for filho in elemento:
+            nome = nome_local(filho.tag)
+            if nome == 'loc':
+                link = (filho.text or '').strip()
+            elif nome == 'news':
+                noticia = {nome_local(campo.tag): (campo.text or '').strip() for campo in filho}
+        data, hora = converter_data_iso(noticia.get('publication_date'))
+        return {'titulo': noticia.get('title', ''), 'link': link, 'categoria': '', 'data': data, 'hora': hora,
+                'palavras_chave': noticia.get('keywords', '')}
 
-def obter_driver():
+def configurar_sitemaps(ativo=None):
     """
-    Obtém um driver do pool ou cria um novo
+    Ativa ou desativa os sitemaps de notícias (desativados, as fontes usam o feed ou a página)
     """
-    with driver_lock:
-        if driver_pool:
-            return driver_pool.pop()
-        else:
-            return criar_driver_otimizado()
+    if ativo is not None:
+        sitemap_config['ativo'] = ativo
 
-def retornar_driver(driver):
+def carregar_estado_sitemaps():
     """
-    Retorna um driver para o pool
+    Lê as URLs da leitura anterior do sitemap de cada fonte
     """
-    with driver_lock:
-        if len(driver_pool) < 4:  # Máximo 4 drivers no pool
-            driver_pool.append(driver)
-        else:
-            driver.quit()
+    try:
+        with open(sitemap_config['arquivo'], 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def salvar_estado_sitemap(fonte, links_arquivos):
+    """
+    Guarda as URLs (normalizadas) de cada arquivo do sitemap da fonte para o diff do próximo ciclo
+    """
+    with sitemaps_lock, trava_arquivo(sitemap_config['arquivo']):
+        estados = carregar_estado_sitemaps()
+        estados[fonte] = links_arquivos
+        try:
+            with open(sitemap_config['arquivo'], 'w', encoding='utf-8') as f:
+                json.dump(estados, f)
+        except OSError as e:
+            print(f"Erro ao salvar o estado dos sitemaps: {e}")
+
+# Meses abreviados das datas por extenso (ex.: '25.abr.2025')
+MESES = {
+    'jan': '01', 'fev': '02', 'mar': '03', 'abr': '04',
+    'mai': '05', 'jun': '06', 'jul': '07', 'ago': '08',
+    'set': '09', 'out': '10', 'nov': '11', 'dez': '12'
+}
+
+def converter_data_por_extenso(match):
+    """
+    Converte o match de '25.abr.2025 às 12h22' em ('25/04/2025', '12:22')
+    """
+    dia, mes, ano, hora, minuto = match.groups()
+    mes = MESES.get(mes.lower())
+    if not mes:
+        return None, None
+    return f"{dia}/{mes}/{ano}", f"{hora}:{minuto}"
+
+# Formatos de data/hora das fontes: expressão regular e conversão do match para (data, hora)
+FORMATOS_DATA = {
+    # '25/04/2025, 12:22'
+    'dd/mm/aaaa, hh:mm': (r'(\d{2}/\d{2}/\d{4}),\s*(\d{2}:\d{2})', lambda m: (m.group(1), m.group(2))),
+    # '25/04/2025, 12h22'
+    'dd/mm/aaaa, hhHmm': (r'(\d{2}/\d{2}/\d{4}),\s*(\d{1,2})h(\d{2})', lambda m: (m.group(1), f"{m.group(2)}:{m.group(3)}")),
+    # '25.abr.2025 às 12h22'
+    'dd.mes.aaaa às hhHmm': (r'(\d{2})\.(\w{3})\.(\d{4})\s+às\s+(\d{1,2})h(\d{2})', converter_data_por_extenso),
+    # 'Há 5 minutos', 'Há 2 horas', 'Agora' ou, por extenso, '25/04/2025 às 13:30'
+    'relativo': (r'(\d{2}/\d{2}/\d{4})[\s às]+(\d{2}:\d{2})', lambda m: (m.group(1), m.group(2))),
+}
+
+# Especificações declarativas das fontes
+#
+# Chaves comuns:
+#   nome, fonte          Nome nas mensagens e valor da coluna 'fonte' (padrão: o nome)
+#   dominio              Links fora do domínio ficam com fonte 'Desconhecida'
+#   url, arquivo_json    Página de últimas notícias e publicação da fonte (padrão: noticias_<chave>.json)
+#   feed                 RSS/Atom de últimas notícias: caminho principal, com a página como alternativa
+#   sitemap              Sitemap de notícias do Google News: tem prioridade sobre o feed e a página
+#   paginacao            'url' (páginas numeradas em url_pagina, se houver) ou 'cliques' (botão 'carregar mais')
+#   simultaneas          Páginas (ou requisições) carregadas ao mesmo tempo
+#   busca                HTTP com o Edge como fallback ({'http': {...}, 'navegador': {...}});
+#                        sem 'busca', a página é sempre carregada no Edge com 'carregamento'
+#   seletor_pronto       Seletor (By, valor) que indica que a lista de notícias já está na página
+#   seletor_artigos      Itens da lista contados a cada clique (paginação por cliques)
+#   item, link,          Seletores 'tag.classe' do feed genérico: bloco de cada notícia, link
+#   categoria, datetime  (cujo texto é o título), categorias em ordem de preferência e data
+#   escopo               Montar no BeautifulSoup apenas os blocos 'item'
+#   formato_data         Chave de FORMATOS_DATA
+#   data_antiga          Notícia de outro dia: 'parar' a paginação, 'ignorar' ou 'aceitar'
+#   categorias_url       Trechos da URL -> categoria, quando a página não traz uma
+#   categoria_max        Categorias mais longas que isso são trocadas pela da URL
+#   coleta               Limites próprios da coleta adaptativa (ex.: {'piso': 60, 'teto': 1800})
+ESPECIFICACOES_FONTES = {
+    'valor': {
+        'nome': "Valor Econômico",
+        'dominio': 'valor.globo.com',
+        'url': "https://valor.globo.com/ultimas-noticias/",
+        'feed': "https://pox.globo.com/rss/valor/",
+        'sitemap': "https://valor.globo.com/sitemap/valor/news.xml",
+        'arquivo_json': 'noticias_valor.json',
+        'paginacao': 'url',
+        'url_pagina': "https://valor.globo.com/ultimas-noticias/index/feed/pagina-{numero}",
+        'simultaneas': 4,
+        'busca': {'http': {}, 'navegador': {'espera': 8}},
+        'extrator_js': EXTRATOR_JS_FEED_GLOBO,
+        # No fallback do Edge, o feed na tela basta: não esperar os subrecursos
+        'estrategia_carregamento': 'none',
+        'parar_carregamento': True,
+        'seletor_pronto': (By.CLASS_NAME, "feed-post-body"),
+        'item': 'div.feed-post-body',
+        'link': 'a.feed-post-link',
+        'categoria': ['span.feed-post-metadata-section', 'a.feed-post-header-chapeu', 'span.feed-post-header-chapeu'],
+        'datetime': 'span.feed-post-datetime',
+        'escopo': True,
+        'formato_data': 'dd/mm/aaaa, hh:mm',
+        'data_antiga': 'parar',
+        # Seções da URL (valor.globo.com/<seção>/noticia/...): itens do sitemap não trazem a editoria
+        'categorias_url': {
+            '.com/financas/': 'Finanças',
+            '.com/empresas/': 'Empresas',
+            '.com/brasil/': 'Brasil',
+            '.com/politica/': 'Política',
+            '.com/mundo/': 'Mundo',
+            '.com/agronegocios/': 'Agronegócios',
+            '.com/legislacao/': 'Legislação',
+            '.com/opiniao/': 'Opinião',
+            '.com/carreira/': 'Carreira',
+            '.com/eu-e/': 'Eu &',
+            '.com/valor-investe/': 'Valor Investe',
+            '.com/impresso/': 'Impresso'
+        },
+    },
+    'estadao': {
+        'nome': "Estadão",
+        'url': "https://www.estadao.com.br/ultimas/",
+        'feed': "https://www.estadao.com.br/arc/outboundfeeds/feeds/rss/sections/ultimas/",
+        'sitemap': "https://www.estadao.com.br/arc/outboundfeeds/news-sitemap/?outputType=xml",
+        'arquivo_json': 'noticias_estadao.json',
+        'paginacao': 'cliques',
+        'simultaneas': 4,
+        'extrator_js': EXTRATOR_JS_ESTADAO,
+        # Os scripts da página são necessários para o botão 'Carregar mais': não interromper
+        'estrategia_carregamento': 'eager',
+        'parar_carregamento': False,
+        'seletor_pronto': (By.CSS_SELECTOR, "a[data-component-name='lista-ultimas']"),
+        'seletor_artigos': "a[data-component-name='lista-ultimas']",
+        'carregamento': {'max_tentativas': 3, 'espera_seletor': 8},
+        'formato_data': 'dd/mm/aaaa, hhHmm',
+        'data_antiga': 'parar',
+        'categoria_max': 30,
+        'categorias_url': {
+            '/politica/': 'Política',
+            '/economia/': 'Economia',
+            '/esportes/': 'Esportes',
+            '/cultura/': 'Cultura',
+            '/internacional/': 'Internacional',
+            '/brasil/': 'Brasil',
+            '/tecnologia/': 'Tecnologia',
+            '/futebol/': 'Futebol',
+            '/sao-paulo/': 'São Paulo',
+            '/opiniao/': 'Opinião'
+        },
+    },
+    'folha': {
+        'nome': "Folha",
+        'fonte': 'Folha de S.Paulo',
+        'url': "https://www1.folha.uol.com.br/ultimas-noticias/",
+        'feed': "https://feeds.folha.uol.com.br/emcimadahora/rss091.xml",
+        'arquivo_json': 'noticias_folha.json',
+        'paginacao': 'cliques',
+        'extrator_js': EXTRATOR_JS_FOLHA,
+        # Os scripts da página são necessários para o botão 'Ver mais': não interromper
+        'estrategia_carregamento': 'eager',
+        'parar_carregamento': False,
+        'seletor_pronto': (By.CLASS_NAME, "c-main-headline__title"),
+        'seletor_artigos': "h2.c-headline__title",
+        'carregamento': {'max_tentativas': 1, 'espera_seletor': 10},
+        'formato_data': 'dd.mes.aaaa às hhHmm',
+        'data_antiga': 'aceitar',
+        # Editorias da URL (folha.uol.com.br/<editoria>/) -> categoria
+        'categorias_url': {
+            'poder': 'Política',
+            'mercado': 'Economia',
+            'cotidiano': 'Cotidiano',
+            'mundo': 'Mundo',
+            'esporte': 'Esporte',
+            'ilustrada': 'Cultura',
+            'f5': 'Entretenimento',
+            'ambiente': 'Ambiente',
+            'ciencia': 'Ciência',
+            'equilibrioesaude': 'Saúde',
+            'educacao': 'Educação',
+            'tecnologia': 'Tecnologia',
+            'ilustrissima': 'Ilustríssima',
+            'comida': 'Gastronomia',
+            'tec': 'Tecnologia',
+            'podcasts': 'Podcasts',
+            'folhinha': 'Folhinha',
+            'empreendedorismo': 'Empreendedorismo'
+        },
+    },
+    'oglobo': {
+        'nome': "O Globo",
+        'url': "https://oglobo.globo.com/ultimas-noticias/",
+        'feed': "https://oglobo.globo.com/rss/oglobo",
+        'arquivo_json': 'noticias_oglobo.json',
+        'paginacao': 'url',
+        'url_pagina': "https://oglobo.globo.com/ultimas-noticias/index/feed/pagina-{numero}.ghtml",
+        'simultaneas': 3,
+        # Timeouts maiores no Edge para O Globo
+        'busca': {
+            'http': {'timeout': 15},
+            'navegador': {'max_tentativas': 4, 'timeout': 30, 'espera': 25, 'espera_pronta': 3}
+        },
+        'extrator_js': EXTRATOR_JS_FEED_GLOBO,
+        # Scripts de terceiros lentos seguram o 'load' de O Globo muito depois do feed aparecer
+        'estrategia_carregamento': 'none',
+        'parar_carregamento': True,
+        'seletor_pronto': (By.CLASS_NAME, "feed-post-body"),
+        'item': 'div.feed-post-body',
+        'link': 'a.feed-post-link',
+        'categoria': ['span.feed-post-metadata-section'],
+        'datetime': 'span.feed-post-datetime',
+        'escopo': True,
+        'formato_data': 'relativo',
+        'data_antiga': 'ignorar',
+    },
+}
+
+planos_fontes = {}  # Chave da fonte -> PlanoExtracao compilado
+
+class PlanoExtracao:
+    """
+    Especificação de uma fonte compilada uma única vez por processo: seletores separados para
+    o BeautifulSoup e o selectolax, expressões regulares e mapas prontos para o laço de registros
+    """
+    def __init__(self, chave, spec):
+        self.chave = chave
+        self.spec = spec
+        self.nome = spec['nome']
+        self.fonte = spec.get('fonte', spec['nome'])
+        self.dominio = spec.get('dominio')
+        self.data_antiga = spec.get('data_antiga', 'parar')
+        self.categoria_max = spec.get('categoria_max')
+        self.categorias_url = spec.get('categorias_url', {})
+        
+        # Seletores do feed genérico: (tag, classe, css)
+        self.item = self.compilar_seletor(spec['item']) if 'item' in spec else None
+        self.link = self.compilar_seletor(spec['link']) if 'link' in spec else None
+        self.categorias = [self.compilar_seletor(seletor) for seletor in spec.get('categoria', [])]
+        self.datetime = self.compilar_seletor(spec['datetime']) if 'datetime' in spec else None
+        self.filtro_parsing = SoupStrainer(self.item[0], class_=self.item[1]) if spec.get('escopo') and self.item else None
+        
+        padrao, self.converter_match = FORMATOS_DATA[spec['formato_data']]
+        self.regex_data = re.compile(padrao)
+        self.relativo = spec['formato_data'] == 'relativo'
+        self.regex_numero = re.compile(r'\d+')
+    
+    @staticmethod
+    def compilar_seletor(seletor):
+        """
+        Separa 'tag.classe' em (tag, classe, seletor CSS)
+        """
+        tag, classe = seletor.split('.', 1)
+        return tag, classe, seletor
+    
+    def converter_data(self, texto, hoje):
+        """
+        Converte o texto de data/hora da fonte em (data, hora), ou (None, None) se não reconhecido
+        """
+        if self.relativo:
+            return self.converter_tempo_relativo(texto, hoje)
+        match = self.regex_data.search(texto)
+        if not match:
+            return None, None
+        return self.converter_match(match)
+    
+    def converter_tempo_relativo(self, tempo_relativo, hoje):
+        """
+        Converte o tempo relativo (ex: 'Há 5 minutos') para data e hora absolutas.
+        Retorna uma tupla (data_formatada, hora_formatada) ou (None, None) se falhar.
+        """
+        agora = datetime.now()
+        tempo_relativo = tempo_relativo.lower()
+        
+        try:
+            if 'agora' in tempo_relativo or 'poucos instantes' in tempo_relativo:
+                tempo_calculado = agora
+            elif 'minuto' in tempo_relativo:
+                tempo_calculado = agora - timedelta(minutes=int(self.regex_numero.search(tempo_relativo).group()))
+            elif 'hora' in tempo_relativo:
+                tempo_calculado = agora - timedelta(hours=int(self.regex_numero.search(tempo_relativo).group()))
+            else:
+                # Tentar extrair data e hora se for um formato diferente (ex: 25/04/2025 às 13:30)
+                match = self.regex_data.search(tempo_relativo)
+                if match:
+                    return self.converter_match(match)
+                print(f"Formato de tempo relativo não reconhecido: {tempo_relativo}")
+                return None, None
+            
+            # Verificar se a data calculada é de hoje
+            data_calculada = tempo_calculado.strftime("%d/%m/%Y")
+            if data_calculada != hoje:
+                print(f"Notícia de data anterior encontrada ({data_calculada}), ignorando.")
+                return None, None
+            
+            return data_calculada, tempo_calculado.strftime("%H:%M")
+        except Exception as e:
+            print(f"Erro ao calcular tempo absoluto para '{tempo_relativo}': {e}")
+            return None, None
+
+def obter_plano_fonte(chave):
+    """
+    Retorna a especificação compilada da fonte, compilando-a no primeiro uso
+    """
+    plano = planos_fontes.get(chave)
+    if plano is None:
+        plano = planos_fontes[chave] = PlanoExtracao(chave, ESPECIFICACOES_FONTES[chave])
+    return plano
 
-class ValorEconomicoScraper:
+class ScraperFonte:
+    """
+    Scraper guiado pela especificação declarativa da fonte (ESPECIFICACOES_FONTES)
+    
+    Concentra o que é comum a todas as fontes: driver, busca da página, montagem dos
+    registros do feed, conversão em notícias, paginação por URL e publicação. As fontes
+    com estrutura própria herdam desta classe e substituem apenas o que for específico.
+    """
+    chave_fonte = None  # Identificação da fonte no pool, no bloqueio de recursos e no disjuntor
+    
     def __init__(self):
-        self.url = "https://valor.globo.com/ultimas-noticias/"
+        self.plano = obter_plano_fonte(self.chave_fonte)
+        spec = self.plano.spec
+        self.nome = self.plano.nome
+        self.url = spec['url']
+        self.prazo = None  # Prazo da fonte no ciclo (cancelamento cooperativo)
+        self.arquivo_json = spec.get('arquivo_json', f"noticias_{self.chave_fonte}.json")
+        iniciar_marca_dagua(self)  # Parar a paginação nos links já vistos no ciclo anterior
+        self.vistos = obter_registro_vistos()  # Notícias já processadas em ciclos anteriores
         self.noticias = []
         self.hoje = datetime.now().strftime("%d/%m/%Y")
         self.titulos_atuais = set()
         self.driver = None
+        self.seletor_feed = spec['seletor_pronto']
+        self.paginas_simultaneas = spec.get('simultaneas', 4)  # Limite de páginas carregando ao mesmo tempo
+        self.estrategia_carregamento = spec.get('estrategia_carregamento', 'normal')  # 'normal', 'eager' ou 'none'
+        self.parar_carregamento = spec.get('parar_carregamento', False)  # window.stop() assim que o seletor aparecer
+        self.filtro_parsing = self.plano.filtro_parsing
+        self.extracao_no_navegador = False  # Sem 'busca', o Edge devolve o page_source
+        
+        self.motor = None
+        if 'busca' in spec:
+            # HTTP primeiro; o Edge é usado apenas se a resposta não tiver o feed,
+            # extraindo os registros dentro da própria página
+            self.motor = MotorBusca([
+                BackendHTTP(**spec['busca'].get('http', {})),
+                BackendSelenium(self, extrator_js=spec.get('extrator_js'),
+                                argumentos_extrator=([seletor[2] for seletor in self.plano.categorias],),
+                                **spec['busca'].get('navegador', {}))
+            ], fonte=self.chave_fonte)
         
+        if spec['paginacao'] == 'cliques':
+            self.seletor_artigos = spec['seletor_artigos']  # Itens contados a cada clique
+            self.extracao_no_navegador = True  # Extrair registros dentro da página, sem page_source
+            self.cursor_dom = 0  # Itens de notícia já processados na página atual
+    
     def configurar_driver(self):
         """
         Obtém um driver do pool
         """
         print("Configurando o driver do Microsoft Edge...")
-        self.driver = obter_driver()
+        self.driver = obter_driver(fonte=self.chave_fonte, prazo=self.prazo)
         return self.driver
     
     def fechar_driver(self):
@@ -117,175 +2229,545 @@ class ValorEconomicoScraper:
     
     def obter_pagina(self, url):
         """
-        Carrega a página usando o Selenium com timeout otimizado e retry
+        Carrega a página e retorna seu HTML
+        
+        Fontes com 'busca' passam pelo MotorBusca (HTTP e, se preciso, o Edge); as demais são
+        carregadas no Edge e, com extracao_no_navegador ativa, retornam a lista de registros.
         """
+        if self.motor:
+            return self.motor.obter_html(url, self.seletor_feed)
+        
         try:
-            if not carregar_pagina_com_retry(self.driver, url):
+            print(f"Carregando a página de {self.nome}: {url}")
+            if not self.driver:
+                self.configurar_driver()
+            carregamento = self.plano.spec.get('carregamento', {})
+            if not carregar_pagina_com_retry(self.driver, url, max_tentativas=carregamento.get('max_tentativas', 3),
+                                             seletor=self.seletor_feed, espera_seletor=carregamento.get('espera_seletor', 8),
+                                             estrategia=self.estrategia_carregamento,
+                                             parar_carregamento=self.parar_carregamento,
+                                             fonte=self.chave_fonte, prazo=self.prazo):
                 return None
             
-            # Aguardar o carregamento dos elementos principais com timeout menor
-            WebDriverWait(self.driver, 8).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "feed-post-body"))
-            )
-            
+            if self.extracao_no_navegador:
+                return self.extrair_registros_no_navegador(0)
             return self.driver.page_source
         except Exception as e:
-            print(f"Erro ao aguardar elementos da página: {e}")
+            print(f"Erro ao carregar página de {self.nome}: {e}")
             return None
     
     def extrair_noticias(self, html):
         """
-        Extrai as notícias do HTML usando BeautifulSoup com parada inteligente
+        Extrai as notícias do HTML com parada inteligente
+        
+        Também aceita a lista de registros já extraída dentro do navegador.
+        
+        Returns:
+            Tupla (novas_noticias, encontrou_noticia_antiga)
         """
         if not html:
             return 0, False
+        if isinstance(html, list):
+            return self.processar_registros(html)
+        
+        registros = self.extrair_registros_html(html)
+        return self.processar_registros(registros)
+    
+    def extrair_registros_html(self, html, backend=None, escopo=None):
+        """
+        Monta os registros {titulo, link, categoria, datetime} a partir do HTML com o backend
+        de parsing configurado
+        
+        Com escopo ativo o BeautifulSoup recebe o HTML sem scripts, estilos e comentários e
+        materializa apenas os elementos de filtro_parsing. O selectolax sempre analisa a página
+        inteira: o lexbor percorre scripts mais rápido do que a remoção prévia.
+        """
+        backend = backend or backend_parser_atual()
+        if backend == 'selectolax':
+            return self.registros_selectolax(criar_arvore_selectolax(html))
+        escopo = parser_config['escopo'] if escopo is None else escopo
+        if escopo:
+            html = remover_conteudo_inerte(html)
+        return self.registros_soup(criar_soup(html, backend, self.filtro_parsing if escopo else None))
+    
+    def registros_soup(self, soup):
+        """
+        Monta os registros do feed genérico (item, link, categoria, datetime) com o BeautifulSoup
+        """
+        plano = self.plano
+        artigos = soup.find_all(plano.item[0], class_=plano.item[1])
+        print(f"Encontrados {len(artigos)} artigos na página de {self.nome}")
+        
+        registros = []
+        for artigo in artigos:
+            link_element = artigo.find(plano.link[0], class_=plano.link[1])
+            if not link_element:
+                continue
             
-        soup = BeautifulSoup(html, 'html.parser')
-        artigos = soup.find_all('div', class_='feed-post-body')
-        print(f"Encontrados {len(artigos)} artigos na página")
+            categoria_element = None
+            for tag, classe, _ in plano.categorias:
+                categoria_element = artigo.find(tag, class_=classe)
+                if categoria_element:
+                    break
+            
+            data_element = artigo.find(plano.datetime[0], class_=plano.datetime[1])
+            registros.append({
+                'titulo': link_element.text.strip(),
+                'link': link_element.get('href'),
+                'categoria': categoria_element.text.strip() if categoria_element else '',
+                'datetime': data_element.text.strip() if data_element else ''
+            })
+        
+        return registros
+    
+    def registros_selectolax(self, arvore):
+        """
+        Monta os registros do feed genérico com o selectolax (mesmo resultado de registros_soup)
+        """
+        plano = self.plano
+        artigos = arvore.css(plano.item[2])
+        print(f"Encontrados {len(artigos)} artigos na página de {self.nome}")
+        
+        registros = []
+        for artigo in artigos:
+            link_element = artigo.css_first(plano.link[2])
+            if link_element is None:
+                continue
+            
+            categoria_element = None
+            for _, _, seletor in plano.categorias:
+                categoria_element = artigo.css_first(seletor)
+                if categoria_element is not None:
+                    break
+            
+            registros.append({
+                'titulo': texto_no(link_element),
+                'link': link_element.attributes.get('href'),
+                'categoria': texto_no(categoria_element),
+                'datetime': texto_no(artigo.css_first(plano.datetime[2]))
+            })
+        
+        return registros
+    
+    def processar_registros(self, registros):
+        """
+        Converte registros {titulo, link, categoria, datetime} em notícias, com parada inteligente
+        
+        Laço quente de todas as fontes: as expressões regulares e os mapas já vêm compilados no
+        plano da fonte. Registros do feed e do sitemap, com 'data' e 'hora' já convertidas,
+        dispensam o 'datetime'.
+        
+        Args:
+            registros: Lista de registros, ou leitor de feed/sitemap que os produz em blocos
         
+        Returns:
+            Tupla (novas_noticias, encontrou_noticia_antiga)
+        """
+        plano = self.plano
         data_atual = self.hoje
         novas_noticias = 0
         noticias_batch = []
         encontrou_noticia_antiga = False
         
-        for artigo in artigos:
+        for registro in registros:
             try:
-                link_element = artigo.find('a', class_='feed-post-link')
-                if not link_element:
+                titulo = registro['titulo']
+                if not titulo:
                     continue
-                    
-                titulo = link_element.text.strip()
+                
+                link = registro['link']
+                # A manchete principal fica fixa no topo por horas: não serve de marca d'água
+                if not registro.get('principal') and verificar_marca_dagua(self, link):
+                    # Daqui em diante tudo já foi visto no ciclo anterior
+                    encontrou_noticia_antiga = True
+                    break
                 
                 if titulo in self.titulos_atuais:
                     continue
-                    
-                link = link_element['href']
-                fonte = 'Valor Econômico' if 'valor.globo.com' in link else 'Desconhecida'
                 
-                categoria_element = artigo.find('span', class_='feed-post-metadata-section')
-                if not categoria_element:
-                    categoria_element = artigo.find('a', class_='feed-post-header-chapeu')
-                if not categoria_element:
-                    categoria_element = artigo.find('span', class_='feed-post-header-chapeu')
-                    
-                categoria = categoria_element.text.strip() if categoria_element else "Não especificada"
+                # Já processada em ciclos anteriores: reaproveitar o registro salvo,
+                # que mantém a hora calculada quando a notícia apareceu
+                conhecida = self.vistos.obter(link)
+                if conhecida:
+                    if plano.data_antiga != 'aceitar' and conhecida['data'] != data_atual:
+                        if plano.data_antiga == 'parar':
+                            encontrou_noticia_antiga = True
+                            break
+                        continue
+                    noticias_batch.append(dict(conhecida, titulo=titulo))
+                    self.titulos_atuais.add(titulo)
+                    novas_noticias += 1
+                    continue
                 
-                data_element = artigo.find('span', class_='feed-post-datetime')
-                if not data_element:
+                if 'data' in registro:
+                    # Data já convertida na origem (ex.: respostas JSON)
+                    data, hora = registro['data'], registro['hora']
+                else:
+                    data_hora_texto = registro.get('datetime')
+                    if not data_hora_texto:
+                        continue
+                    data, hora = plano.converter_data(data_hora_texto, data_atual)
+                if data is None:
                     continue
-                    
-                data_hora_texto = data_element.text.strip()
-                data_match = re.search(r'(\d{2}/\d{2}/\d{4}),\s*(\d{2}:\d{2})', data_hora_texto)
                 
-                if data_match:
-                    data = data_match.group(1)
-                    hora = data_match.group(2)
-                    
-                    if data != data_atual:
+                if plano.data_antiga != 'aceitar' and data != data_atual:
+                    if plano.data_antiga == 'parar':
                         # Encontrou notícia antiga - sinalizar para parar
                         encontrou_noticia_antiga = True
                         break
-                    
-                    noticias_batch.append({
-                        'titulo': titulo,
-                        'categoria': categoria,
-                        'fonte': fonte,
-                        'data': data,
-                        'hora': hora,
-                        'link': link
-                    })
-                    self.titulos_atuais.add(titulo)
-                    novas_noticias += 1
-                    
+                    continue
+                
+                categoria = registro.get('categoria', '')
+                if not categoria or (plano.categoria_max and len(categoria) > plano.categoria_max):
+                    categoria = self.categoria_pela_url(link)
+                
+                noticias_batch.append({
+                    'titulo': titulo,
+                    'categoria': categoria,
+                    'fonte': plano.fonte if not plano.dominio or plano.dominio in link else 'Desconhecida',
+                    'data': data,
+                    'hora': hora,
+                    'link': link
+                })
+                self.titulos_atuais.add(titulo)
+                novas_noticias += 1
+                if registro.get('principal'):
+                    print(f"Notícia principal adicionada: {titulo[:50]}...")
             except Exception as e:
-                print(f"Erro ao processar artigo: {e}")
+                print(f"Erro ao processar artigo de {self.nome}: {e}")
                 continue
         
         if noticias_batch:
             self.noticias.extend(noticias_batch)
-            print(f"Adicionadas {novas_noticias} novas notícias")
-                
+            self.vistos.registrar_varios(self.chave_fonte, noticias_batch)
+            print(f"Adicionadas {novas_noticias} novas notícias de {self.nome}")
+        
+        if encontrou_noticia_antiga:
+            self.encontrou_antiga = True
         return novas_noticias, encontrou_noticia_antiga
     
-    def navegar_para_proxima_pagina(self, pagina_atual):
+    def extrair_via_feed(self):
+        """
+        Extrai as notícias do feed RSS/Atom da fonte, caminho principal quando a especificação tem 'feed'
+        
+        O GET é condicional (ETag/Last-Modified): sem alterações, a publicação anterior é mantida.
+        O XML é lido em blocos e a leitura para assim que aparece a marca d'água ou, se for o
+        caso, uma notícia de outro dia. O feed tem um disjuntor próprio ('<fonte>:feed').
+        
+        Returns:
+            True se o feed bastou para o ciclo; False se a extração deve seguir pela página
+        """
+        url = self.plano.spec.get('feed')
+        if not url or not feed_config['ativo']:
+            return False
+        disjuntor = obter_disjuntor(f"{self.chave_fonte}:feed")
+        if not disjuntor.permitir():
+            print(f"Feed de {self.nome} indisponível (circuito aberto). Usando a página.")
+            return False
+        
+        # Sem a publicação anterior, um 304 não teria o que manter
+        cabecalhos = cabecalhos_condicionais(url) if os.path.exists(self.arquivo_json) else {}
+        try:
+            with obter_sessao_http().get(url, headers=cabecalhos, stream=True,
+                                         timeout=feed_config['timeout']) as resposta:
+                if resposta.status_code == 304:
+                    print(f"Feed de {self.nome} sem alterações desde o ciclo anterior.")
+                    self.alcancou_marca = True  # Publicar de novo as notícias do ciclo anterior
+                    disjuntor.registrar_sucesso()
+                    return True
+                resposta.raise_for_status()
+                
+                leitor = LeitorFeed(resposta)
+                _, encontrou_antiga = self.processar_registros(leitor)
+                if leitor.itens == 0:
+                    raise ValueError("feed sem itens")
+                salvar_validadores_feed(url, resposta)
+        except Exception as e:
+            print(f"Erro ao ler o feed de {self.nome}: {e}. Usando a página.")
+            disjuntor.registrar_falha()
+            return False
+        
+        disjuntor.registrar_sucesso()
+        print(f"Feed de {self.nome}: {leitor.itens} itens lidos, {len(self.noticias)} notícias.")
+        if self.marca_dagua and not self.alcancou_marca and not encontrou_antiga:
+            # Chegaram mais notícias do que o feed comporta: completar pela página até a marca
+            print(f"Feed de {self.nome} não alcançou o ciclo anterior. Completando pela página.")
+            return False
+        return True
+    
+    def extrair_via_sitemap(self):
         """
-        Navega diretamente para a próxima página
+        Extrai as notícias do dia pelo sitemap de notícias (news-sitemap.xml) da fonte, sem paginação
+        
+        O sitemap traz todas as URLs recentes com a data de publicação e é comparado com a leitura
+        anterior (estado_sitemaps.json): só as URLs novas viram registros, as que saíram do sitemap
+        saem da publicação e as demais são mantidas da publicação anterior.
+        
+        Returns:
+            True se o sitemap bastou para o ciclo; False se a extração deve seguir pelo feed ou pela página
         """
+        url = self.plano.spec.get('sitemap')
+        if not url or not sitemap_config['ativo']:
+            return False
+        disjuntor = obter_disjuntor(f"{self.chave_fonte}:sitemap")
+        if not disjuntor.permitir():
+            print(f"Sitemap de {self.nome} indisponível (circuito aberto). Usando o feed ou a página.")
+            return False
+        
+        # Sem a publicação anterior não há o que manter: ler tudo como novo
+        anteriores = None
+        if os.path.exists(self.arquivo_json):
+            with sitemaps_lock, trava_arquivo(sitemap_config['arquivo']):
+                anteriores = carregar_estado_sitemaps().get(self.chave_fonte)
+        if not isinstance(anteriores, dict):
+            anteriores = None
         try:
-            proxima_pagina = pagina_atual + 1
-            url_proxima = f"https://valor.globo.com/ultimas-noticias/index/feed/pagina-{proxima_pagina}"
+            arquivos = self.ler_sitemap(url, anteriores)
+            if all(registros_arquivo is None for registros_arquivo in arquivos.values()):
+                print(f"Sitemap de {self.nome} sem alterações desde o ciclo anterior.")
+                self.alcancou_marca = True  # Publicar de novo as notícias do ciclo anterior
+                disjuntor.registrar_sucesso()
+                return True
             
-            print(f"Navegando para página {proxima_pagina}: {url_proxima}")
-            self.driver.get(url_proxima)
+            # Arquivos sem alterações (304) entram com as URLs da leitura anterior
+            registros = []
+            links_arquivos = {}
+            for endereco, registros_arquivo in arquivos.items():
+                if registros_arquivo is None:
+                    links_arquivos[endereco] = anteriores.get(endereco, [])
+                    continue
+                registros.extend(registros_arquivo)
+                links_arquivos[endereco] = sorted({normalizar_url(registro['link']) for registro in registros_arquivo})
+            atuais = set().union(*links_arquivos.values())
+            if not atuais:
+                raise ValueError("sitemap sem URLs")
             
-            WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "feed-post-body"))
-            )
-            return True
+            # Mais recentes primeiro: a marca d'água e a parada em notícias de outro dia dependem da ordem
+            registros.sort(key=lambda registro: datetime.strptime(f"{registro['data']} {registro['hora']}", "%d/%m/%Y %H:%M")
+                           if registro['data'] else datetime.min, reverse=True)
+            conhecidos = set().union(*anteriores.values()) if anteriores else set()
+            novos = [registro for registro in registros if normalizar_url(registro['link']) not in conhecidos]
+            for registro in novos:
+                registro['categoria'] = self.categoria_do_sitemap(registro)
+            print(f"Sitemap de {self.nome}: {len(atuais)} URLs, {len(novos)} novas, "
+                  f"{len(conhecidos - atuais)} removidas desde a leitura anterior.")
+            
+            self.marca_dagua = set()  # O diff com a leitura anterior substitui a marca d'água
+            self.processar_registros(novos)
+            self.noticias.extend(self.publicacao_anterior_em(atuais))
+            salvar_estado_sitemap(self.chave_fonte, links_arquivos)
         except Exception as e:
-            print(f"Erro ao navegar para a próxima página: {e}")
+            print(f"Erro ao ler o sitemap de {self.nome}: {e}. Usando o feed ou a página.")
+            disjuntor.registrar_falha()
             return False
+        
+        disjuntor.registrar_sucesso()
+        return True
     
-    def extrair_todas_noticias(self, max_paginas=10):  # Reduzido de 15 para 10
+    def ler_sitemap(self, url, anteriores=None):
         """
-        Extrai notícias com parada inteligente quando encontra notícias antigas
+        Baixa e lê o sitemap em blocos; se for um índice, lê também os primeiros sitemaps listados
+        
+        Cada arquivo tem seu próprio GET condicional: um índice sem alterações (304) ainda pode
+        listar sitemaps que mudaram, e esses são lidos de novo pelos endereços da leitura anterior.
+        
+        Args:
+            url: Endereço do sitemap ou do índice de sitemaps
+            anteriores: URLs de cada arquivo na leitura anterior ({endereço: [links]}), ou None
+                        para ler tudo sem GET condicional
+        
+        Returns:
+            Dicionário {endereço: registros do arquivo}, com None nos arquivos sem alterações (304)
         """
-        if not self.driver:
-            self.configurar_driver()
-            
+        sessao = obter_sessao_http()
+        respostas = []
+        
+        def ler_arquivo(endereco):
+            cabecalhos = cabecalhos_condicionais(endereco) if anteriores and endereco in anteriores else {}
+            with sessao.get(endereco, headers=cabecalhos, stream=True, timeout=feed_config['timeout']) as resposta:
+                if resposta.status_code == 304:
+                    return None, None
+                resposta.raise_for_status()
+                leitor = LeitorSitemap(resposta)
+                registros = list(leitor)
+            respostas.append((endereco, resposta))
+            return registros, leitor.sitemaps
+        
+        registros, sitemaps = ler_arquivo(url)
+        if sitemaps is None:
+            # Sem alterações: se era um índice, os sitemaps listados são os da leitura anterior
+            sitemaps = [endereco for endereco in anteriores if endereco != url]
+        arquivos = {url: registros}
+        for endereco in sitemaps[:sitemap_config['max_arquivos']]:
+            arquivos[endereco], _ = ler_arquivo(endereco)
+        
+        # Validadores só depois de todos os arquivos lidos: uma falha no meio repete a leitura completa
+        for endereco, resposta in respostas:
+            salvar_validadores_feed(endereco, resposta)
+        return arquivos
+    
+    def categoria_do_sitemap(self, registro):
+        """
+        Categoria de um registro do sitemap, que não traz a editoria
+        
+        Usa, nesta ordem, os trechos de categorias_url, a primeira palavra-chave (news:keywords)
+        e a primeira seção do caminho da URL (ex.: '/financas/noticia/...' -> 'Financas').
+        """
+        categoria = self.categoria_pela_url(registro['link'])
+        if categoria != "Não especificada":
+            return categoria
+        palavra_chave = registro.get('palavras_chave', '').split(',')[0].strip()
+        if palavra_chave and (not self.plano.categoria_max or len(palavra_chave) <= self.plano.categoria_max):
+            return palavra_chave
+        secoes = [secao for secao in urlparse(registro['link']).path.split('/') if secao]
+        if len(secoes) > 1:
+            return secoes[0].replace('-', ' ').title()
+        return categoria
+    
+    def publicacao_anterior_em(self, links):
+        """
+        Notícias da publicação anterior cujos links (normalizados) ainda estão em 'links'
+        """
+        try:
+            with open(self.arquivo_json, 'r', encoding='utf-8') as f:
+                anteriores = json.load(f)
+        except (OSError, ValueError):
+            return []
+        
+        apenas_data = self.hoje if self.plano.data_antiga == 'parar' else None
+        mantidas = []
+        for noticia in anteriores:
+            titulo = noticia.get('titulo')
+            if titulo in self.titulos_atuais or (apenas_data and noticia.get('data') != apenas_data):
+                continue
+            if normalizar_url(noticia.get('link')) in links:
+                mantidas.append(noticia)
+                self.titulos_atuais.add(titulo)
+        return mantidas
+    
+    def categoria_pela_url(self, link):
+        """
+        Determina a categoria a partir de trechos do caminho da URL da notícia
+        """
+        link_minusculo = link.lower()
+        for trecho, categoria in self.plano.categorias_url.items():
+            if trecho in link_minusculo:
+                return categoria
+        return "Não especificada"
+    
+    def navegar_para_proxima_pagina(self, pagina_atual):
+        """
+        Carrega diretamente a próxima página pela URL e retorna seu HTML (ou None)
+        """
+        proxima_pagina = pagina_atual + 1
+        url_proxima = self.plano.spec['url_pagina'].format(numero=proxima_pagina)
+        
+        print(f"Navegando para página {proxima_pagina} de {self.nome}: {url_proxima}")
+        html = self.obter_pagina(url_proxima)
+        if not html:
+            print(f"Página {proxima_pagina} de {self.nome} não encontrada ou não carregou a tempo. Fim da paginação?")
+        return html
+    
+    def extrair_todas_noticias(self, max_paginas=10, paginas_simultaneas=None):
+        """
+        Extrai notícias das páginas numeradas, com parada inteligente quando encontra notícias
+        antigas ou a marca d'água
+        
+        Args:
+            max_paginas: Número máximo de páginas a verificar
+            paginas_simultaneas: Páginas carregadas ao mesmo tempo (1 = sequencial)
+        """
+        if paginas_simultaneas is None:
+            paginas_simultaneas = self.paginas_simultaneas
+        
         html = self.obter_pagina(self.url)
         if not html:
-            print("Erro: Não foi possível carregar a primeira página.")
+            print(f"Erro: Não foi possível carregar a primeira página de {self.nome}.")
             return
         
-        novas_noticias, encontrou_antiga = self.extrair_noticias(html)
-        print(f"Notícias encontradas até agora: {len(self.noticias)}")
+        _, encontrou_antiga = self.extrair_noticias(html)
+        print(f"Notícias de {self.nome} encontradas até agora: {len(self.noticias)}")
         
         # Se já encontrou notícia antiga na primeira página, não precisa continuar
         if encontrou_antiga:
-            print("Encontradas notícias antigas na primeira página. Parando extração.")
+            print(f"Primeira página de {self.nome} já alcança notícias antigas. Parando extração.")
+            return
+        
+        if 'url_pagina' not in self.plano.spec:
+            # Fonte de página única
             return
         
         pagina_atual = 1
         paginas_sem_noticias = 0
         
-        while pagina_atual < max_paginas and paginas_sem_noticias < 2:  # Para após 2 páginas sem notícias
-            if not self.navegar_para_proxima_pagina(pagina_atual):
-                break
-            
-            html = self.obter_pagina(self.driver.current_url)
+        def processar_pagina(numero, html):
+            nonlocal pagina_atual, paginas_sem_noticias
             if not html:
-                paginas_sem_noticias += 1
-                pagina_atual += 1
-                continue
+                return False
             
             novas_noticias, encontrou_antiga = self.extrair_noticias(html)
+            pagina_atual = numero
             
             if encontrou_antiga:
-                print(f"Encontradas notícias antigas na página {pagina_atual + 1}. Parando extração.")
-                break
-                
+                print(f"Encontradas notícias antigas na página {numero} de {self.nome}. Parando extração.")
+                return False
+            
             if novas_noticias == 0:
                 paginas_sem_noticias += 1
+                print(f"Nenhuma nova notícia na página {numero} de {self.nome}. Tentativa {paginas_sem_noticias}/2")
             else:
                 paginas_sem_noticias = 0
-                
-            print(f"Notícias encontradas até agora: {len(self.noticias)}")
-            pagina_atual += 1
+                print(f"Notícias de {self.nome} encontradas até agora: {len(self.noticias)}")
+            return paginas_sem_noticias < 2  # Para após 2 páginas sem notícias
+        
+        # Páginas 2..N carregadas em paralelo, processadas em ordem
+        paginar_em_paralelo(
+            lambda numero: self.navegar_para_proxima_pagina(numero - 1),
+            range(2, max_paginas + 1),
+            processar_pagina,
+            paginas_simultaneas,
+            prazo=self.prazo
+        )
         
-        print(f"Extração do Valor Econômico finalizada após verificar {pagina_atual} páginas. Total: {len(self.noticias)} notícias")
+        print(f"Extração de {self.nome} finalizada após verificar {pagina_atual} páginas. Total: {len(self.noticias)} notícias")
     
-    def salvar_noticias(self, formato='json'):
+    def extrair_registros_no_navegador(self, inicio):
+        """
+        Executa o extrator JS na página e retorna os registros a partir do item 'inicio'
         """
-        Salva as notícias extraídas em diferentes formatos
+        resultado = self.driver.execute_script(self.plano.spec['extrator_js'], inicio)
+        self.cursor_dom = resultado['total']
+        return resultado['registros']
+    
+    def obter_novos_itens(self):
+        """
+        Retorna os itens adicionados desde a última leitura (registros extraídos no navegador)
+        ou, sem extração no navegador, a página inteira
+        """
+        if self.extracao_no_navegador:
+            cursor = self.cursor_dom
+            registros = self.extrair_registros_no_navegador(cursor)
+            if self.cursor_dom < cursor:
+                # A lista foi redesenhada: reprocessar todos os itens
+                registros = self.extrair_registros_no_navegador(0)
+            return registros
+        
+        return self.driver.page_source
+    
+    def salvar_noticias(self):
         """
+        Salva as notícias extraídas em formato JSON e retorna o DataFrame publicado
+        """
+        # Completar com o ciclo anterior se a paginação parou na marca d'água
+        # (fontes que param em notícias de outro dia só aproveitam as de hoje)
+        apenas_data = self.hoje if self.plano.data_antiga == 'parar' else None
+        self.noticias = finalizar_marca_dagua(self, apenas_data=apenas_data)
+        
         # Verificar se temos notícias
         if not self.noticias:
-            print("Nenhuma notícia foi encontrada para salvar.")
-            df = pd.DataFrame(columns=['titulo', 'categoria', 'fonte', 'data', 'hora', 'link'])
-            return df
-            
+            print(f"Nenhuma notícia de {self.nome} foi encontrada para salvar.")
+            return pd.DataFrame(columns=COLUNAS_NOTICIA)
+        
         # Criar DataFrame das notícias
         df = pd.DataFrame(self.noticias)
         
@@ -299,18 +2781,28 @@ class ValorEconomicoScraper:
                 df = df.sort_values(by='data_hora', ascending=False)
                 df = df.drop('data_hora', axis=1)
             except Exception as e:
-                print(f"Erro ao ordenar por hora: {e}")
+                print(f"Erro ao ordenar notícias de {self.nome} por hora: {e}")
         
         # Salvar em formato JSON
         try:
-            df.to_json('noticias_valor.json', orient='records', force_ascii=False)
+            df.to_json(self.arquivo_json, orient='records', force_ascii=False)
+            print(f"Dados de {self.nome} salvos em {self.arquivo_json}")
         except Exception as e:
-            print(f"Erro ao salvar JSON: {e}")
-            
-        # Gerar arquivo HTML
-        self.gerar_html_otimizado(df)
+            print(f"Erro ao salvar JSON de {self.nome}: {e}")
         
         return df
+
+class ValorEconomicoScraper(ScraperFonte):
+    chave_fonte = 'valor'
+    
+    def salvar_noticias(self, formato='json'):
+        """
+        Salva as notícias extraídas em JSON e gera a página HTML só do Valor
+        """
+        df = super().salvar_noticias()
+        if not df.empty:
+            self.gerar_html_otimizado(df)
+        return df
     
     def gerar_html_otimizado(self, df):
         """
@@ -557,152 +3049,181 @@ class ValorEconomicoScraper:
                 pass
             return False
 
-class EstadaoScraper:
+class EstadaoScraper(ScraperFonte):
+    chave_fonte = 'estadao'
+    
+    # Requisição usada pelo botão 'Carregar mais' (descoberta uma vez por processo)
+    endpoint_carregar_mais = None
+    
     def __init__(self):
-        self.url = "https://www.estadao.com.br/ultimas/"
-        self.noticias = []
-        self.hoje = datetime.now().strftime("%d/%m/%Y")
-        self.titulos_atuais = set()
-        self.driver = None
+        super().__init__()
+        self.modo_xhr = True  # Replicar a requisição do botão 'Carregar mais' em vez de clicar
     
-    def configurar_driver(self):
+    def registros_soup(self, soup):
         """
-        Obtém um driver do pool
+        Monta os registros com o BeautifulSoup em uma única passada em ordem de documento
+        
+        A mesma varredura separa os links da lista e os spans de data; cada span é atribuído
+        aos divs ancestrais que ainda não têm data, o que equivale a find_parent('div') seguido
+        de find('span', class_='date') sem percorrer o documento de novo a cada item.
         """
-        print("Configurando o driver do Microsoft Edge...")
-        self.driver = obter_driver()
-        return self.driver
+        artigos = []
+        data_por_div = {}
+        for no in soup.find_all(self.eh_item_ou_data):
+            if no.name == 'a':
+                artigos.append(no)
+                continue
+            pai = no.parent
+            while pai is not None and not (pai.name == 'div' and id(pai) in data_por_div):
+                if pai.name == 'div':
+                    data_por_div[id(pai)] = no
+                pai = pai.parent
+        print(f"Encontrados {len(artigos)} artigos na página")
+        
+        registros = []
+        categoria_anterior = None
+        for artigo in artigos:
+            categoria = artigo.text.strip()
+            # O texto do item anterior da lista equivale ao find_previous do mesmo seletor
+            repetida = bool(categoria) and categoria == categoria_anterior
+            categoria_anterior = categoria
+            
+            titulo = artigo.get('title', '').strip()
+            if not titulo:
+                continue
+            
+            # Remover duplicatas de categorias
+            if repetida:
+                continue
+            
+            # Encontrar a data e hora no div mais próximo ou no irmão seguinte
+            data_element = None
+            parent_div = artigo.parent
+            while parent_div is not None and parent_div.name != 'div':
+                parent_div = parent_div.parent
+            if parent_div is not None:
+                data_element = data_por_div.get(id(parent_div))
+            
+            if not data_element:
+                next_element = artigo.find_next_sibling()
+                if next_element and next_element.name == 'span' and 'date' in next_element.get('class', []):
+                    data_element = next_element
+            
+            registros.append({
+                'titulo': titulo,
+                'link': artigo.get('href', '#'),
+                'categoria': categoria,
+                'datetime': data_element.text.strip() if data_element else ''
+            })
+        
+        return registros
     
-    def fechar_driver(self):
+    @staticmethod
+    def eh_item_ou_data(tag):
         """
-        Retorna o driver para o pool
+        Filtro do find_all: links da lista de últimas e spans de data
         """
-        if self.driver:
-            retornar_driver(self.driver)
-            self.driver = None
-            print("Driver do Edge retornado ao pool.")
+        if tag.name == 'a':
+            return tag.get('data-component-name') == 'lista-ultimas'
+        return tag.name == 'span' and 'date' in tag.get('class', [])
     
-    def obter_pagina(self, url):
+    def registros_selectolax(self, arvore):
         """
-        Carrega a página usando o Selenium com timeout otimizado e retry
+        Monta os registros com o selectolax (mesmo resultado de registros_soup, também em
+        uma única passada)
         """
-        try:
-            if not carregar_pagina_com_retry(self.driver, url):
-                return None
+        artigos = []
+        data_por_div = {}
+        for no in arvore.css("a[data-component-name='lista-ultimas'], span.date"):
+            if no.tag == 'a':
+                artigos.append(no)
+                continue
+            pai = no.parent
+            while pai is not None and not (pai.tag == 'div' and pai.mem_id in data_por_div):
+                if pai.tag == 'div':
+                    data_por_div[pai.mem_id] = no
+                pai = pai.parent
+        print(f"Encontrados {len(artigos)} artigos na página")
+        
+        registros = []
+        categoria_anterior = None
+        for artigo in artigos:
+            categoria = texto_no(artigo)
+            repetida = bool(categoria) and categoria == categoria_anterior
+            categoria_anterior = categoria
             
-            # Aguardar o carregamento dos elementos principais com timeout menor
-            WebDriverWait(self.driver, 8).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "a[data-component-name='lista-ultimas']"))
-            )
+            titulo = (artigo.attributes.get('title') or '').strip()
+            if not titulo:
+                continue
             
-            return self.driver.page_source
-        except Exception as e:
-            print(f"Erro ao aguardar elementos da página: {e}")
-            return None
+            # Remover duplicatas de categorias
+            if repetida:
+                continue
+            
+            # Encontrar a data e hora no div mais próximo ou no irmão seguinte
+            data_element = None
+            pai = artigo.parent
+            while pai is not None and pai.tag != 'div':
+                pai = pai.parent
+            if pai is not None:
+                data_element = data_por_div.get(pai.mem_id)
+            
+            if data_element is None:
+                irmao = artigo.next
+                while irmao is not None and irmao.tag in ('-text', '-comment'):
+                    irmao = irmao.next
+                if irmao is not None and irmao.tag == 'span' and 'date' in (irmao.attributes.get('class') or '').split():
+                    data_element = irmao
+            
+            registros.append({
+                'titulo': titulo,
+                'link': artigo.attributes.get('href', '#'),
+                'categoria': categoria,
+                'datetime': texto_no(data_element)
+            })
+        
+        return registros
     
-    def extrair_noticias(self, html):
+    def extrair_noticias_json(self, dados):
         """
-        Extrai as notícias do HTML usando BeautifulSoup com parada inteligente
-        """
-        if not html:
-            return 0, False
-            
-        soup = BeautifulSoup(html, 'html.parser')
-        artigos = soup.find_all('a', attrs={'data-component-name': 'lista-ultimas'})
-        print(f"Encontrados {len(artigos)} artigos na página")
+        Extrai as notícias de uma resposta JSON do endpoint de 'Carregar mais' (formato Arc)
         
-        data_atual = self.hoje
-        novas_noticias = 0
-        noticias_batch = []
-        encontrou_noticia_antiga = False
+        Returns:
+            Tupla (novas_noticias, encontrou_noticia_antiga, itens_recebidos)
+        """
+        if isinstance(dados, dict):
+            itens = dados.get('content_elements') or dados.get('items') or dados.get('data') or []
+        else:
+            itens = dados or []
         
-        for artigo in artigos:
+        registros = []
+        for item in itens:
             try:
-                titulo = artigo.get('title', '').strip()
-                if not titulo:
-                    continue
-                
-                if titulo in self.titulos_atuais:
-                    continue
-                    
-                link = artigo.get('href', '#')
-                categoria = artigo.text.strip()
-                
-                # Remover duplicatas de categorias
-                if categoria and artigo.find_previous('a', attrs={'data-component-name': 'lista-ultimas'}) and artigo.find_previous('a', attrs={'data-component-name': 'lista-ultimas'}).text.strip() == categoria:
-                    continue
-                
-                # Mapear categoria baseado na URL se necessário
-                if not categoria or categoria == "" or len(categoria) > 30:
-                    url_categories = {
-                        '/politica/': 'Política',
-                        '/economia/': 'Economia',
-                        '/esportes/': 'Esportes',
-                        '/cultura/': 'Cultura',
-                        '/internacional/': 'Internacional',
-                        '/brasil/': 'Brasil',
-                        '/tecnologia/': 'Tecnologia',
-                        '/futebol/': 'Futebol',
-                        '/sao-paulo/': 'São Paulo',
-                        '/opiniao/': 'Opinião'
-                    }
-                    
-                    categoria_encontrada = False
-                    for url_path, cat_name in url_categories.items():
-                        if url_path in link.lower():
-                            categoria = cat_name
-                            categoria_encontrada = True
-                            break
-                    
-                    if not categoria_encontrada:
-                        categoria = "Não especificada"
-                
-                # Encontrar a data e hora
-                data_element = None
-                parent_div = artigo.find_parent('div')
-                if parent_div:
-                    data_element = parent_div.find('span', class_='date')
-                
-                if not data_element:
-                    next_element = artigo.find_next_sibling()
-                    if next_element and next_element.name == 'span' and 'date' in next_element.get('class', []):
-                        data_element = next_element
-                
-                if not data_element:
+                if not isinstance(item, dict):
                     continue
                 
-                data_hora_texto = data_element.text.strip()
-                data_match = re.search(r'(\d{2}/\d{2}/\d{4}),\s*(\d{1,2})h(\d{2})', data_hora_texto)
-                
-                if data_match:
-                    data = data_match.group(1)
-                    hora = f"{data_match.group(2)}:{data_match.group(3)}"
-                    
-                    if data != data_atual:
-                        # Encontrou notícia antiga - sinalizar para parar
-                        encontrou_noticia_antiga = True
-                        break
-                    
-                    noticias_batch.append({
-                        'titulo': titulo,
-                        'categoria': categoria,
-                        'fonte': 'Estadão',
-                        'data': data,
-                        'hora': hora,
-                        'link': link
-                    })
-                    self.titulos_atuais.add(titulo)
-                    novas_noticias += 1
-                    
+                link = item.get('canonical_url') or item.get('website_url') or item.get('url') or '#'
+                taxonomia = item.get('taxonomy') or {}
+                secao = taxonomia.get('primary_section') or {}
+                if not secao and taxonomia.get('sections'):
+                    secao = taxonomia['sections'][0]
+                data, hora = converter_data_iso(
+                    item.get('display_date') or item.get('first_publish_date') or item.get('publish_date')
+                )
+                # Data e hora já convertidas: processar_registros dispensa o 'datetime'
+                registros.append({
+                    'titulo': ((item.get('headlines') or {}).get('basic') or item.get('title') or '').strip(),
+                    'link': urljoin("https://www.estadao.com.br/", link),
+                    'categoria': (secao.get('name') or '').strip(),
+                    'data': data,
+                    'hora': hora
+                })
             except Exception as e:
-                print(f"Erro ao processar artigo: {e}")
+                print(f"Erro ao processar item JSON do Estadão: {e}")
                 continue
         
-        if noticias_batch:
-            self.noticias.extend(noticias_batch)
-            print(f"Adicionadas {novas_noticias} novas notícias do Estadão")
-                
-        return novas_noticias, encontrou_noticia_antiga
+        novas_noticias, encontrou_noticia_antiga = self.processar_registros(registros)
+        return novas_noticias, encontrou_noticia_antiga, len(itens)
     
     def obter_categoria_da_pagina(self, url):
         """
@@ -713,7 +3234,7 @@ class EstadaoScraper:
             self.driver.get(url)
             
             # Aguardar carregamento
-            time.sleep(2)
+            aguardar_pagina_pronta(self.driver, timeout=2, nome="estadao_categoria")
             
             # Tentar várias estratégias para encontrar a categoria
             try:
@@ -754,9 +3275,11 @@ class EstadaoScraper:
         Clica no botão 'Carregar mais notícias' para exibir mais artigos
         """
         try:
+            # Quantidade de artigos antes do clique, para detectar quando os novos chegarem
+            artigos_antes = contar_elementos(self.driver, self.seletor_artigos)
+            
             # Rolar até o final da página para garantir que o botão seja visível
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)  # Aguardar o scroll terminar
             
             # Tenta remover banners ou elementos que possam estar bloqueando
             try:
@@ -809,7 +3332,6 @@ class EstadaoScraper:
             
             # Rolar um pouco para cima para evitar a barra de navegação
             self.driver.execute_script("window.scrollBy(0, -150);")
-            time.sleep(0.5)
             
             # Tentar clicar diretamente no botão
             try:
@@ -821,17 +3343,172 @@ class EstadaoScraper:
                 print("Tentando clicar via JavaScript...")
                 self.driver.execute_script("arguments[0].click();", botao)
             
-            # Aguardar o carregamento de novos artigos
-            time.sleep(2)
+            # Aguardar o carregamento de novos artigos (retorna assim que chegarem)
+            if aguardar_mais_elementos(self.driver, self.seletor_artigos, artigos_antes, timeout=10, nome="estadao_carregar_mais") is None:
+                print("Nenhum artigo novo apareceu após o clique no Estadão")
             
             return True
         except Exception as e:
             print(f"Erro ao clicar no botão 'Carregar mais notícias': {e}")
             return False
     
+    def descobrir_endpoint_carregar_mais(self):
+        """
+        Clica uma vez no botão 'Carregar mais' e identifica a requisição XHR/fetch disparada
+        
+        Returns:
+            Tupla (url_modelo, offset_inicial, tamanho) ou None se não for possível identificar
+        """
+        try:
+            self.driver.execute_script("performance.clearResourceTimings();")
+        except Exception:
+            pass
+        
+        if not self.clicar_carregar_mais():
+            return None
+        
+        try:
+            urls = self.driver.execute_script("""
+                return performance.getEntriesByType('resource')
+                    .filter(function(e) { return e.initiatorType === 'xmlhttprequest' || e.initiatorType === 'fetch'; })
+                    .map(function(e) { return e.name; });
+            """) or []
+        except Exception as e:
+            print(f"Erro ao ler as requisições do Estadão: {e}")
+            return None
+        
+        # A requisição mais recente com parâmetro de deslocamento é a do botão
+        for url in reversed(urls):
+            endpoint = self.analisar_endpoint(url)
+            if endpoint:
+                print(f"Endpoint de 'Carregar mais' do Estadão identificado: {endpoint[0]}")
+                return endpoint
+        
+        print("Não foi possível identificar a requisição de 'Carregar mais' do Estadão.")
+        return None
+    
+    def analisar_endpoint(self, url):
+        """
+        Identifica na URL o parâmetro de deslocamento (offset/from/start), direto ou dentro do JSON 'query'
+        
+        Returns:
+            Tupla (url_modelo, offset_inicial, tamanho) ou None
+        """
+        params = dict(parse_qsl(urlparse(url).query, keep_blank_values=True))
+        candidatos = [params]
+        if params.get('query', '').startswith('{'):
+            try:
+                candidatos.insert(0, json.loads(params['query']))
+            except ValueError:
+                pass
+        
+        for valores in candidatos:
+            for chave in ('offset', 'from', 'start'):
+                if str(valores.get(chave, '')).isdigit():
+                    offset = int(valores[chave])
+                    tamanho = next((int(valores[k]) for k in ('size', 'limit', 'count') if str(valores.get(k, '')).isdigit()), 0)
+                    # Sem tamanho explícito, o primeiro deslocamento equivale ao tamanho da página
+                    return url, offset, tamanho or offset
+        return None
+    
+    def montar_url_offset(self, url_modelo, offset):
+        """
+        Gera a URL do endpoint de 'Carregar mais' para o deslocamento informado
+        """
+        partes = urlparse(url_modelo)
+        params = parse_qsl(partes.query, keep_blank_values=True)
+        novos_params = []
+        for chave, valor in params:
+            if chave == 'query' and valor.startswith('{'):
+                try:
+                    consulta = json.loads(valor)
+                    for campo in ('offset', 'from', 'start'):
+                        if campo in consulta:
+                            consulta[campo] = offset
+                    valor = json.dumps(consulta, separators=(',', ':'))
+                except ValueError:
+                    pass
+            elif chave in ('offset', 'from', 'start'):
+                valor = str(offset)
+            novos_params.append((chave, valor))
+        return urlunparse(partes._replace(query=urlencode(novos_params)))
+    
+    def extrair_via_xhr(self, max_paginas):
+        """
+        Carrega os próximos blocos de notícias chamando diretamente o endpoint do botão,
+        em paralelo, e processa apenas os fragmentos retornados
+        
+        Returns:
+            True se a extração foi feita por este modo, False para usar os cliques
+        """
+        if not EstadaoScraper.endpoint_carregar_mais:
+            EstadaoScraper.endpoint_carregar_mais = self.descobrir_endpoint_carregar_mais()
+        if not EstadaoScraper.endpoint_carregar_mais:
+            return False
+        
+        url_modelo, offset_inicial, tamanho = EstadaoScraper.endpoint_carregar_mais
+        sessao = obter_sessao_http()
+        
+        def carregar_bloco(numero):
+            url = self.montar_url_offset(url_modelo, offset_inicial + (numero - 1) * tamanho)
+            timeout = self.prazo.limitar(10) if self.prazo else 10
+            resposta = sessao.get(url, timeout=timeout, headers={'Referer': self.url})
+            resposta.raise_for_status()
+            return texto_resposta(resposta)
+        
+        blocos_sem_noticias = 0
+        falhou = False
+        
+        def processar_bloco(numero, conteudo):
+            nonlocal blocos_sem_noticias, falhou
+            if not conteudo:
+                falhou = numero == 1
+                return False
+            
+            conteudo = conteudo.strip()
+            try:
+                if conteudo.startswith('{') or conteudo.startswith('['):
+                    novas_noticias, encontrou_antiga, itens = self.extrair_noticias_json(json.loads(conteudo))
+                else:
+                    # Fragmento HTML: analisar apenas o trecho retornado. O fim da lista depende dos
+                    # itens recebidos, não dos novos: um bloco só de notícias já vistas não é o fim
+                    registros = self.extrair_registros_html(conteudo)
+                    novas_noticias, encontrou_antiga = self.processar_registros(registros)
+                    itens = len(registros)
+            except Exception as e:
+                # Resposta em formato inesperado (JSON inválido ou outra estrutura): voltar aos cliques
+                print(f"Erro ao processar o bloco {numero} do Estadão: {e}")
+                falhou = True
+                return False
+            
+            if encontrou_antiga:
+                print(f"Encontradas notícias antigas no bloco {numero} do Estadão. Parando extração.")
+                return False
+            if itens == 0:
+                print(f"Bloco {numero} do Estadão veio vazio. Fim da lista.")
+                return False
+            
+            blocos_sem_noticias = 0 if novas_noticias else blocos_sem_noticias + 1
+            print(f"Notícias do Estadão encontradas até agora: {len(self.noticias)}")
+            return blocos_sem_noticias < 2
+        
+        blocos = paginar_em_paralelo(carregar_bloco, range(1, max_paginas + 1), processar_bloco,
+                                     self.paginas_simultaneas, prazo=self.prazo)
+        
+        if falhou:
+            # Endpoint deixou de responder ou mudou de formato: descartar e voltar aos cliques
+            EstadaoScraper.endpoint_carregar_mais = None
+            return False
+        
+        print(f"Extração do Estadão finalizada após {blocos} requisições diretas. Total: {len(self.noticias)} notícias")
+        return True
+    
     def extrair_todas_noticias(self, max_cliques=8):  # Reduzido de 10 para 8
         """
         Extrai notícias com parada inteligente quando encontra notícias antigas
+        
+        Com modo_xhr ativo, os blocos seguintes são obtidos direto do endpoint do botão
+        'Carregar mais'; os cliques no navegador ficam como alternativa.
         """
         if not self.driver:
             self.configurar_driver()
@@ -849,18 +3526,22 @@ class EstadaoScraper:
             print("Encontradas notícias antigas na primeira página do Estadão. Parando extração.")
             return
         
+        if self.modo_xhr and self.extrair_via_xhr(max_cliques):
+            return
+        
         cliques_realizados = 0
         cliques_sem_noticias = 0
         
         while cliques_realizados < max_cliques and cliques_sem_noticias < 2:  # Para após 2 cliques sem notícias
+            if self.prazo and self.prazo.expirado():
+                print("Prazo do Estadão esgotado. Publicando o que já foi extraído.")
+                break
+            
             if not self.clicar_carregar_mais():
                 print("Não foi possível clicar em 'Carregar mais' ou botão não encontrado.")
                 break
             
-            # Aguardar carregamento das novas notícias
-            time.sleep(2)  # Reduzido de 3 para 2 segundos
-            
-            html = self.driver.page_source
+            html = self.obter_novos_itens()
             novas_noticias, encontrou_antiga = self.extrair_noticias(html)
             
             if encontrou_antiga:
@@ -877,372 +3558,252 @@ class EstadaoScraper:
             cliques_realizados += 1
         
         print(f"Extração do Estadão finalizada após {cliques_realizados} cliques. Total: {len(self.noticias)} notícias")
-    
-    def salvar_noticias(self):
-        """
-        Salva as notícias extraídas em formato JSON
-        """
-        # Verificar se temos notícias
-        if not self.noticias:
-            print("Nenhuma notícia foi encontrada para salvar.")
-            df = pd.DataFrame(columns=['titulo', 'categoria', 'fonte', 'data', 'hora', 'link'])
-            return df
-            
-        # Criar DataFrame das notícias
-        df = pd.DataFrame(self.noticias)
-        
-        # Remover duplicatas
-        df = df.drop_duplicates(subset=['titulo'])
-        
-        # Ordenar por hora (mais recente primeiro)
-        if 'hora' in df.columns:
-            try:
-                df['data_hora'] = pd.to_datetime(df['data'] + ' ' + df['hora'], format='%d/%m/%Y %H:%M', errors='coerce')
-                df = df.sort_values(by='data_hora', ascending=False)
-                df = df.drop('data_hora', axis=1)
-            except Exception as e:
-                print(f"Erro ao ordenar por hora: {e}")
-        
-        # Salvar em formato JSON
-        try:
-            df.to_json('noticias_estadao.json', orient='records', force_ascii=False)
-            print(f"Dados salvos em noticias_estadao.json")
-        except Exception as e:
-            print(f"Erro ao salvar JSON: {e}")
-            
-        return df
 
-class FolhaScraper:
-    def __init__(self):
-        self.url = "https://www1.folha.uol.com.br/ultimas-noticias/"
-        self.noticias = []
-        self.hoje = datetime.now().strftime("%d/%m/%Y")
-        self.titulos_atuais = set()
-        self.driver = None
-    
-    def configurar_driver(self):
-        """
-        Obtém um driver do pool
-        """
-        print("Configurando o driver do Microsoft Edge...")
-        self.driver = obter_driver()
-        return self.driver
+class FolhaScraper(ScraperFonte):
+    chave_fonte = 'folha'
     
-    def fechar_driver(self):
-        """
-        Retorna o driver para o pool
-        """
-        if self.driver:
-            retornar_driver(self.driver)
-            self.driver = None
-            print("Driver do Edge retornado ao pool.")
+    # Padrões compilados uma vez para todas as páginas
+    padrao_link_noticia = re.compile(r"folha\.uol\.com\.br/.*\.shtml")
+    padrao_link_editoria = re.compile(r"folha\.uol\.com\.br/[^/]+/$")
+    padrao_topico = re.compile(r"folha\.uol\.com\.br/folha-topicos/([^/]+)/")
+    padrao_editoria = re.compile(r"folha\.uol\.com\.br/([^/]+)/")
     
-    def obter_pagina(self, url):
-        """
-        Carrega a página usando o Selenium e retorna o conteúdo HTML
-        """
-        try:
-            print(f"Carregando a página da Folha: {url}")
-            self.driver.get(url)
-            
-            # Aguardar o carregamento dos elementos principais
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "c-main-headline__title"))
-            )
-            
-            # Retornar o HTML da página
-            return self.driver.page_source
-        except Exception as e:
-            print(f"Erro ao carregar página da Folha: {e}")
-            return None
+    def __init__(self):
+        super().__init__()
+        self.seletor_botao = "button.c-button--expand[data-pagination-trigger]"
     
-    def extrair_noticias(self, html):
+    def registros_soup(self, soup):
         """
-        Extrai as notícias do HTML usando BeautifulSoup
+        Monta os registros com o BeautifulSoup
         """
-        if not html:
-            return 0
-            
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Data atual para filtrar notícias
-        data_atual = self.hoje
-        
-        novas_noticias = 0
-        noticias_batch = []
+        registros = []
         
         # 1. Encontrar a notícia principal (main headline)
         main_headline = soup.find('a', class_='c-main-headline__url')
         if main_headline:
-            try:
-                # Extrair título diretamente
-                titulo_element = main_headline.find('h2', class_='c-main-headline__title')
-                if titulo_element:
-                    titulo = titulo_element.text.strip()
-                    
-                    # Verificar se o título já existe
-                    if titulo not in self.titulos_atuais:
-                        # Extrair link diretamente do atributo href
-                        link = main_headline['href']
-                        
-                        # Determinar a fonte
-                        fonte = 'Folha de S.Paulo'
-                        
-                        # Extrair categoria - procurar no elemento principal ou na URL
-                        categoria = "Não especificada"
-                        
-                        # Primeiro, tentar encontrar a categoria no link da editoria
-                        section_element = None
-                        parent_section = main_headline.find_parent('section')
-                        if parent_section:
-                            # Buscar link de editoria direto na seção
-                            section_element = parent_section.find('a', href=re.compile(r"folha\.uol\.com\.br/[^/]+/$"))
-                        
-                        if section_element:
-                            # Extrair o texto direto
-                            categoria_text = section_element.get_text().strip()
-                            # Remover comentários HTML
-                            categoria = re.sub(r'<!--.*?-->', '', categoria_text).strip()
-                            print(f"Categoria encontrada para notícia principal: '{categoria}'")
-                        else:
-                            # Se não encontrou, usar método padrão baseado na URL
-                            url_match = re.search(r'folha\.uol\.com\.br/([^/]+)/', link)
-                            if url_match:
-                                categoria_url = url_match.group(1)
-                                # Mapear categorias da URL
-                                categorias_map = {
-                                    'poder': 'Política',
-                                    'mercado': 'Economia', 
-                                    'cotidiano': 'Cotidiano',
-                                    'mundo': 'Mundo',
-                                    'esporte': 'Esporte',
-                                    'ilustrada': 'Cultura',
-                                    'f5': 'Entretenimento',
-                                    'ambiente': 'Ambiente',
-                                    'ciencia': 'Ciência',
-                                    'equilibrioesaude': 'Saúde',
-                                    'educacao': 'Educação',
-                                    'tecnologia': 'Tecnologia',
-                                    'ilustrissima': 'Ilustríssima',
-                                    'comida': 'Gastronomia',
-                                    'tec': 'Tecnologia',
-                                    'podcasts': 'Podcasts',
-                                    'folhinha': 'Folhinha',
-                                    'empreendedorismo': 'Empreendedorismo'
-                                }
-                                categoria = categorias_map.get(categoria_url, categoria_url.replace('-', ' ').title())
-                        
-                        # Extrair data e hora da notícia principal
-                        data_element = main_headline.find('time', class_='c-headline__dateline')
-                        if data_element:
-                            data_hora_texto = data_element.text.strip()
-                            
-                            # Extrair data e hora do formato "25.abr.2025 às 12h22"
-                            data_match = re.search(r'(\d{2})\.(\w{3})\.(\d{4})\s+às\s+(\d{1,2})h(\d{2})', data_hora_texto)
-                            if data_match:
-                                dia = data_match.group(1)
-                                mes_texto = data_match.group(2).lower()
-                                ano = data_match.group(3)
-                                hora = data_match.group(4)
-                                minuto = data_match.group(5)
-                                
-                                # Converter nome do mês para número
-                                meses = {
-                                    'jan': '01', 'fev': '02', 'mar': '03', 'abr': '04',
-                                    'mai': '05', 'jun': '06', 'jul': '07', 'ago': '08',
-                                    'set': '09', 'out': '10', 'nov': '11', 'dez': '12'
-                                }
-                                
-                                if mes_texto in meses:
-                                    mes = meses[mes_texto]
-                                    data_formatada = f"{dia}/{mes}/{ano}"
-                                    hora_formatada = f"{hora}:{minuto}"
-                                    
-                                    # Adicionar à lista
-                                    noticias_batch.append({
-                                        'titulo': titulo,
-                                        'categoria': categoria,
-                                        'fonte': fonte,
-                                        'data': data_formatada,
-                                        'hora': hora_formatada,
-                                        'link': link
-                                    })
-                                    self.titulos_atuais.add(titulo)
-                                    novas_noticias += 1
-                                    print(f"Notícia principal adicionada: {titulo[:50]}...")
-            except Exception as e:
-                print(f"Erro ao processar notícia principal da Folha: {e}")
+            titulo_element = main_headline.find('h2', class_='c-main-headline__title')
+            if titulo_element:
+                # Primeiro, tentar encontrar a categoria no link da editoria
+                categoria = ''
+                parent_section = main_headline.find_parent('section')
+                if parent_section:
+                    # Buscar link de editoria direto na seção
+                    section_element = parent_section.find('a', href=self.padrao_link_editoria)
+                    if section_element:
+                        # Remover comentários HTML do texto
+                        categoria = re.sub(r'<!--.*?-->', '', section_element.get_text().strip()).strip()
+                        print(f"Categoria encontrada para notícia principal: '{categoria}'")
+                
+                data_element = main_headline.find('time', class_='c-headline__dateline')
+                registros.append({
+                    'titulo': titulo_element.text.strip(),
+                    'link': main_headline.get('href'),
+                    'categoria': categoria,
+                    'datetime': data_element.text.strip() if data_element else '',
+                    'principal': True
+                })
         
-        # 2. Encontrar as notícias secundárias (headlines normais)
-        artigos = soup.find_all('a', href=re.compile(r"folha\.uol\.com\.br/.*\.shtml"))
+        # 2. Encontrar as notícias secundárias (headlines normais), com as categorias indexadas
+        artigos, categorias = self.indexar_categorias(soup)
         print(f"Encontrados {len(artigos)} artigos na página da Folha")
-        
-        for artigo in artigos:
-            try:
-                # Verificar se é um link de notícia válido (contém título)
-                titulo_element = artigo.find('h2', class_='c-headline__title')
-                if not titulo_element:
-                    # Talvez seja a notícia principal que já processamos
-                    continue
-                
-                # Extrair título
-                titulo = titulo_element.text.strip()
-                
-                # Verificar se o título já existe na lista de notícias
-                if titulo in self.titulos_atuais:
-                    continue
-                
-                # Extrair link
-                link = artigo['href']
-                
-                # Determinar a fonte
-                fonte = 'Folha de S.Paulo'
-                
-                # Extrair categoria - método melhorado
-                categoria = self.extrair_categoria_folha(artigo, link)
-                
-                # Extrair data e hora
-                data_element = artigo.find('time', class_='c-headline__dateline')
-                if not data_element:
-                    continue
-                
-                data_hora_texto = data_element.text.strip()
-                
-                # Extrair data e hora do formato "25.abr.2025 às 12h22"
-                data_match = re.search(r'(\d{2})\.(\w{3})\.(\d{4})\s+às\s+(\d{1,2})h(\d{2})', data_hora_texto)
-                if data_match:
-                    dia = data_match.group(1)
-                    mes_texto = data_match.group(2).lower()
-                    ano = data_match.group(3)
-                    hora = data_match.group(4)
-                    minuto = data_match.group(5)
-                    
-                    # Converter nome do mês para número
-                    meses = {
-                        'jan': '01', 'fev': '02', 'mar': '03', 'abr': '04',
-                        'mai': '05', 'jun': '06', 'jul': '07', 'ago': '08',
-                        'set': '09', 'out': '10', 'nov': '11', 'dez': '12'
-                    }
-                    
-                    if mes_texto in meses:
-                        mes = meses[mes_texto]
-                        data_formatada = f"{dia}/{mes}/{ano}"
-                        hora_formatada = f"{hora}:{minuto}"
-                        
-                        # Verificar se a notícia é do dia atual
-                        # Para teste, vamos pegar todas as notícias, independente da data
-                        # if data_formatada != data_atual:
-                        #     continue
-                        
-                        # Adicionar à lista temporária
-                        noticias_batch.append({
-                            'titulo': titulo,
-                            'categoria': categoria,
-                            'fonte': fonte,
-                            'data': data_formatada,
-                            'hora': hora_formatada,
-                            'link': link
-                        })
-                        self.titulos_atuais.add(titulo)
-                        novas_noticias += 1
-            except Exception as e:
-                print(f"Erro ao processar artigo da Folha: {e}")
+        
+        for artigo in artigos:
+            # Verificar se é um link de notícia válido (contém título)
+            titulo_element = artigo.find('h2', class_='c-headline__title')
+            if not titulo_element:
+                # Talvez seja a notícia principal que já processamos
+                continue
+            
+            titulo = titulo_element.text.strip()
+            
+            # Títulos já conhecidos não precisam de registro
+            if titulo in self.titulos_atuais:
                 continue
+            
+            link = artigo['href']
+            data_element = artigo.find('time', class_='c-headline__dateline')
+            registros.append({
+                'titulo': titulo,
+                'link': link,
+                'categoria': categorias.get(id(artigo)) or self.categoria_pela_url(link),
+                'datetime': data_element.text.strip() if data_element else ''
+            })
         
-        # Adicionar o lote de notícias à lista principal
-        if noticias_batch:
-            self.noticias.extend(noticias_batch)
-            print(f"Adicionadas {novas_noticias} novas notícias da Folha")
+        return registros
+    
+    def registros_selectolax(self, arvore):
+        """
+        Monta os registros com o selectolax (mesmo resultado de registros_soup)
+        
+        As categorias vêm de uma única passada em ordem de documento, guardando o último
+        chapéu (kicker) e os últimos links de tópico vistos antes de cada artigo.
+        """
+        registros = []
+        
+        # 1. Notícia principal (main headline)
+        main_headline = arvore.css_first('a.c-main-headline__url')
+        if main_headline is not None:
+            titulo_element = main_headline.css_first('h2.c-main-headline__title')
+            if titulo_element is not None:
+                categoria = ''
+                secao = main_headline.parent
+                while secao is not None and secao.tag != 'section':
+                    secao = secao.parent
+                if secao is not None:
+                    for link_secao in secao.css('a[href]'):
+                        if self.padrao_link_editoria.search(link_secao.attributes.get('href') or ''):
+                            categoria = texto_no(link_secao)
+                            print(f"Categoria encontrada para notícia principal: '{categoria}'")
+                            break
                 
-        return novas_noticias
+                registros.append({
+                    'titulo': texto_no(titulo_element),
+                    'link': main_headline.attributes.get('href'),
+                    'categoria': categoria,
+                    'datetime': texto_no(main_headline.css_first('time.c-headline__dateline')),
+                    'principal': True
+                })
+        
+        # 2. Notícias secundárias, com o índice de chapéus e tópicos montado na mesma passada
+        artigos = 0
+        chapeu = None
+        topicos = []
+        for no in arvore.css('h3.c-headline__kicker, a[href]'):
+            if no.tag == 'h3':
+                chapeu = no
+                continue
+            
+            href = no.attributes.get('href') or ''
+            if 'folha.uol.com.br/folha-topicos/' in href:
+                topicos.append(no)
+            if not self.padrao_link_noticia.search(href):
+                continue
+            artigos += 1
+            
+            titulo_element = no.css_first('h2.c-headline__title')
+            if titulo_element is None:
+                # Talvez seja a notícia principal que já processamos
+                continue
+            
+            titulo = texto_no(titulo_element)
+            
+            # Evitar a busca de categoria para títulos já conhecidos
+            if titulo in self.titulos_atuais:
+                continue
+            
+            categoria = texto_no(chapeu)
+            if not categoria:
+                # Último tópico antes do bloco do artigo (fora do elemento pai)
+                pai = no.parent
+                for topico in (reversed(topicos) if pai is not None and pai.tag != 'body' else ()):
+                    if not self.no_contido_em(topico, pai):
+                        categoria = texto_no(topico)
+                        break
+            
+            registros.append({
+                'titulo': titulo,
+                'link': href,
+                'categoria': categoria or self.categoria_pela_url(href),
+                'datetime': texto_no(no.css_first('time.c-headline__dateline'))
+            })
+        
+        print(f"Encontrados {artigos} artigos na página da Folha")
+        return registros
+    
+    @staticmethod
+    def no_contido_em(no, ancestral):
+        """
+        Indica se o nó do selectolax está dentro de 'ancestral'
+        """
+        if ancestral is None:
+            return False
+        atual = no.parent
+        while atual is not None:
+            if atual == ancestral:
+                return True
+            atual = atual.parent
+        return False
     
-    def extrair_categoria_folha(self, artigo_element, link):
+    def indexar_categorias(self, soup):
         """
-        Método especializado para extrair a categoria de notícias da Folha
+        Percorre a página uma única vez em ordem de documento e associa cada link de notícia
+        à sua categoria: o chapéu (h3.c-headline__kicker) mais recente antes dele ou, se não
+        houver texto de chapéu, o último link de folha-topicos antes do bloco do artigo
+        
+        Returns:
+            Tupla (links de notícias em ordem de documento, {id do link: categoria})
         """
-        categoria = "Não especificada"
+        artigos = []
+        categorias = {}
+        chapeu = ''
+        topicos = []
         
-        # 1. Tentar encontrar link de categoria próximo (com padrão folha-topicos)
-        try:
-            # Buscar em todo o documento, mas primeiro próximo ao elemento
-            categoria_elements = []
-            
-            # Procurar no próprio elemento e seus pais
-            parent = artigo_element.parent
-            while parent and parent.name != 'body':
-                # Procurar em irmãos ou filhos dos pais também
-                for sibling in parent.find_all_previous('a', href=re.compile(r"folha\.uol\.com\.br/folha-topicos/"), limit=3):
-                    categoria_elements.append(sibling)
-                parent = parent.parent
-            
-            # Procurar também por links diretos de seção
-            kicker_elements = artigo_element.find_previous('h3', class_='c-headline__kicker')
-            if kicker_elements:
-                categoria_text = kicker_elements.text.strip()
+        for no in soup.find_all(self.eh_chapeu_ou_link):
+            if no.name == 'h3':
                 # Remover comentários e espaços extras
-                categoria = re.sub(r'<!--.*?-->', '', categoria_text).strip()
-                if categoria:
-                    return categoria
+                chapeu = re.sub(r'<!--.*?-->', '', no.text.strip()).strip()
+                continue
             
-            # Se encontrou elementos de categoria
-            if categoria_elements:
-                # Pegar o primeiro elemento e extrair o texto real (sem comentários)
-                categoria_text = categoria_elements[0].get_text().strip()
-                # Remover comentários HTML e espaços extras
-                categoria = re.sub(r'<!--.*?-->', '', categoria_text).strip()
-                if categoria:
-                    return categoria
-        except Exception as e:
-            print(f"Erro ao buscar categoria por link: {e}")
+            href = no['href']
+            if 'folha.uol.com.br/folha-topicos/' in href:
+                topicos.append(no)
+            if not self.padrao_link_noticia.search(href):
+                continue
+            artigos.append(no)
+            
+            categoria = chapeu
+            pai = no.parent
+            if not categoria and pai is not None and pai.name != 'body':
+                # Tópicos dentro do próprio bloco do artigo não contam
+                for topico in reversed(topicos):
+                    if not any(ancestral is pai for ancestral in topico.parents):
+                        categoria = re.sub(r'<!--.*?-->', '', topico.get_text().strip()).strip()
+                        break
+            categorias[id(no)] = categoria
         
-        # 2. Tentar extrair da URL, usando o padrão de editoria ou folha-topicos
+        return artigos, categorias
+    
+    @staticmethod
+    def eh_chapeu_ou_link(tag):
+        """
+        Filtro do find_all: chapéus das manchetes e links para páginas da Folha
+        """
+        if tag.name == 'h3':
+            return 'c-headline__kicker' in tag.get('class', [])
+        return tag.name == 'a' and 'folha.uol.com.br/' in tag.get('href', '')
+    
+    def categoria_pela_url(self, link):
+        """
+        Determina a categoria pela URL, usando o padrão de editoria ou folha-topicos
+        """
         try:
             # Verificar se é um link de tópico específico
-            topic_match = re.search(r'folha\.uol\.com\.br/folha-topicos/([^/]+)/', link)
+            topic_match = self.padrao_topico.search(link)
             if topic_match:
                 return topic_match.group(1).replace('-', ' ').title()
             
             # Verificar se é um link de editoria normal
-            url_match = re.search(r'folha\.uol\.com\.br/([^/]+)/', link)
+            url_match = self.padrao_editoria.search(link)
             if url_match:
                 categoria_url = url_match.group(1)
-                # Mapear categorias da URL
-                categorias_map = {
-                    'poder': 'Política',
-                    'mercado': 'Economia', 
-                    'cotidiano': 'Cotidiano',
-                    'mundo': 'Mundo',
-                    'esporte': 'Esporte',
-                    'ilustrada': 'Cultura',
-                    'f5': 'Entretenimento',
-                    'ambiente': 'Ambiente',
-                    'ciencia': 'Ciência',
-                    'equilibrioesaude': 'Saúde',
-                    'educacao': 'Educação',
-                    'tecnologia': 'Tecnologia',
-                    'ilustrissima': 'Ilustríssima',
-                    'comida': 'Gastronomia',
-                    'tec': 'Tecnologia',
-                    'podcasts': 'Podcasts',
-                    'folhinha': 'Folhinha',
-                    'empreendedorismo': 'Empreendedorismo'
-                }
-                categoria = categorias_map.get(categoria_url, categoria_url.replace('-', ' ').title())
+                categoria = self.plano.categorias_url.get(categoria_url, categoria_url.replace('-', ' ').title())
                 if categoria:
                     return categoria
         except Exception as e:
             print(f"Erro ao extrair categoria da URL: {e}")
         
-        return categoria
+        return "Não especificada"
     
     def clicar_ver_mais(self):
         """
         Clica no botão 'Ver mais' para exibir mais artigos
         """
         try:
+            # Quantidade de artigos antes do clique, para detectar quando os novos chegarem
+            artigos_antes = contar_elementos(self.driver, self.seletor_artigos)
+            
             # Rolar até o final da página para garantir que o botão seja visível
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)  # Aguardar o scroll terminar
             
             # Tenta remover banners ou elementos que possam estar bloqueando
             try:
@@ -1264,7 +3825,7 @@ class FolhaScraper:
                 print(f"Aviso: Não foi possível remover elementos bloqueadores: {e}")
             
             # Verificar se o botão existe
-            botoes = self.driver.find_elements(By.CSS_SELECTOR, "button.c-button--expand[data-pagination-trigger]")
+            botoes = self.driver.find_elements(By.CSS_SELECTOR, self.seletor_botao)
             if not botoes:
                 print("Botão 'Ver mais' não encontrado na página da Folha")
                 return False
@@ -1274,7 +3835,6 @@ class FolhaScraper:
             
             # Rolar para o botão
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", botao)
-            time.sleep(1)
             
             # Tentar clicar diretamente no botão
             try:
@@ -1288,8 +3848,12 @@ class FolhaScraper:
                 self.driver.execute_script("arguments[0].click();", botao)
                 print("Clique via JavaScript realizado")
             
-            # Aguardar o carregamento de novos artigos
-            time.sleep(3)
+            # Aguardar o carregamento de novos artigos (retorna assim que chegarem)
+            if aguardar_mais_elementos(self.driver, self.seletor_artigos, artigos_antes, timeout=10, nome="folha_ver_mais") is None:
+                print("Nenhum artigo novo apareceu após o clique na Folha")
+            
+            # Aguardar o botão voltar a ficar disponível para o próximo clique
+            aguardar_botao_habilitado(self.driver, self.seletor_botao, timeout=3, nome="folha_botao_habilitado")
             
             return True
         except Exception as e:
@@ -1310,504 +3874,362 @@ class FolhaScraper:
             return
         
         # Extrair notícias da primeira página
-        novas_noticias = self.extrair_noticias(html)
+        novas_noticias, encontrou_antiga = self.extrair_noticias(html)
         print(f"Notícias encontradas na página inicial da Folha: {novas_noticias}")
+        if encontrou_antiga:
+            print("Página inicial da Folha já alcança o ciclo anterior. Parando extração.")
+            return
         
         # Clique no botão "Ver mais" várias vezes
         cliques_realizados = 0
         tentativas_sem_novas = 0
         
         while cliques_realizados < max_cliques:
+            if self.prazo and self.prazo.expirado():
+                print("Prazo da Folha esgotado. Publicando o que já foi extraído.")
+                break
+            
             # Clicar no botão para carregar mais notícias
             if self.clicar_ver_mais():
                 # Extrair as novas notícias carregadas
-                novas_noticias = self.extrair_noticias(self.driver.page_source)
+                novas_noticias, encontrou_antiga = self.extrair_noticias(self.obter_novos_itens())
                 cliques_realizados += 1
                 
                 print(f"Clique {cliques_realizados}/{max_cliques} realizado na Folha.")
                 
-                if novas_noticias > 0:
-                    print(f"Notícias da Folha encontradas até agora: {len(self.noticias)}")
-                    tentativas_sem_novas = 0
-                else:
-                    tentativas_sem_novas += 1
-                    print(f"Nenhuma nova notícia após o clique {cliques_realizados}. Tentativa {tentativas_sem_novas}/3")
-                    
-                    # Se não encontrarmos novas notícias em 3 tentativas consecutivas, paramos
-                    if tentativas_sem_novas >= 3:
-                        print("Três tentativas sem novas notícias da Folha. Finalizando.")
-                        break
-            else:
-                print("Não foi possível carregar mais notícias da Folha. Finalizando.")
-                break
-            
-            # Pequena pausa para não sobrecarregar o site
-            time.sleep(1)
-                
-        print(f"Extração da Folha finalizada após {cliques_realizados} cliques. Total: {len(self.noticias)} notícias")
-    
-    def salvar_noticias(self):
-        """
-        Salva as notícias extraídas em formato JSON
-        """
-        # Verificar se temos notícias
-        if not self.noticias:
-            print("Nenhuma notícia da Folha foi encontrada para salvar.")
-            df = pd.DataFrame(columns=['titulo', 'categoria', 'fonte', 'data', 'hora', 'link'])
-            return df
-            
-        # Criar DataFrame das notícias
-        df = pd.DataFrame(self.noticias)
-        
-        # Remover duplicatas
-        df = df.drop_duplicates(subset=['titulo'])
-        
-        # Ordenar por hora (mais recente primeiro)
-        if 'hora' in df.columns:
-            try:
-                df['data_hora'] = pd.to_datetime(df['data'] + ' ' + df['hora'], format='%d/%m/%Y %H:%M', errors='coerce')
-                df = df.sort_values(by='data_hora', ascending=False)
-                df = df.drop('data_hora', axis=1)
-            except Exception as e:
-                print(f"Erro ao ordenar por hora: {e}")
-        
-        # Salvar em formato JSON
-        try:
-            df.to_json('noticias_folha.json', orient='records', force_ascii=False)
-            print(f"Dados da Folha salvos em noticias_folha.json")
-        except Exception as e:
-            print(f"Erro ao salvar JSON da Folha: {e}")
-            
-        return df
-
-class OGloboScraper:
-    def __init__(self):
-        self.url = "https://oglobo.globo.com/ultimas-noticias/"
-        self.noticias = []
-        self.hoje = datetime.now().strftime("%d/%m/%Y")
-        self.titulos_atuais = set()
-        self.driver = None
-    
-    def configurar_driver(self):
-        """
-        Obtém um driver do pool
-        """
-        print("Configurando o driver do Microsoft Edge...")
-        self.driver = obter_driver()
-        return self.driver
-    
-    def fechar_driver(self):
-        """
-        Retorna o driver para o pool
-        """
-        if self.driver:
-            retornar_driver(self.driver)
-            self.driver = None
-            print("Driver do Edge retornado ao pool.")
-    
-    def obter_pagina(self, url):
-        """
-        Carrega a página usando o Selenium com retry e retorna o conteúdo HTML
-        """
-        try:
-            print(f"Carregando a página de O Globo: {url}")
-            
-            # Usar a função de retry com timeout maior específico para O Globo
-            if not carregar_pagina_com_retry(self.driver, url, max_tentativas=4, timeout=30):
-                return None
-            
-            # Aguardar o carregamento dos elementos principais com timeout maior
-            WebDriverWait(self.driver, 25).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "feed-post-body"))
-            )
-            
-            # Aguardar um pouco mais para garantir carregamento completo
-            time.sleep(3)
-            
-            # Retornar o HTML da página
-            return self.driver.page_source
-        except Exception as e:
-            print(f"Erro ao carregar página de O Globo: {e}")
-            return None
-            
-    def calcular_tempo_absoluto(self, tempo_relativo):
-        """
-        Converte o tempo relativo (ex: 'Há 5 minutos') para data e hora absolutas.
-        Retorna uma tupla (data_formatada, hora_formatada) ou (None, None) se falhar.
-        """
-        agora = datetime.now()
-        tempo_relativo = tempo_relativo.lower()
-        
-        try:
-            if 'agora' in tempo_relativo or 'poucos instantes' in tempo_relativo:
-                tempo_calculado = agora
-            elif 'minuto' in tempo_relativo:
-                minutos = int(re.search(r'\d+', tempo_relativo).group())
-                tempo_calculado = agora - timedelta(minutes=minutos)
-            elif 'hora' in tempo_relativo:
-                horas = int(re.search(r'\d+', tempo_relativo).group())
-                tempo_calculado = agora - timedelta(hours=horas)
-            else:
-                # Tentar extrair data e hora se for um formato diferente
-                # Exemplo: 25/04/2025 às 13:30 (se houver)
-                match = re.search(r'(\d{2}/\d{2}/\d{4})[\s às]+(\d{2}:\d{2})', tempo_relativo)
-                if match:
-                    return match.group(1), match.group(2)
-                else:
-                     print(f"Formato de tempo relativo não reconhecido: {tempo_relativo}")
-                     return None, None # Formato não reconhecido
-
-            # Verificar se a data calculada é de hoje
-            data_calculada_str = tempo_calculado.strftime("%d/%m/%Y")
-            if data_calculada_str != self.hoje:
-                 print(f"Notícia de data anterior encontrada ({data_calculada_str}), ignorando.")
-                 return None, None # Notícia de dia anterior
-
-            return tempo_calculado.strftime("%d/%m/%Y"), tempo_calculado.strftime("%H:%M")
-        except Exception as e:
-            print(f"Erro ao calcular tempo absoluto para '{tempo_relativo}': {e}")
-            return None, None
-
-    def extrair_noticias(self, html):
-        """
-        Extrai as notícias do HTML usando BeautifulSoup
-        """
-        if not html:
-            return 0
-            
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Encontrar todos os artigos de notícias (baseado na estrutura do Valor)
-        artigos = soup.find_all('div', class_='feed-post-body')
-        print(f"Encontrados {len(artigos)} artigos na página de O Globo")
-        
-        novas_noticias = 0
-        noticias_batch = []
-        
-        for artigo in artigos:
-            try:
-                # Extrair título e link
-                link_element = artigo.find('a', class_='feed-post-link')
-                if not link_element:
-                    continue
-                    
-                titulo = link_element.text.strip()
-                link = link_element['href']
-                
-                # Verificar se o título já existe
-                if titulo in self.titulos_atuais:
-                    continue
-                
-                # Extrair categoria
-                categoria_element = artigo.find('span', class_='feed-post-metadata-section')
-                categoria = categoria_element.text.strip() if categoria_element else "Não especificada"
-                
-                # Extrair tempo relativo
-                tempo_element = artigo.find('span', class_='feed-post-datetime')
-                if not tempo_element:
-                    continue
-                
-                tempo_relativo = tempo_element.text.strip()
-                
-                # Calcular data e hora absolutas
-                data_abs, hora_abs = self.calcular_tempo_absoluto(tempo_relativo)
-                
-                if data_abs is None or hora_abs is None:
-                    # Se não conseguiu calcular ou é de dia anterior, pula para a próxima
-                    continue 
-                
-                # Adicionar à lista temporária
-                noticias_batch.append({
-                    'titulo': titulo,
-                    'categoria': categoria,
-                    'fonte': 'O Globo',
-                    'data': data_abs,
-                    'hora': hora_abs,
-                    'link': link
-                })
-                self.titulos_atuais.add(titulo)
-                novas_noticias += 1
-            except Exception as e:
-                print(f"Erro ao processar artigo de O Globo: {e}")
-                continue
-        
-        # Adicionar o lote de notícias à lista principal
-        if noticias_batch:
-            self.noticias.extend(noticias_batch)
-            print(f"Adicionadas {novas_noticias} novas notícias de O Globo")
-                
-        return novas_noticias
-    
-    def navegar_para_proxima_pagina(self, pagina_atual):
-        """
-        Navega diretamente para a próxima página usando URL com retry
-        """
-        try:
-            # Construir a URL para a próxima página
-            proxima_pagina = pagina_atual + 1
-            url_proxima = f"https://oglobo.globo.com/ultimas-noticias/index/feed/pagina-{proxima_pagina}.ghtml"
-            # Note a extensão .ghtml, diferente do Valor
-            
-            print(f"Navegando para página {proxima_pagina} de O Globo: {url_proxima}")
-            
-            # Usar a função de retry com timeout maior
-            if not carregar_pagina_com_retry(self.driver, url_proxima, max_tentativas=4, timeout=30):
-                return False
-            
-            # Verificar se a página carregou corretamente com timeout maior
-            WebDriverWait(self.driver, 20).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "feed-post-body"))
-            )
-            return True
-        except Exception as e:
-            # Verificar se o erro é por página não encontrada (fim da paginação)
-            if "net::ERR_ABORTED" in str(e) or "StatusCode.NOT_FOUND" in str(e) or "TimeoutException" in str(e):
-                 print(f"Página {proxima_pagina} não encontrada ou não carregou a tempo. Fim da paginação?")
-            else:
-                print(f"Erro ao navegar para a próxima página de O Globo: {e}")
-            return False
-    
-    def extrair_todas_noticias(self, max_paginas=15):
-        """
-        Extrai notícias de várias páginas usando navegação direta
-        """
-        # Carregar a primeira página
-        html = self.obter_pagina(self.url)
-        if not html:
-            print("Não foi possível carregar a página inicial de O Globo.")
-            return
-        
-        # Extrair notícias da primeira página
-        self.extrair_noticias(html)
-        print(f"Notícias de O Globo encontradas até agora: {len(self.noticias)}")
-        
-        # Carregar mais páginas navegando diretamente para as URLs
-        pagina_atual = 1
-        tentativas_sem_novas = 0
-        
-        while pagina_atual < max_paginas:
-            if self.navegar_para_proxima_pagina(pagina_atual):
-                novas_noticias = self.extrair_noticias(self.driver.page_source)
-                pagina_atual += 1
-                
-                if novas_noticias > 0:
-                    print(f"Notícias de O Globo encontradas até agora: {len(self.noticias)}")
-                    tentativas_sem_novas = 0
-                else:
-                    tentativas_sem_novas += 1
-                    print(f"Nenhuma nova notícia na página {pagina_atual} de O Globo. Tentativa {tentativas_sem_novas}/2")
-                    if tentativas_sem_novas >= 2:
-                        print("Duas tentativas sem novas notícias de O Globo. Finalizando.")
-                        break
-            else:
-                print("Não foi possível carregar mais páginas de O Globo. Finalizando.")
-                break
+                if encontrou_antiga:
+                    print(f"Marca d'água alcançada após {cliques_realizados} cliques na Folha. Parando extração.")
+                    break
                 
-        print(f"Extração de O Globo finalizada após verificar {pagina_atual} páginas. Total: {len(self.noticias)} notícias")
-    
-    def salvar_noticias(self):
-        """
-        Salva as notícias extraídas em formato JSON
-        """
-        # Verificar se temos notícias
-        if not self.noticias:
-            print("Nenhuma notícia de O Globo foi encontrada para salvar.")
-            df = pd.DataFrame(columns=['titulo', 'categoria', 'fonte', 'data', 'hora', 'link'])
-            return df
-            
-        # Criar DataFrame das notícias
-        df = pd.DataFrame(self.noticias)
-        
-        # Remover duplicatas
-        df = df.drop_duplicates(subset=['titulo'])
-        
-        # Ordenar por hora (mais recente primeiro)
-        if 'hora' in df.columns:
-            try:
-                df['data_hora'] = pd.to_datetime(df['data'] + ' ' + df['hora'], format='%d/%m/%Y %H:%M', errors='coerce')
-                df = df.sort_values(by='data_hora', ascending=False)
-                df = df.drop('data_hora', axis=1)
-            except Exception as e:
-                print(f"Erro ao ordenar notícias de O Globo por hora: {e}")
+                if novas_noticias > 0:
+                    print(f"Notícias da Folha encontradas até agora: {len(self.noticias)}")
+                    tentativas_sem_novas = 0
+                else:
+                    tentativas_sem_novas += 1
+                    print(f"Nenhuma nova notícia após o clique {cliques_realizados}. Tentativa {tentativas_sem_novas}/3")
+                    
+                    # Se não encontrarmos novas notícias em 3 tentativas consecutivas, paramos
+                    if tentativas_sem_novas >= 3:
+                        print("Três tentativas sem novas notícias da Folha. Finalizando.")
+                        break
+            else:
+                print("Não foi possível carregar mais notícias da Folha. Finalizando.")
+                break
         
-        # Salvar em formato JSON
+        print(f"Extração da Folha finalizada após {cliques_realizados} cliques. Total: {len(self.noticias)} notícias")
+
+class OGloboScraper(ScraperFonte):
+    chave_fonte = 'oglobo'
+
+# Registro de fontes: chave -> (classe do scraper, nome usado nas mensagens)
+CLASSES_SCRAPERS = {}
+
+def validar_especificacao(chave, spec, classe=None):
+    """
+    Confere se a especificação tem o necessário para o motor genérico (levanta ValueError)
+    """
+    faltando = [campo for campo in ('nome', 'url', 'paginacao', 'seletor_pronto', 'formato_data') if campo not in spec]
+    if spec.get('paginacao') not in ('url', 'cliques'):
+        faltando.append("paginacao ('url' ou 'cliques')")
+    if spec.get('formato_data') not in FORMATOS_DATA:
+        faltando.append(f"formato_data ({', '.join(FORMATOS_DATA)})")
+    if classe is None:
+        # Sem classe própria a fonte usa o feed genérico, que só pagina por URL
+        if spec.get('paginacao') == 'cliques':
+            faltando.append("classe própria para paginação por cliques")
+        faltando += [campo for campo in ('item', 'link', 'datetime') if campo not in spec]
+    if faltando:
+        raise ValueError(f"Especificação da fonte '{chave}' incompleta: {', '.join(faltando)}")
+
+def registrar_fonte(chave, especificacao=None, classe=None):
+    """
+    Registra uma fonte para os ciclos de extração
+    
+    Args:
+        chave: Identificação da fonte (pool, bloqueio de recursos, disjuntor, marca d'água)
+        especificacao: Especificação declarativa (ver ESPECIFICACOES_FONTES); opcional se já existir
+        classe: Subclasse de ScraperFonte; sem ela, a fonte usa o feed genérico
+    
+    Returns:
+        A classe registrada
+    """
+    if especificacao is not None:
+        validar_especificacao(chave, especificacao, classe)
+        ESPECIFICACOES_FONTES[chave] = dict(especificacao)
+        planos_fontes.pop(chave, None)  # Recompilar no próximo uso
+    elif chave not in ESPECIFICACOES_FONTES:
+        raise ValueError(f"Fonte sem especificação: {chave}")
+    
+    if classe is None:
+        classe = type(f"ScraperFonte_{chave}", (ScraperFonte,), {'chave_fonte': chave})
+    elif classe.chave_fonte != chave:
+        raise ValueError(f"Classe {classe.__name__} pertence à fonte '{classe.chave_fonte}', não a '{chave}'")
+    
+    with fontes_lock:
+        CLASSES_SCRAPERS[chave] = (classe, ESPECIFICACOES_FONTES[chave]['nome'])
+    return classe
+
+def descobrir_plugins_fontes(diretorio=None):
+    """
+    Carrega uma única vez por processo os plugins de fontes do diretório configurado
+    
+    Cada arquivo .py do diretório deve definir registrar_fontes(monitor), que recebe este
+    módulo e chama monitor.registrar_fonte(...) para cada fonte nova.
+    
+    Returns:
+        Número de plugins carregados
+    """
+    with fontes_lock:
+        if fontes_config['plugins_carregados'] and diretorio is None:
+            return 0
+        fontes_config['plugins_carregados'] = True
+    
+    diretorio = diretorio or fontes_config['diretorio_plugins']
+    if not os.path.isabs(diretorio):
+        diretorio = os.path.join(os.path.dirname(os.path.abspath(__file__)), diretorio)
+    if not os.path.isdir(diretorio):
+        return 0
+    
+    monitor = sys.modules[__name__]
+    carregados = 0
+    for arquivo in sorted(os.listdir(diretorio)):
+        if not arquivo.endswith('.py') or arquivo.startswith('_'):
+            continue
         try:
-            df.to_json('noticias_oglobo.json', orient='records', force_ascii=False)
-            print(f"Dados de O Globo salvos em noticias_oglobo.json")
+            modulo_spec = importlib.util.spec_from_file_location(f"fontes_{arquivo[:-3]}", os.path.join(diretorio, arquivo))
+            modulo = importlib.util.module_from_spec(modulo_spec)
+            modulo_spec.loader.exec_module(modulo)
+            modulo.registrar_fontes(monitor)
+            carregados += 1
         except Exception as e:
-            print(f"Erro ao salvar JSON de O Globo: {e}")
-            
-        return df
+            print(f"Erro ao carregar o plugin de fontes {arquivo}: {e}")
+    
+    if carregados:
+        print(f"{carregados} plugin(s) de fontes carregado(s) de {diretorio}")
+    return carregados
 
-def extrair_noticias_valor():
+def configurar_fontes(ativas=None, diretorio_plugins=None):
     """
-    Função otimizada para extrair notícias do Valor Econômico
+    Define as fontes extraídas em cada ciclo e o diretório dos plugins
+    
+    Args:
+        ativas: Lista de chaves das fontes (None = todas as registradas)
+        diretorio_plugins: Diretório com os plugins de fontes
     """
-    print("Iniciando extração de notícias do Valor Econômico...")
-    scraper = ValorEconomicoScraper()
-    try:
-        scraper.configurar_driver()
-        scraper.extrair_todas_noticias()
-        df = scraper.salvar_noticias()
-        print(f"Extração de Valor Econômico concluída. Foram encontradas {len(scraper.noticias)} notícias.")
-        return df
-    except Exception as e:
-        print(f"Erro na extração do Valor Econômico: {e}")
-        return None
-    finally:
-        scraper.fechar_driver()
+    fontes_config['ativas'] = list(ativas) if ativas else None
+    if diretorio_plugins is not None:
+        fontes_config['diretorio_plugins'] = diretorio_plugins
+        fontes_config['plugins_carregados'] = False
 
-def extrair_noticias_estadao():
+def obter_fontes_ativas():
     """
-    Função otimizada para extrair notícias do Estadão
+    Retorna as chaves das fontes do ciclo: todas as registradas (incluindo plugins) ou as
+    escolhidas em fontes_config['ativas']
     """
-    print("Iniciando extração de notícias do Estadão...")
-    scraper = EstadaoScraper()
-    try:
-        scraper.configurar_driver()
-        scraper.extrair_todas_noticias(max_cliques=8)  # Reduzido de 10 para 8
-        df = scraper.salvar_noticias()
-        print(f"Extração de Estadão concluída. Foram encontradas {len(scraper.noticias)} notícias.")
-        return df
-    except Exception as e:
-        print(f"Erro na extração do Estadão: {e}")
-        return None
-    finally:
-        scraper.fechar_driver()
+    descobrir_plugins_fontes()
+    ativas = fontes_config['ativas']
+    if not ativas:
+        return list(CLASSES_SCRAPERS)
+    desconhecidas = [chave for chave in ativas if chave not in CLASSES_SCRAPERS]
+    if desconhecidas:
+        print(f"Fontes desconhecidas ignoradas: {', '.join(desconhecidas)}")
+    return [chave for chave in ativas if chave in CLASSES_SCRAPERS]
 
-def extrair_noticias_folha():
+# Fontes embutidas; os plugins acrescentam outras
+for chave_fonte, classe_fonte in (('valor', ValorEconomicoScraper), ('estadao', EstadaoScraper),
+                                  ('folha', FolhaScraper), ('oglobo', OGloboScraper)):
+    registrar_fonte(chave_fonte, classe=classe_fonte)
+
+def fonte_sempre_no_navegador(chave):
+    """
+    Indica se a fonte sempre abre o Edge: paginada por cliques e sem sitemap ou feed como caminho principal
+    """
+    spec = ESPECIFICACOES_FONTES[chave]
+    sem_navegador = (sitemap_config['ativo'] and spec.get('sitemap')) or (feed_config['ativo'] and spec.get('feed'))
+    return spec['paginacao'] == 'cliques' and not sem_navegador
+
+def executar_scraper(chave, max_paginas=10, max_cliques=8, prazo_fonte=None):
     """
-    Função otimizada para extrair notícias da Folha
+    Executa a extração completa de uma fonte e retorna o DataFrame salvo (ou None)
+    
+    Args:
+        chave: Chave da fonte em CLASSES_SCRAPERS
+        max_paginas: Páginas verificadas nas fontes paginadas por URL
+        max_cliques: Cliques em 'Carregar mais'/'Ver mais' nas fontes paginadas por cliques
+        prazo_fonte: Prazo da fonte no ciclo
     """
-    print("Iniciando extração de notícias da Folha...")
-    scraper = FolhaScraper()
+    classe, nome = CLASSES_SCRAPERS[chave]
+    if not fonte_disponivel(chave, nome):
+        return None
+    scraper = classe()
+    scraper.prazo = prazo_fonte
     try:
-        scraper.configurar_driver()
-        scraper.extrair_todas_noticias(max_cliques=8)  # Reduzido de 10 para 8
+        if scraper.extrair_via_sitemap() or scraper.extrair_via_feed():
+            # O sitemap ou o feed bastou: nem a página nem o Edge são necessários
+            obter_disjuntor(chave).registrar_sucesso()
+        elif ESPECIFICACOES_FONTES[chave]['paginacao'] == 'cliques':
+            scraper.configurar_driver()
+            scraper.extrair_todas_noticias(max_cliques=max_cliques)
+        else:
+            scraper.extrair_todas_noticias(max_paginas=max_paginas)
         df = scraper.salvar_noticias()
-        print(f"Extração de Folha concluída. Foram encontradas {len(scraper.noticias)} notícias.")
+        print(f"Extração de {nome} concluída. Foram encontradas {len(scraper.noticias)} notícias.")
         return df
     except Exception as e:
-        print(f"Erro na extração da Folha: {e}")
+        print(f"Erro na extração de {nome}: {e}")
         return None
     finally:
         scraper.fechar_driver()
+        # Sonda que não chegou a carregar uma página (prazo esgotado, página inexistente)
+        obter_disjuntor(chave).encerrar_sonda()
+
+def configurar_modo_execucao(modo):
+    """
+    Define se as fontes rodam em threads ('threads') ou cada uma no seu processo ('processos')
+    """
+    if modo not in ('threads', 'processos'):
+        raise ValueError(f"Modo de execução inválido: {modo}")
+    execucao_config['modo'] = modo
+
+def inicializar_processo_trabalhador(chave, bloqueio_ativo, backend_parser=None, diretorio_plugins=None, feed_ativo=True,
+                                     sitemap_ativo=True):
+    """
+    Prepara o processo dedicado a uma fonte: plugins de fontes, pool próprio de um driver,
+    aquecido se a fonte sempre usa o navegador
+    """
+    if diretorio_plugins:
+        fontes_config['diretorio_plugins'] = diretorio_plugins
+    descobrir_plugins_fontes()
+    configurar_pool_drivers(tamanho=1)
+    configurar_bloqueio_rede(ativo=bloqueio_ativo)
+    parser_config['backend'] = backend_parser
+    feed_config['ativo'] = feed_ativo
+    sitemap_config['ativo'] = sitemap_ativo
+    if fonte_sempre_no_navegador(chave):
+        aquecer_pool_drivers(quantidade=1, em_segundo_plano=True)
+
+def extrair_fonte_em_processo(chave, max_paginas, max_cliques, prazo_segundos):
+    """
+    Executada no processo da fonte: extrai e devolve registros compactos (tuplas em COLUNAS_NOTICIA)
+    """
+    prazo_fonte = Prazo(prazo_segundos) if prazo_segundos else None
+    df = executar_scraper(chave, max_paginas, max_cliques, prazo_fonte)
+    imprimir_resumo_bloqueio()
+    if df is None or df.empty:
+        return []
+    return list(df[COLUNAS_NOTICIA].itertuples(index=False, name=None))
+
+def obter_executor_processo(chave):
+    """
+    Retorna o processo dedicado da fonte, criando-o no primeiro uso
+    
+    Cada fonte vai sempre para o mesmo processo, que mantém seu driver aquecido entre ciclos.
+    """
+    with executores_lock:
+        if chave not in executores_processos:
+            executores_processos[chave] = concurrent.futures.ProcessPoolExecutor(
+                max_workers=1,
+                initializer=inicializar_processo_trabalhador,
+                initargs=(chave, bloqueio_config['ativo'], parser_config['backend'], fontes_config['diretorio_plugins'],
+                          feed_config['ativo'], sitemap_config['ativo'])
+            )
+        return executores_processos[chave]
 
-def extrair_noticias_oglobo():
+def executar_em_processo(chave, max_paginas=10, max_cliques=8, prazo_fonte=None):
     """
-    Função otimizada para extrair notícias de O Globo
+    Executa a fonte no seu processo dedicado e monta o DataFrame a partir dos registros compactos
     """
-    print("Iniciando extração de notícias de O Globo...")
-    scraper = OGloboScraper()
+    executor = obter_executor_processo(chave)
+    prazo_segundos = prazo_fonte.restante() if prazo_fonte is not None else None
     try:
-        scraper.configurar_driver()
-        scraper.extrair_todas_noticias(max_paginas=10)  # Reduzido de 15 para 10
-        df = scraper.salvar_noticias()
-        print(f"Extração de O Globo concluída. Foram encontradas {len(scraper.noticias)} notícias.")
-        return df
-    except Exception as e:
-        print(f"Erro na extração de O Globo: {e}")
+        registros = executor.submit(extrair_fonte_em_processo, chave, max_paginas, max_cliques, prazo_segundos).result()
+    except BrokenProcessPool as e:
+        print(f"Processo de {chave} encerrado inesperadamente: {e}. Será recriado no próximo ciclo.")
+        with executores_lock:
+            if executores_processos.get(chave) is executor:
+                del executores_processos[chave]
         return None
-    finally:
-        scraper.fechar_driver()
+    if not registros:
+        return None
+    return pd.DataFrame.from_records(registros, columns=COLUNAS_NOTICIA)
+
+def encerrar_processos_fontes():
+    """
+    Fecha os navegadores de cada processo de fonte e encerra os processos
+    """
+    with executores_lock:
+        executores = list(executores_processos.values())
+        executores_processos.clear()
+    for executor in executores:
+        try:
+            # Processos do multiprocessing não executam o atexit: limpar o pool explicitamente
+            executor.submit(limpar_pool_drivers).result(timeout=30)
+        except Exception:
+            pass
+        executor.shutdown(wait=False, cancel_futures=True)
 
-def extrair_todas_noticias(modo_rapido=False):
+def extrair_todas_noticias(modo_rapido=False, prazo_segundos=None, modo_execucao=None, fontes=None):
     """
     Extrai notícias de todas as fontes em paralelo para maior eficiência
     
+    O ciclo tem um prazo de relógio: as fontes que terminam dentro dele são publicadas e
+    as atrasadas entram na publicação do ciclo seguinte.
+    
     Args:
         modo_rapido: Se True, reduz o número de páginas/cliques para atualizações mais frequentes
+        prazo_segundos: Prazo total do ciclo (padrão: prazo_config)
+        modo_execucao: 'threads' ou 'processos' (padrão: execucao_config)
+        fontes: Fontes coletadas neste ciclo (padrão: todas as ativas); as demais fontes ativas
+                entram na página combinada com a última publicação salva
     """
     print("=== INICIANDO EXTRAÇÃO PARALELA DE NOTÍCIAS ===")
     if modo_rapido:
         print("Modo rápido ativado - menos páginas por fonte")
     
     start_time = time.time()
+    if prazo_segundos is None:
+        prazo_segundos = prazo_config['ciclo_rapido'] if modo_rapido else prazo_config['ciclo']
+    prazo_ciclo = Prazo(prazo_segundos)
+    
+    if modo_execucao is None:
+        modo_execucao = execucao_config['modo']
     
     # Ajustar parâmetros baseado no modo
     max_paginas = 5 if modo_rapido else 10
     max_cliques = 4 if modo_rapido else 8
     
-    # Lista de funções de extração com parâmetros otimizados
-    def extrair_valor_otimizado():
-        scraper = ValorEconomicoScraper()
-        try:
-            scraper.configurar_driver()
-            scraper.extrair_todas_noticias(max_paginas=max_paginas)
-            df = scraper.salvar_noticias()
-            print(f"Extração de Valor Econômico concluída. Foram encontradas {len(scraper.noticias)} notícias.")
-            return df
-        except Exception as e:
-            print(f"Erro na extração do Valor Econômico: {e}")
-            return None
-        finally:
-            scraper.fechar_driver()
-    
-    def extrair_estadao_otimizado():
-        scraper = EstadaoScraper()
-        try:
-            scraper.configurar_driver()
-            scraper.extrair_todas_noticias(max_cliques=max_cliques)
-            df = scraper.salvar_noticias()
-            print(f"Extração de Estadão concluída. Foram encontradas {len(scraper.noticias)} notícias.")
-            return df
-        except Exception as e:
-            print(f"Erro na extração do Estadão: {e}")
-            return None
-        finally:
-            scraper.fechar_driver()
-    
-    def extrair_folha_otimizado():
-        scraper = FolhaScraper()
-        try:
-            scraper.configurar_driver()
-            scraper.extrair_todas_noticias(max_cliques=max_cliques)
-            df = scraper.salvar_noticias()
-            print(f"Extração de Folha concluída. Foram encontradas {len(scraper.noticias)} notícias.")
-            return df
-        except Exception as e:
-            print(f"Erro na extração da Folha: {e}")
-            return None
-        finally:
-            scraper.fechar_driver()
+    ativas = obter_fontes_ativas()
+    fontes = ativas if fontes is None else [chave for chave in ativas if chave in fontes]
+    print(f"Fontes do ciclo: {len(fontes)} ({agendador_config['workers']} trabalhadores, "
+          f"até {pool_config['max_ativos']} navegadores)")
     
-    def extrair_oglobo_otimizado():
-        scraper = OGloboScraper()
-        try:
-            scraper.configurar_driver()
-            scraper.extrair_todas_noticias(max_paginas=max_paginas)
-            df = scraper.salvar_noticias()
-            print(f"Extração de O Globo concluída. Foram encontradas {len(scraper.noticias)} notícias.")
-            return df
-        except Exception as e:
-            print(f"Erro na extração de O Globo: {e}")
-            return None
-        finally:
-            scraper.fechar_driver()
+    if modo_execucao == 'processos':
+        # Cada fonte no seu processo, com pool de drivers próprio: o parsing não disputa o GIL
+        print("Modo de execução: um processo por fonte")
+        executar = executar_em_processo
+    else:
+        # Fontes paginadas por cliques e sem sitemap ou feed sempre usam o navegador: aquecer esses drivers
+        # enquanto as fontes HTTP começam
+        com_navegador = sum(1 for chave in fontes if fonte_sempre_no_navegador(chave))
+        if com_navegador:
+            aquecer_pool_drivers(quantidade=min(com_navegador, pool_config['max_ativos']), em_segundo_plano=True)
+        executar = executar_scraper
     
-    funcoes_extracao = [
-        extrair_valor_otimizado,
-        extrair_estadao_otimizado,
-        extrair_folha_otimizado,
-        extrair_oglobo_otimizado
+    fontes_extracao = [
+        (chave, lambda prazo_fonte, chave=chave: executar(chave, max_paginas, max_cliques, prazo_fonte))
+        for chave in fontes
     ]
     
-    # Executar extrações em paralelo
-    resultados = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-        # Submeter todas as tarefas
-        futures = [executor.submit(func) for func in funcoes_extracao]
-        
-        # Coletar resultados conforme completam
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                resultado = future.result(timeout=180 if modo_rapido else 300)  # Timeout menor no modo rápido
-                if resultado is not None and not resultado.empty:
-                    resultados.append(resultado)
-            except concurrent.futures.TimeoutError:
-                print("Timeout em um dos scrapers - continuando com os outros")
-            except Exception as e:
-                print(f"Erro em um dos scrapers: {e}")
+    # Executar extrações em paralelo, publicando o que terminar dentro do prazo
+    resultados = executar_fontes_com_prazo(fontes_extracao, prazo_ciclo)
+    
+    # Fontes fora deste ciclo continuam na página com a última publicação (depois das
+    # coletadas: em títulos repetidos, vale o resultado mais novo)
+    for chave in ativas:
+        if chave not in fontes:
+            anterior = ultima_publicacao(chave)
+            if anterior is not None:
+                resultados.append(anterior)
     
     # Combinar os dataframes
     if resultados:
@@ -1840,9 +4262,8 @@ def extrair_todas_noticias(modo_rapido=False):
         tempo_total = end_time - start_time
         print(f"Total de notícias combinadas: {len(df_combinado)}")
         print(f"Tempo total de execução: {tempo_total:.2f} segundos")
-        
-        # Limpar pool de drivers
-        limpar_pool_drivers()
+        imprimir_resumo_latencias()
+        imprimir_resumo_bloqueio()
         
         return df_combinado
     else:
@@ -1850,23 +4271,408 @@ def extrair_todas_noticias(modo_rapido=False):
         # Gerar HTML vazio ou com mensagem de erro
         gerar_html_completo(pd.DataFrame(columns=['titulo', 'categoria', 'fonte', 'data', 'hora', 'link'])) 
         
-        # Limpar pool de drivers
-        limpar_pool_drivers()
+        return None
+
+class AgendadorFontes:
+    """
+    Multiplexa as fontes sobre um número limitado de threads trabalhadoras persistentes
+    
+    As threads são daemon: uma fonte travada não impede o encerramento do processo. Uma fonte
+    atrasada continua ocupando seu trabalhador e as seguintes aguardam na fila; o limite de
+    navegadores abertos fica no pool de drivers (pool_config['max_ativos']).
+    """
+    def __init__(self):
+        self.fila = deque()
+        self.cond = threading.Condition()
+        self.trabalhadores = []
+        self.ociosos = 0
+
+    def submeter(self, funcao, *args):
+        """
+        Enfileira a tarefa e retorna um Future com o resultado
+        """
+        futuro = concurrent.futures.Future()
+        with self.cond:
+            self.fila.append((futuro, funcao, args))
+            # Novo trabalhador só se os ociosos não dão conta da fila e há vaga no limite
+            if len(self.fila) > self.ociosos and len(self.trabalhadores) < max(1, agendador_config['workers']):
+                trabalhador = threading.Thread(target=self.trabalhar, daemon=True)
+                self.trabalhadores.append(trabalhador)
+                trabalhador.start()
+            self.cond.notify()
+        return futuro
+
+    def trabalhar(self):
+        """
+        Laço de cada trabalhador: executa tarefas da fila até o limite de trabalhadores diminuir
+        """
+        while True:
+            with self.cond:
+                while not self.fila:
+                    if len(self.trabalhadores) > max(1, agendador_config['workers']):
+                        self.trabalhadores.remove(threading.current_thread())
+                        return
+                    self.ociosos += 1
+                    self.cond.wait()
+                    self.ociosos -= 1
+                futuro, funcao, args = self.fila.popleft()
+            
+            # Tarefas canceladas enquanto aguardavam na fila são descartadas
+            if not futuro.set_running_or_notify_cancel():
+                continue
+            try:
+                futuro.set_result(funcao(*args))
+            except BaseException as e:
+                futuro.set_exception(e)
+
+def obter_agendador():
+    """
+    Retorna o agendador de fontes do processo, criando-o no primeiro uso
+    """
+    global agendador_fontes
+    with fontes_lock:
+        if agendador_fontes is None:
+            agendador_fontes = AgendadorFontes()
+        return agendador_fontes
+
+def configurar_agendador(workers=None):
+    """
+    Define quantas fontes são extraídas ao mesmo tempo (vale também para o agendador já criado)
+    """
+    if workers is not None:
+        agendador_config['workers'] = max(1, workers)
+        if agendador_fontes is not None:
+            with agendador_fontes.cond:
+                # Trabalhadores excedentes encerram ao encontrar a fila vazia
+                agendador_fontes.cond.notify_all()
+
+def executar_fonte_agendada(chave, funcao, prazo_ciclo):
+    """
+    Executada pelo trabalhador: deriva o prazo da fonte no momento em que ela começa
+    e registra a duração para ordenar a fila dos próximos ciclos
+    """
+    fracao = prazo_config['fontes'].get(chave, 1.0)
+    prazo_fonte = prazo_ciclo.subprazo(prazo_ciclo.restante() * fracao)
+    inicio = time.monotonic()
+    try:
+        resultado = funcao(prazo_fonte)
+        if resultado is not None and not resultado.empty:
+            publicacoes_fontes[chave] = resultado
+        registrar_coleta(chave, resultado)
+        return resultado
+    finally:
+        duracoes_fontes[chave] = time.monotonic() - inicio
+
+def guardar_resultado_atrasado(chave, futuro):
+    """
+    Guarda o resultado de uma fonte que terminou após o prazo, para o próximo ciclo
+    """
+    try:
+        resultado = futuro.result()
+    except Exception as e:
+        print(f"Erro na fonte atrasada {chave}: {e}")
+        return
+    if resultado is not None and not resultado.empty:
+        with atrasados_lock:
+            resultados_atrasados[chave] = resultado
+        print(f"{chave} terminou após o prazo. Será incluída no próximo ciclo.")
+
+def executar_fontes_com_prazo(fontes, prazo_ciclo):
+    """
+    Executa as extrações no agendador e retorna ao fim do prazo, sem esperar fontes atrasadas
+    
+    As fontes mais demoradas no ciclo anterior entram primeiro na fila (as ainda sem histórico
+    antes de todas), o que encurta o ciclo quando há mais fontes do que trabalhadores.
+    
+    Args:
+        fontes: Lista de (chave da fonte, função(prazo_fonte) que retorna um DataFrame)
+        prazo_ciclo: Prazo total do ciclo
+    
+    Returns:
+        Lista de DataFrames das fontes concluídas, da última publicação das que não terminaram
+        dentro do prazo e dos resultados atrasados do ciclo anterior
+    """
+    # Resultados que chegaram depois do prazo do ciclo anterior
+    with atrasados_lock:
+        atrasados = list(resultados_atrasados.items())
+        resultados_atrasados.clear()
+    
+    agendador = obter_agendador()
+    fontes = sorted(fontes, key=lambda fonte: -duracoes_fontes.get(fonte[0], float('inf')))
+    
+    futuros = {}
+    for chave, funcao in fontes:
+        with atrasados_lock:
+            anterior = fontes_em_execucao.get(chave)
+        if anterior is not None and not anterior.done():
+            print(f"{chave} ainda em execução desde o ciclo anterior. Aguardando seu resultado.")
+            continue
         
+        futuro = agendador.submeter(executar_fonte_agendada, chave, funcao, prazo_ciclo)
+        futuros[futuro] = chave
+        with atrasados_lock:
+            fontes_em_execucao[chave] = futuro
+    
+    concluidos, pendentes = concurrent.futures.wait(futuros, timeout=prazo_ciclo.restante())
+    
+    resultados = []
+    for futuro in concluidos:
+        chave = futuros[futuro]
+        try:
+            resultado = futuro.result()
+            if resultado is not None and not resultado.empty:
+                resultados.append(resultado)
+        except Exception as e:
+            print(f"Erro no scraper {chave}: {e}")
+    
+    # Fontes sem resultado por causa do prazo (na fila, em andamento ou ainda no ciclo anterior)
+    atrasadas = [chave for chave, _ in fontes if chave not in futuros.values()]
+    
+    # Pedir que as fontes em andamento parem no próximo ponto de verificação e publiquem o que tiverem
+    prazo_ciclo.cancelar()
+    for futuro in pendentes:
+        chave = futuros[futuro]
+        atrasadas.append(chave)
+        if futuro.cancel():
+            print(f"Prazo do ciclo esgotado: {chave} não chegou a sair da fila neste ciclo")
+            continue
+        print(f"Prazo do ciclo esgotado: {chave} ainda não terminou - continuando com as outras fontes")
+        futuro.add_done_callback(lambda f, chave=chave: guardar_resultado_atrasado(chave, f))
+    
+    # Continuam na página com a última publicação, como as fontes fora do ciclo
+    com_resultado_atrasado = {chave for chave, _ in atrasados}
+    for chave in atrasadas:
+        if chave in com_resultado_atrasado:
+            continue
+        anterior = ultima_publicacao(chave)
+        if anterior is not None:
+            print(f"Mantendo a última publicação de {chave} na página")
+            resultados.append(anterior)
+    
+    # Os atrasados vêm por último: em títulos repetidos, vale o resultado mais novo
+    for chave, resultado in atrasados:
+        print(f"Incluindo resultado atrasado de {chave} do ciclo anterior")
+        resultados.append(resultado)
+    
+    return resultados
+
+def configurar_coleta(adaptativa=None, piso=None, teto=None):
+    """
+    Ajusta a coleta do modo automático: intervalo adaptativo por fonte e seus limites (segundos)
+    """
+    if adaptativa is not None:
+        coleta_config['adaptativa'] = adaptativa
+    if piso is not None:
+        coleta_config['piso'] = piso
+    if teto is not None:
+        coleta_config['teto'] = teto
+
+def ultima_publicacao(chave):
+    """
+    Última publicação da fonte como DataFrame (ou None): a mantida em memória pelo processo
+    ou, antes da primeira coleta, a salva no arquivo da fonte
+    """
+    if chave in publicacoes_fontes:
+        return publicacoes_fontes[chave]
+    arquivo = ESPECIFICACOES_FONTES[chave].get('arquivo_json', f"noticias_{chave}.json")
+    try:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            noticias = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not noticias:
         return None
+    return pd.DataFrame(noticias).reindex(columns=COLUNAS_NOTICIA)
+
+def registrar_coleta(chave, df, instante=None):
+    """
+    Registra no histórico da fonte quantas notícias novas a coleta trouxe
+    
+    Novas são as de links ausentes da publicação anterior. Na primeira coleta do processo não
+    há publicação anterior em memória e a coleta apenas serve de base para a seguinte.
+    """
+    if df is None:
+        return  # Coleta com falha: não diz nada sobre a taxa de publicação
+    instante = time.time() if instante is None else instante
+    links = set(df['link']) if not df.empty else set()
+    with coletas_lock:
+        anterior = links_publicados.get(chave)
+        links_publicados[chave] = (instante, links)
+        if anterior is None:
+            return
+        historico = historico_coletas.setdefault(chave, deque())
+        historico.append((instante, len(links - anterior[1]), instante - anterior[0]))
+        while historico and historico[0][0] < instante - coleta_config['janela']:
+            historico.popleft()
+
+def fator_horario(agora=None):
+    """
+    Fator do intervalo conforme o horário de Brasília: menor no pregão, maior na madrugada
+    """
+    momento = datetime.now(FUSO_BRASILIA) if agora is None else datetime.fromtimestamp(agora, FUSO_BRASILIA)
+    inicio, fim = coleta_config['pregao']
+    if momento.weekday() < 5 and inicio <= momento.hour < fim:
+        return coleta_config['fator_pregao']
+    inicio, fim = coleta_config['madrugada']
+    if inicio <= momento.hour < fim:
+        return coleta_config['fator_madrugada']
+    return 1.0
+
+def intervalo_coleta(chave, intervalo_base, agora=None):
+    """
+    Intervalo até a próxima coleta da fonte, pela taxa de notícias novas nas coletas recentes
+    
+    A taxa parte de 'novas_por_coleta' a cada intervalo_base e converge para a observada à medida
+    que o histórico cresce; o resultado é ajustado pelo horário e limitado entre o piso e o teto.
+    
+    Args:
+        chave: Fonte
+        intervalo_base: Intervalo de uma fonte ainda sem histórico (segundos)
+        agora: Instante (time.time) de referência para o horário
+    """
+    if not coleta_config['adaptativa']:
+        return intervalo_base
+    limites = dict(coleta_config, **ESPECIFICACOES_FONTES[chave].get('coleta', {}))
+    with coletas_lock:
+        historico = list(historico_coletas.get(chave, ()))
+    novas = sum(quantidade for _, quantidade, _ in historico)
+    decorrido = sum(segundos for _, _, segundos in historico)
+    alvo = limites['novas_por_coleta']
+    taxa = (novas + alvo) / (decorrido + intervalo_base)  # Notícias novas por segundo
+    intervalo = alvo / taxa * fator_horario(agora)
+    return max(limites['piso'], min(limites['teto'], intervalo))
+
+def fontes_vencidas(agora=None):
+    """
+    Fontes ativas cuja próxima coleta já venceu (as ainda não coletadas estão sempre vencidas)
+    """
+    agora = time.time() if agora is None else agora
+    with coletas_lock:
+        return [chave for chave in obter_fontes_ativas() if proximas_coletas.get(chave, 0) <= agora]
+
+def agendar_coletas(fontes, intervalo_base, agora=None):
+    """
+    Agenda a próxima coleta das fontes recém-coletadas
+    
+    Returns:
+        Segundos até a próxima coleta de qualquer fonte ativa
+    """
+    agora = time.time() if agora is None else agora
+    for chave in fontes:
+        intervalo = intervalo_coleta(chave, intervalo_base, agora)
+        with coletas_lock:
+            proximas_coletas[chave] = agora + intervalo
+    
+    with coletas_lock:
+        proximas = {chave: proximas_coletas.get(chave, agora) for chave in obter_fontes_ativas()}
+    if not proximas:
+        return intervalo_base
+    ordem = sorted(proximas.items(), key=lambda item: item[1])
+    print("Próximas coletas: " + ", ".join(f"{chave} em {max(0, instante - agora):.0f}s" for chave, instante in ordem))
+    return max(0, ordem[0][1] - agora)
+
+def backend_parser_argumento(nome):
+    """
+    Valida o valor de --parser: o backend precisa existir e estar instalado
+    
+    Args:
+        nome: Nome do backend informado na linha de comando
+    
+    Returns:
+        str: O próprio nome, se o backend puder ser usado
+    """
+    if nome in BACKENDS_PARSER and not parser_disponivel(nome):
+        raise argparse.ArgumentTypeError(f"o backend '{nome}' não está instalado (pip install {nome})")
+    return nome
+
+def adicionar_argumentos_configuracao(parser):
+    """
+    Acrescenta a um ArgumentParser as opções de configuração comuns a main.py, app.py e daemon.py
+    
+    Args:
+        parser: argparse.ArgumentParser do ponto de entrada
+    """
+    parser.add_argument('-d', '--drivers', type=int, default=None, help='Número de navegadores mantidos aquecidos no pool')
+    parser.add_argument('--sem-bloqueio', action='store_true', help='Não bloquear imagens, anúncios e rastreadores no navegador')
+    parser.add_argument('--sem-feed', action='store_true', help='Não usar os feeds RSS/Atom (extrair sempre pela página)')
+    parser.add_argument('--sem-sitemap', action='store_true', help='Não usar os sitemaps de notícias')
+    parser.add_argument('--intervalo-fixo', action='store_true', help='No modo automático, coletar todas as fontes a cada intervalo')
+    parser.add_argument('--processos', action='store_true', help='Executar cada fonte no seu próprio processo')
+    parser.add_argument('--parser', type=backend_parser_argumento, choices=['html.parser', 'lxml', 'selectolax'], default=None, help='Backend de parsing do HTML (padrão: o mais rápido instalado)')
+    parser.add_argument('--fontes', default=None, help='Fontes a extrair, separadas por vírgula (padrão: todas as registradas)')
+    parser.add_argument('--workers', type=int, default=None, help='Número de fontes extraídas ao mesmo tempo')
+    parser.add_argument('--navegadores', type=int, default=None, help='Máximo de navegadores abertos ao mesmo tempo')
+
+def aplicar_argumentos_configuracao(args):
+    """
+    Aplica as opções acrescentadas por adicionar_argumentos_configuracao
+    
+    Args:
+        args: Namespace retornado por parse_args
+    """
+    if args.drivers is not None:
+        configurar_pool_drivers(tamanho=args.drivers)
+    
+    if args.sem_bloqueio:
+        configurar_bloqueio_rede(ativo=False)
+    
+    if args.sem_feed:
+        configurar_feeds(ativo=False)
+    
+    if args.sem_sitemap:
+        configurar_sitemaps(ativo=False)
+    
+    if args.intervalo_fixo:
+        configurar_coleta(adaptativa=False)
+    
+    if args.processos:
+        configurar_modo_execucao('processos')
+    
+    if args.parser:
+        configurar_parser(args.parser)
+    
+    if args.fontes:
+        configurar_fontes(ativas=[chave.strip() for chave in args.fontes.split(',') if chave.strip()])
+    
+    if args.workers is not None:
+        configurar_agendador(workers=args.workers)
+    
+    if args.navegadores is not None:
+        configurar_pool_drivers(max_ativos=args.navegadores)
+
+def imprimir_resumo_latencias():
+    """
+    Exibe a latência real das esperas por condição registradas até agora
+    """
+    resumo = resumo_latencias()
+    if not resumo:
+        return
+    print("Latência das esperas (média / máximo / expiradas):")
+    for nome, dados in sorted(resumo.items()):
+        print(f"  {nome}: {dados['media']:.2f}s / {dados['maximo']:.2f}s / {dados['expiradas']} de {dados['quantidade']}")
 
 def limpar_pool_drivers():
     """
     Limpa o pool de drivers fechando todos
+    
+    O pool é mantido aquecido entre ciclos; esta função é chamada ao encerrar o processo.
+    Sem nenhum navegador aberto (ex: --help), não faz nada com o pool nem imprime.
     """
     with driver_lock:
-        while driver_pool:
-            driver = driver_pool.pop()
-            try:
-                driver.quit()
-            except:
-                pass
-        print("Pool de drivers limpo.")
+        # Drivers no pool e os ainda presos a fontes que estouraram o prazo
+        drivers = set(driver_pool) | set(driver_usos)
+        driver_pool.clear()
+        for driver in drivers:
+            encerrar_driver(driver)
+        if drivers:
+            print(f"Pool de drivers limpo ({len(drivers)} navegador(es) fechado(s)).")
+    
+    fechar_sessao_http()
+    fechar_registro_vistos()
+
+# Fechar os navegadores do pool quando o processo terminar
+atexit.register(limpar_pool_drivers)
+atexit.register(encerrar_processos_fontes)
 
 def gerar_html_completo(df):
     """
@@ -2118,29 +4924,106 @@ def gerar_html_completo(df):
             pass
         return False
 
-def carregar_pagina_com_retry(driver, url, max_tentativas=3, timeout=25):
+def carregar_pagina_com_retry(driver, url, max_tentativas=3, timeout=25, seletor=None, espera_seletor=None,
+                              estrategia='normal', parar_carregamento=False, fonte=None, prazo=None):
     """
     Tenta carregar uma página com múltiplas tentativas em caso de timeout
+    
+    Antes do readyState e do seletor, aguarda o documento anterior ser substituído.
+    Entre as tentativas aguarda um atraso exponencial com jitter. Com uma fonte informada,
+    respeita o disjuntor dela: falha imediatamente com o circuito aberto, faz uma única
+    tentativa (sonda) no estado meio-aberto e para de tentar assim que o circuito abre.
+    
+    Args:
+        driver: Driver do Selenium (criado com page_load_strategy 'none')
+        url: URL a carregar
+        max_tentativas: Número máximo de tentativas
+        timeout: Tempo máximo de carregamento do documento em cada tentativa
+        seletor: Localizador (By, valor) que define a página como pronta
+        espera_seletor: Tempo máximo de espera pelo seletor (padrão: timeout)
+        estrategia: 'normal' (aguarda todos os subrecursos), 'eager' (DOMContentLoaded)
+                    ou 'none' (apenas o seletor)
+        parar_carregamento: Se True, interrompe o carregamento (window.stop) assim que o seletor aparece
+        fonte: Chave do disjuntor da fonte (None = sem disjuntor)
+        prazo: Prazo da fonte; os timeouts são limitados ao tempo restante
+    
+    Returns:
+        True se a página ficou pronta, False caso contrário
     """
+    estados_prontos = {'normal': ('complete',), 'eager': ('interactive', 'complete')}.get(estrategia)
+    disjuntor = obter_disjuntor(fonte) if fonte else None
+    
+    if disjuntor:
+        if disjuntor.aberto():
+            print(f"Circuito de {fonte} aberto. Ignorando {url}")
+            return False
+        if disjuntor.em_sonda():
+            max_tentativas = 1
+    
+    timeout_base = timeout
     for tentativa in range(max_tentativas):
+        if prazo is not None:
+            if prazo.expirado():
+                print(f"Prazo esgotado antes de carregar {url}")
+                return False
+            timeout = prazo.limitar(timeout_base)
         try:
             print(f"Carregando página (tentativa {tentativa + 1}/{max_tentativas}): {url}")
             
-            # Configurar timeout específico para esta tentativa
+            # Com page_load_strategy 'none' o get retorna antes da troca de documento: sem esperar a
+            # raiz atual sair da página, readyState e seletor responderiam pela página anterior
+            try:
+                documento_anterior = driver.find_element(By.TAG_NAME, 'html')
+            except Exception:
+                documento_anterior = None
+            
             driver.set_page_load_timeout(timeout)
             driver.get(url)
             
-            # Aguardar um pouco para garantir carregamento
-            time.sleep(1)
+            if documento_anterior is not None and not aguardar_condicao(
+                driver, EC.staleness_of(documento_anterior), timeout=timeout, nome="troca_documento"
+            ):
+                raise TimeoutException(f"a página anterior continuou carregada após {timeout}s")
+            
+            if estados_prontos and not aguardar_condicao(
+                driver,
+                lambda d: d.execute_script("return document.readyState;") in estados_prontos,
+                timeout=timeout,
+                nome=f"carregamento_{estrategia}"
+            ):
+                raise TimeoutException(f"documento não ficou pronto ({estrategia}) em {timeout}s")
+            
+            if seletor:
+                espera = espera_seletor if espera_seletor is not None else timeout
+                if prazo is not None:
+                    espera = prazo.limitar(espera)
+                if not aguardar_condicao(driver, EC.presence_of_element_located(seletor),
+                                         timeout=espera, nome=f"seletor_{estrategia}"):
+                    raise TimeoutException(f"seletor {seletor[1]} não apareceu em {espera}s")
+                if parar_carregamento:
+                    # O feed já está na tela: descartar scripts e recursos ainda pendentes
+                    driver.execute_script("window.stop();")
+            
+            if disjuntor:
+                disjuntor.registrar_sucesso()
             return True
         except Exception as e:
             print(f"Erro na tentativa {tentativa + 1}: {e}")
+            if prazo is not None and prazo.expirado():
+                # Falta de tempo do ciclo não indica que a fonte está fora do ar
+                print(f"Prazo esgotado ao carregar {url}")
+                return False
+            if disjuntor:
+                disjuntor.registrar_falha()
+                if disjuntor.aberto():
+                    print(f"Desistindo de {url}: circuito de {fonte} aberto")
+                    return False
             if tentativa < max_tentativas - 1:
-                # Aumentar timeout progressivamente
-                timeout_progressivo = timeout + (tentativa * 10)
-                print(f"Tentando novamente em 3 segundos com timeout de {timeout_progressivo}s...")
-                time.sleep(3)
-                driver.set_page_load_timeout(timeout_progressivo)
+                atraso = atraso_com_jitter(tentativa)
+                if prazo is not None:
+                    atraso = min(atraso, prazo.restante())
+                print(f"Tentando novamente em {atraso:.1f} segundos...")
+                time.sleep(atraso)
             else:
                 print(f"Falha ao carregar {url} após {max_tentativas} tentativas")
                 return False